@@ -0,0 +1,55 @@
+# Standar import
+import argparse
+import sys
+
+# Local import
+from benchmarks.generators import GENERATORS
+from benchmarks.harness import (
+    REPEAT,
+    SIZES,
+    TOLERANCE,
+    compare,
+    load,
+    run,
+    save,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='time and trace the relations functions on synthetic '
+        'graphs and compare them with a JSON baseline')
+    parser.add_argument('--scale', choices=list(SIZES), default='small')
+    parser.add_argument('--generator',
+                        action='append',
+                        choices=list(GENERATORS),
+                        help='repeat to run several, all by default')
+    parser.add_argument('--function',
+                        action='append',
+                        help='e.g. check.is_transitive, all by default')
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    parser.add_argument('--baseline', help='JSON file to compare with')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE)
+    parser.add_argument('--save', help='JSON file to write the results to')
+    arguments = parser.parse_args()
+
+    results = run(SIZES[arguments.scale], arguments.generator,
+                  arguments.function, arguments.repeat)
+    for key, result in sorted(results.items()):
+        print(f'{key:<60} {result["seconds"] * 1000:>10.3f} ms '
+              f'{result["peak_bytes"] / 1024:>10.1f} KiB')
+    if arguments.save:
+        save(results, arguments.save)
+    if not arguments.baseline:
+        return 0
+
+    regressions = compare(results, load(arguments.baseline),
+                          arguments.tolerance)
+    for key, (_, reference, value) in sorted(regressions.items()):
+        print(f'REGRESSION {key}: {reference:.6g} -> {value:.6g}')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
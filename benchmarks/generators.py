@@ -0,0 +1,110 @@
+# Standar import
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    Set,
+    Tuple,
+)
+import random
+
+# Third import
+from networkx import DiGraph
+
+# Local import
+from discret_maths.relations import (
+    draw_divisibility,
+    draw_graph,
+    draw_relation,
+)
+from discret_maths.utils import (
+    factorize,
+    get_dividers,
+)
+
+Pair = Tuple[Any, Any]
+
+
+def _build(domain: Set[Any], relations: Set[Pair]) -> DiGraph:
+    graph = DiGraph()
+    draw_graph(graph, domain)
+    draw_relation(graph, relations)
+    return graph
+
+
+def _reflexive(domain: Set[Any]) -> Iterator[Pair]:
+    return ((node, node) for node in domain)
+
+
+def chain(size: int) -> DiGraph:
+    domain = set(range(size))
+    return _build(
+        domain,
+        set((node_x, node_y) for node_x in domain for node_y in domain
+            if node_x <= node_y))
+
+
+def antichain(size: int) -> DiGraph:
+    domain = set(range(size))
+    return _build(domain, set(_reflexive(domain)))
+
+
+def boolean_lattice(size: int) -> DiGraph:
+    # the subsets of a set of log2(size) elements as bit masks
+    rank = max(size - 1, 1).bit_length()
+    domain = set(range(1 << rank))
+    return _build(
+        domain,
+        set((node_x, node_y) for node_x in domain for node_y in domain
+            if node_x & node_y == node_x))
+
+
+def divisor_lattice(size: int) -> DiGraph:
+    # the divisors of the first highly composite number with about size
+    # divisors
+    number = 1
+    for candidate in (2, 6, 12, 24, 36, 60, 120, 180, 240, 360, 720, 840,
+                      1260, 1680, 2520, 5040, 10080, 15120, 20160, 25200,
+                      27720, 45360, 50400, 55440, 83160, 110880):
+        number = candidate
+        if len(get_dividers(factorize(number))) >= size:
+            break
+    graph = DiGraph()
+    draw_divisibility(graph, number)
+    return graph
+
+
+def random_poset(size: int, density: float = 0.1, seed: int = 0) -> DiGraph:
+    # a random dag over a fixed order closed under transitivity
+    generator = random.Random(seed)
+    domain = list(range(size))
+    above: Dict[int, Set[int]] = {node: {node} for node in domain}
+    for node_x in reversed(domain):
+        for node_y in range(node_x + 1, size):
+            if generator.random() < density:
+                above[node_x] |= above[node_y]
+    return _build(
+        set(domain),
+        set((node_x, node_y) for node_x, nodes in above.items()
+            for node_y in nodes))
+
+
+def random_equivalence(size: int, classes: int = 0, seed: int = 0) -> DiGraph:
+    generator = random.Random(seed)
+    classes = classes or max(size // 8, 1)
+    labels = {node: generator.randrange(classes) for node in range(size)}
+    return _build(
+        set(labels),
+        set((node_x, node_y) for node_x, label_x in labels.items()
+            for node_y, label_y in labels.items() if label_x == label_y))
+
+
+GENERATORS: Dict[str, Callable[[int], DiGraph]] = {
+    'chain': chain,
+    'antichain': antichain,
+    'boolean_lattice': boolean_lattice,
+    'divisor_lattice': divisor_lattice,
+    'random_poset': random_poset,
+    'random_equivalence': random_equivalence,
+}
@@ -0,0 +1,163 @@
+# Standar import
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+import inspect
+import io
+import json
+import logging
+import time
+import tracemalloc
+
+# Third import
+from networkx import DiGraph
+
+# Local import
+from benchmarks.generators import GENERATORS
+from discret_maths.relations import (
+    check,
+    extract,
+    generate_report,
+)
+from discret_maths.relations.cache import clear_cache
+from discret_maths.relations.transform import to_hasse
+
+# Constants
+SIZES: Dict[str, Tuple[int, ...]] = {
+    'small': (8, 32),
+    'medium': (8, 32, 128),
+    'large': (32, 128, 512),
+}
+REPEAT: int = 3
+TOLERANCE: float = 0.25
+# below this many seconds the noise of the clock is larger than the change
+FLOOR: float = 0.001
+
+Result = Dict[str, float]
+
+
+def _iter_functions() -> Iterator[Tuple[str, Callable[..., Any]]]:
+    for module, prefix in ((check, 'is_'), (extract, 'get_')):
+        label = module.__name__.rsplit('.', 1)[-1]
+        for name, function in inspect.getmembers(module, inspect.isfunction):
+            if name.startswith(prefix) and function.__module__ == (
+                    module.__name__):
+                yield (f'{label}.{name}', function)
+    yield ('transform.to_hasse', to_hasse)
+    yield ('generate_report',
+           lambda graph: generate_report(graph, io.StringIO()))
+
+
+def _get_arguments(
+    function: Callable[..., Any],
+    graph: DiGraph,
+) -> Optional[List[Any]]:
+    # the nodes a function asks for are taken from the ends of the graph
+    nodes = list(graph.nodes)
+    values = {
+        'graph': graph,
+        'node': nodes[0],
+        'node_x': nodes[0],
+        'node_y': nodes[-1],
+    }
+    arguments = []
+    for name, parameter in inspect.signature(function).parameters.items():
+        if parameter.default is not inspect.Parameter.empty:
+            continue
+        if name not in values:
+            return None
+        arguments.append(values[name])
+    return arguments
+
+
+def measure(
+    function: Callable[..., Any],
+    arguments: List[Any],
+    repeat: int = REPEAT,
+) -> Result:
+    # the cache is cleared before every run, the best time is kept and the
+    # peak memory comes from a separate traced run
+    seconds = float('inf')
+    for _ in range(repeat):
+        clear_cache()
+        start = time.perf_counter()
+        result = function(*arguments)
+        if isinstance(result, Iterator):
+            deque(result, maxlen=0)
+        seconds = min(seconds, time.perf_counter() - start)
+
+    clear_cache()
+    tracemalloc.start()
+    try:
+        result = function(*arguments)
+        if isinstance(result, Iterator):
+            deque(result, maxlen=0)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'seconds': seconds, 'peak_bytes': float(peak)}
+
+
+def run(
+    sizes: Tuple[int, ...] = SIZES['small'],
+    generators: Optional[List[str]] = None,
+    functions: Optional[List[str]] = None,
+    repeat: int = REPEAT,
+) -> Dict[str, Result]:
+    results: Dict[str, Result] = {}
+    logging.disable(logging.CRITICAL)
+    try:
+        for generator_name in generators or list(GENERATORS):
+            for size in sizes:
+                graph = GENERATORS[generator_name](size)
+                for name, function in _iter_functions():
+                    if functions and name not in functions:
+                        continue
+                    arguments = _get_arguments(function, graph)
+                    if arguments is None:
+                        continue
+                    key = f'{name}[{generator_name}-{size}]'
+                    results[key] = measure(function, arguments, repeat)
+    finally:
+        logging.disable(logging.NOTSET)
+    return results
+
+
+def compare(
+    results: Dict[str, Result],
+    baseline: Dict[str, Result],
+    tolerance: float = TOLERANCE,
+) -> Dict[str, Tuple[str, float, float]]:
+    # the measures that grew more than the tolerance over the baseline
+    regressions = {}
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        for measure_name, value in result.items():
+            reference = baseline[key].get(measure_name)
+            if reference is None:
+                continue
+            if measure_name == 'seconds' and max(value, reference) < FLOOR:
+                continue
+            if value > reference * (1 + tolerance):
+                regressions[f'{key}.{measure_name}'] = (measure_name,
+                                                        reference, value)
+    return regressions
+
+
+def load(path: str) -> Dict[str, Result]:
+    with open(path) as streamer:
+        return json.load(streamer)
+
+
+def save(results: Dict[str, Result], path: str) -> None:
+    with open(path, 'w') as streamer:
+        json.dump(results, streamer, indent=2, sort_keys=True)
+        streamer.write('\n')
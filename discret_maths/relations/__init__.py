@@ -2,56 +2,42 @@
 from typing import (
     Any,
     Callable,
+    Iterable,
     Iterator,
     Optional,
     Set,
     Tuple,
+    Union,
 )
 
 # Third imports
-import oyaml as yaml
 from networkx import DiGraph
 
 # Local import
-from discret_maths.utils import get_set_combination
-from discret_maths.relations.transform import to_hasse
-from discret_maths.relations.extract import (
-    get_all_ci,
-    get_all_cs,
-    get_all_mci,
-    get_all_mcs,
-    get_bounded,
-    get_complements,
-    get_inverse,
-    get_mci,
-    get_mcs,
-    get_not_symmetric,
-    get_not_transitive,
-    get_reflexive,
-    get_relations,
-    get_symmetric,
-    get_transitive,
+from discret_maths.utils import (
+    factorize,
+    factorize_by,
+    get_dividers,
+    iter_set_combination,
 )
-from discret_maths.relations.check import (
-    is_anti_reflexive,
-    is_anti_symmetric,
-    is_bounded,
-    is_booblean_algebra,
-    is_complemented,
-    is_distributed,
-    is_equivalent,
-    is_not_reflexive,
-    is_not_symmetric,
-    is_not_transitive,
-    is_partial_order,
-    is_reflexive,
-    is_strict_order,
-    is_symmetric,
-    is_total_order,
-    is_transitive,
+from discret_maths.utils.logger import aggregated_logs
+from discret_maths.relations.compact import CompactRelation
+from discret_maths.relations.lattice import (
+    ALGEBRA,
+    DIVISIBILITY,
+    NUMBER,
+    Lattice,
+    get_lattice,
+)
+from discret_maths.relations.report import (
+    YAML,
+    Output,
+    iter_report,
+    write_report,
 )
 
 STRICT: bool = True
+COLOR: str = 'blue'
 
 
 def draw_graph(
@@ -65,17 +51,52 @@ def draw_graph(
 
 def draw_relation(
     graph: DiGraph,
-    relations: Set[Tuple[Any, Any]],
+    relations: Iterable[Tuple[Any, Any]],
     inverse: bool = False,
+    color: Optional[str] = COLOR,
 ) -> None:
-    for node_x, node_y in relations:
-        if inverse:
-            graph.add_edge(node_y, node_x, color='blue')
+    # one add_edges_from for the whole relation, color=None leaves the edges
+    # without attributes; relations that are not a DiGraph, as
+    # IncrementalRelation, keep no attributes and are given none
+    attributes = {}
+    if color is not None and isinstance(graph, DiGraph):
+        attributes['color'] = color
+    if inverse:
+        relations = ((node_y, node_x) for node_x, node_y in relations)
+    graph.add_edges_from(relations, **attributes)
+
+
+def draw_divisibility(
+    graph: DiGraph,
+    number: int,
+    hasse: bool = False,
+) -> None:
+    # the dividers of number form the lattice of the exponent vectors of its
+    # prime factorization, d relates to d * m for every divider m of number / d
+    if number < 1:
+        raise ValueError(f'only positive numbers have dividers: {number}')
+    factors = factorize(number)
+    dividers = get_dividers(factors)
+    if not graph:
+        graph.graph.update({ALGEBRA: DIVISIBILITY, NUMBER: number})
+    draw_graph(graph, set(dividers))
+    for divider in dividers:
+        # only the primes of number can divide number / divider
+        rest = factorize_by(number // divider, factors)
+        if hasse:
+            graph.add_edges_from(
+                ((divider, divider * prime) for prime in rest),
+                color=COLOR,
+            )
             continue
-        graph.add_edge(node_x, node_y, color='blue')
+        graph.add_edges_from(
+            ((divider, divider * multiple)
+             for multiple in get_dividers(rest)),
+            color=COLOR,
+        )
 
 
-def relations_to_str(relations: Tuple[Tuple[Any, Any], ...]) -> str:
+def relations_to_str(relations: Iterable[Tuple[Any, Any]]) -> str:
     result = str()
     for node_x, node_y in relations:
         result += f'({node_x}, {node_y}), '
@@ -87,7 +108,7 @@ def generate_relations(
     condition: Callable[[int, int], bool],
     inverse: bool = False,
 ) -> Iterator[Tuple[int, int]]:
-    for node_x, node_y in get_set_combination(nodes):
+    for node_x, node_y in iter_set_combination(nodes):
         if condition(node_x, node_y):
             if inverse:
                 yield (node_y, node_x)
@@ -95,88 +116,20 @@ def generate_relations(
             yield (node_x, node_y)
 
 
-def is_lattice(graph: DiGraph) -> bool:
-    nodes = graph.nodes
-
-    return all(
-        get_mcs(graph, x, y) and get_mci(graph, x, y)
-        for x, y in get_set_combination(nodes) if x != y)
-
-
-def generate_report(graph: DiGraph) -> None:
-    hasse_graph = to_hasse(graph)
-    lattice = is_lattice(hasse_graph)
-
-    report = {
-        'relations_type': {
-            'reflexive': is_reflexive(graph),
-            'anti_reflexive': is_anti_reflexive(graph),
-            'not_reflexive': is_not_reflexive(graph),
-            'symmetric': is_symmetric(graph),
-            'anti_symmetric': is_anti_symmetric(graph),
-            'not_symmetric': is_not_symmetric(graph),
-            'transitive': is_transitive(graph),
-            'not_transitive': is_not_transitive(graph),
-            'equivalent': is_equivalent(graph),
-            'strict_order': is_strict_order(graph),
-            'partial_order': is_partial_order(graph),
-            'total_order': is_total_order(graph),
-        },
-        'relented_nodes': {
-            'relations':
-            list(f'({x}, {y})' for x, y in get_relations(graph)),
-            'inverse':
-            list(f'({x}, {y})' for x, y in get_inverse(graph)),
-            'reflexive': [f'({x}, {y})' for x, y in get_reflexive(graph)],
-            'symmetry': [
-                f'({a[0]}, {a[1]}), ({b[0]}, {b[1]})'
-                for a, b in get_symmetric(graph)
-            ],
-            'not_symmetric': [
-                f'({a[0]}, {a[1]}), ({b[0]}, {b[1]})'
-                for a, b in get_not_symmetric(graph)
-            ],
-            'transitive': [
-                f'({x[0]}, {x[1]}), ({y[0]}, {y[1]}), ({z[0]}, {z[1]})'
-                for x, y, z in get_transitive(graph)
-            ],
-            'not_transitive': [
-                f'({x[0]}, {x[1]}), ({y[0]}, {y[1]}), ({z[0]}, {z[1]})'
-                for x, y, z in get_not_transitive(graph)
-            ],
-        },
-        'is_lattice':
-        lattice,
-        'lattice_is_bounded':
-        is_bounded(hasse_graph),
-        'maximum':
-        get_bounded(hasse_graph)[1],
-        'minimum':
-        get_bounded(hasse_graph)[0],
-        'lattice_is_complemented':
-        is_complemented(hasse_graph),
-        'complements':
-        get_complements(hasse_graph),
-        'is_boolean_algebra':
-        is_booblean_algebra(hasse_graph),
-        'is_distributed': is_distributed(hasse_graph),
-        'lower_bounds':
-        list(
-            set(f'{nodes}, {bounds}'
-                for nodes, bounds in get_all_ci(hasse_graph))),
-        'upper_bounds':
-        list(
-            set(f'{nodes}, {bounds}'
-                for nodes, bounds in get_all_cs(hasse_graph))),
-        'maximun_lower_bounds':
-        list(
-            set(f'{nodes}, {bounds}'
-                for nodes, bounds in get_all_mci(hasse_graph))),
-        'minimum_upper_bounds':
-        list(
-            set(f'{nodes}, {bounds}'
-                for nodes, bounds in get_all_mcs(hasse_graph))),
-    }
-
-    with open('report.yaml', 'w') as streamer:
-        yaml.dump(report, streamer)
+def is_lattice(
+    graph: DiGraph,
+    tables: Optional[Lattice] = None,
+) -> bool:
+    tables = get_lattice(graph, tables)
+    return tables.is_lattice()
+
+
+def generate_report(
+    graph: Union[DiGraph, CompactRelation],
+    output: Output = 'report.yaml',
+    fmt: str = YAML,
+    workers: Optional[int] = 1,
+) -> None:
+    # one summary per kind of missing bound instead of a record per pair
+    with aggregated_logs():
+        write_report(iter_report(graph, workers), output, fmt)
@@ -0,0 +1,183 @@
+# Standar import
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    Union,
+)
+
+# Third import
+from networkx import DiGraph
+
+# Local import
+from discret_maths.relations.bitset import (
+    BitRelation,
+    iter_bits,
+)
+
+Relation = Union[DiGraph, BitRelation]
+
+
+def to_bits(relation: Relation) -> BitRelation:
+    if isinstance(relation, BitRelation):
+        return relation
+    return BitRelation.from_graph(relation)
+
+
+def to_graph(relation: Relation) -> DiGraph:
+    if isinstance(relation, BitRelation):
+        return relation.to_graph()
+    return relation
+
+
+def _remap(relation: BitRelation, index: Dict[Any, int]) -> List[int]:
+    positions = [index[node] for node in relation.nodes]
+    rows = [0] * len(index)
+    for position, row in enumerate(relation.rows):
+        remapped = 0
+        for target in iter_bits(row):
+            remapped |= 1 << positions[target]
+        rows[positions[position]] = remapped
+    return rows
+
+
+def _align(
+    relation_x: Relation,
+    relation_y: Relation,
+) -> Tuple[List[Any], List[int], List[int]]:
+    # both relations as rows over the same nodes, the nodes of the first one
+    # keep their positions so it is only copied
+    bits_x = to_bits(relation_x)
+    bits_y = to_bits(relation_y)
+    if bits_x.nodes == bits_y.nodes:
+        return list(bits_x.nodes), list(bits_x.rows), list(bits_y.rows)
+    nodes = list(bits_x.nodes)
+    index = dict(bits_x.index)
+    for node in bits_y.nodes:
+        if node not in index:
+            index[node] = len(nodes)
+            nodes.append(node)
+    rows_x = list(bits_x.rows) + [0] * (len(nodes) - len(bits_x.nodes))
+    return nodes, rows_x, _remap(bits_y, index)
+
+
+def inverse(relation: Relation) -> BitRelation:
+    bits = to_bits(relation)
+    return BitRelation(bits.nodes, list(bits.columns))
+
+
+def union(relation_x: Relation, relation_y: Relation) -> BitRelation:
+    nodes, rows_x, rows_y = _align(relation_x, relation_y)
+    return BitRelation(nodes, [row_x | row_y
+                               for row_x, row_y in zip(rows_x, rows_y)])
+
+
+def intersection(relation_x: Relation, relation_y: Relation) -> BitRelation:
+    nodes, rows_x, rows_y = _align(relation_x, relation_y)
+    return BitRelation(nodes, [row_x & row_y
+                               for row_x, row_y in zip(rows_x, rows_y)])
+
+
+def compose(relation_x: Relation, relation_y: Relation) -> BitRelation:
+    # x relates to z when x relates to some y in the first relation and y
+    # relates to z in the second one
+    nodes, rows_x, rows_y = _align(relation_x, relation_y)
+    rows = []
+    for row in rows_x:
+        composed = 0
+        for middle in iter_bits(row):
+            composed |= rows_y[middle]
+        rows.append(composed)
+    return BitRelation(nodes, rows)
+
+
+def reflexive_closure(relation: Relation) -> BitRelation:
+    bits = to_bits(relation)
+    return BitRelation(
+        bits.nodes,
+        [row | 1 << position for position, row in enumerate(bits.rows)])
+
+
+def symmetric_closure(relation: Relation) -> BitRelation:
+    bits = to_bits(relation)
+    return BitRelation(
+        bits.nodes,
+        [row | column for row, column in zip(bits.rows, bits.columns)])
+
+
+def iter_components(
+    size: int,
+    successors: Callable[[int], Iterable[int]],
+) -> Iterator[List[int]]:
+    # iterative tarjan over the ids 0..size-1, components come out in reverse
+    # topological order so every successor outside a component is closed
+    # before the component itself
+    order = [-1] * size
+    low = [0] * size
+    stacked = [False] * size
+    stack: List[int] = []
+    counter = 0
+    for root in range(size):
+        if order[root] != -1:
+            continue
+        calls = [(root, iter(successors(root)))]
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        stacked[root] = True
+        while calls:
+            node, pending = calls[-1]
+            for successor in pending:
+                if order[successor] == -1:
+                    order[successor] = low[successor] = counter
+                    counter += 1
+                    stack.append(successor)
+                    stacked[successor] = True
+                    calls.append((successor, iter(successors(successor))))
+                    break
+                if stacked[successor]:
+                    low[node] = min(low[node], order[successor])
+            else:
+                calls.pop()
+                if calls:
+                    parent = calls[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == order[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        stacked[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    yield component
+
+
+def transitive_closure(relation: Relation) -> BitRelation:
+    # instead of warshall the rows are closed one strongly connected
+    # component at a time, that is one bitset union per edge of the relation
+    bits = to_bits(relation)
+    rows = bits.rows
+    closure = [0] * len(rows)
+    for component in iter_components(
+            len(rows), lambda position: iter_bits(rows[position])):
+        inside = 0
+        for member in component:
+            inside |= 1 << member
+        reach = 0
+        for member in component:
+            for successor in iter_bits(rows[member] & ~inside):
+                reach |= closure[successor] | 1 << successor
+        if len(component) > 1 or rows[component[0]] >> component[0] & 1:
+            reach |= inside
+        for member in component:
+            closure[member] = reach
+    return BitRelation(bits.nodes, closure)
+
+
+def reflexive_transitive_closure(relation: Relation) -> BitRelation:
+    return reflexive_closure(transitive_closure(relation))
@@ -0,0 +1,145 @@
+# Standar import
+from array import array
+from typing import (
+    Any,
+    List,
+    Sequence,
+    Tuple,
+    Union,
+)
+from os import PathLike
+import mmap
+import struct
+import sys
+
+# Third import
+from networkx import DiGraph
+
+# Local import
+from discret_maths.relations.compact import (
+    CompactRelation,
+    Rows,
+)
+
+# Constants
+MAGIC: bytes = b'DMREL\0\0\0'
+VERSION: int = 1
+INTEGERS: int = 0
+STRINGS: int = 1
+ALIGNMENT: int = 8
+
+# magic, version, kind of node table, nodes, edges; every number of the file
+# is little endian and every section starts on a multiple of ALIGNMENT
+HEADER: struct.Struct = struct.Struct('<8sHHIQQ')
+
+Path = Union[str, PathLike]
+
+
+def _pad(size: int) -> int:
+    return -size % ALIGNMENT
+
+
+def _to_little(values: array) -> bytes:
+    if sys.byteorder == 'little':
+        return values.tobytes()
+    values = array(values.typecode, values)
+    values.byteswap()
+    return values.tobytes()
+
+
+def get_node_table(nodes: Sequence[Any]) -> Tuple[int, List[bytes]]:
+    # int nodes go as an int64 array, str nodes as int64 offsets followed by
+    # their utf-8 bytes; nothing that needs unpickling is ever read back
+    # pylint:disable=unidiomatic-typecheck
+    if all(type(node) is int for node in nodes):
+        return INTEGERS, [_to_little(array('q', nodes))]
+    if all(isinstance(node, str) for node in nodes):
+        encoded = [node.encode() for node in nodes]
+        offsets = array('q', [0])
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data))
+        return STRINGS, [_to_little(offsets)] + encoded
+    raise ValueError('only int or str nodes can be written')
+
+
+def write_binary(
+    relation: Union[DiGraph, CompactRelation],
+    path: Path,
+) -> None:
+    if isinstance(relation, DiGraph):
+        relation = CompactRelation.from_graph(relation)
+    kind, table = get_node_table(relation.nodes)
+    with open(path, 'wb') as streamer:
+        streamer.write(
+            HEADER.pack(MAGIC, VERSION, kind, 0, len(relation.nodes),
+                        relation.number_of_edges()))
+        written = HEADER.size
+        for section in table:
+            streamer.write(section)
+            written += len(section)
+        streamer.write(b'\0' * _pad(written))
+        offsets = relation.offsets
+        targets = relation.targets
+        if isinstance(offsets, memoryview):
+            offsets = array('i', offsets)
+            targets = array('i', targets)
+        data = _to_little(offsets)
+        streamer.write(data)
+        streamer.write(b'\0' * _pad(len(data)))
+        streamer.write(_to_little(targets))
+
+
+def _read_ints(view: memoryview, typecode: str) -> Rows:
+    # zero copy on little endian machines, a swapped copy elsewhere
+    if sys.byteorder == 'little':
+        return view.cast(typecode)
+    values = array(typecode, view.tobytes())
+    values.byteswap()
+    return values
+
+
+def read_node_table(
+    view: memoryview,
+    cursor: int,
+    kind: int,
+    size: int,
+) -> Tuple[Tuple[Any, ...], int]:
+    # the nodes of the table at cursor and the position right after it
+    if kind == INTEGERS:
+        nodes = tuple(_read_ints(view[cursor:cursor + 8 * size], 'q'))
+        return nodes, cursor + 8 * size
+    if kind == STRINGS:
+        positions = _read_ints(view[cursor:cursor + 8 * (size + 1)], 'q')
+        cursor += 8 * (size + 1)
+        data = view[cursor:cursor + positions[size]]
+        nodes = tuple(
+            str(data[positions[node]:positions[node + 1]], 'utf-8')
+            for node in range(size))
+        return nodes, cursor + positions[size]
+    raise ValueError(f'unknown node table: {kind}')
+
+
+def read_binary(path: Path) -> CompactRelation:
+    # the adjacency stays in the mapped file, only the node table becomes
+    # python objects
+    with open(path, 'rb') as streamer:
+        view = memoryview(
+            mmap.mmap(streamer.fileno(), 0, access=mmap.ACCESS_READ))
+    if len(view) < HEADER.size:
+        raise ValueError('not a relation file')
+    magic, version, kind, _, size, edges = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError('not a relation file')
+    if version != VERSION:
+        raise ValueError(f'unsupported relation file version: {version}')
+
+    nodes, cursor = read_node_table(view, HEADER.size, kind, size)
+    cursor += _pad(cursor)
+
+    offsets = _read_ints(view[cursor:cursor + 4 * (size + 1)], 'i')
+    cursor += 4 * (size + 1)
+    cursor += _pad(cursor)
+    if len(view) < cursor + 4 * edges:
+        raise ValueError('truncated relation file')
+    targets = _read_ints(view[cursor:cursor + 4 * edges], 'i')
+    return CompactRelation(nodes, offsets, targets)
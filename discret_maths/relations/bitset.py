@@ -0,0 +1,145 @@
+# Standar import
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+# Third import
+from networkx import DiGraph
+
+
+def iter_bits(row: int) -> Iterator[int]:
+    while row:
+        lowest = row & -row
+        yield lowest.bit_length() - 1
+        row ^= lowest
+
+
+class BitRelation:
+    # each row is a python int used as a bitset, bit j of rows[i] is set when
+    # nodes[i] is related to nodes[j]
+    __slots__ = ('nodes', 'index', 'rows', '_columns')
+
+    def __init__(self, nodes: Sequence[Any], rows: List[int]) -> None:
+        self.nodes: Tuple[Any, ...] = tuple(nodes)
+        self.index: Dict[Any, int] = {
+            node: position
+            for position, node in enumerate(self.nodes)
+        }
+        self.rows: List[int] = rows
+        self._columns: List[int] = []
+
+    @classmethod
+    def from_pairs(
+        cls,
+        domain: Iterable[Any],
+        relations: Iterable[Tuple[Any, Any]],
+    ) -> 'BitRelation':
+        nodes = list(domain)
+        index = {node: position for position, node in enumerate(nodes)}
+        rows = [0] * len(nodes)
+        for node_x, node_y in relations:
+            for node in (node_x, node_y):
+                if node not in index:
+                    index[node] = len(nodes)
+                    nodes.append(node)
+                    rows.append(0)
+            rows[index[node_x]] |= 1 << index[node_y]
+        return cls(nodes, rows)
+
+    @classmethod
+    def from_graph(cls, graph: DiGraph) -> 'BitRelation':
+        return cls.from_pairs(graph.nodes, graph.edges)
+
+    def to_graph(self) -> DiGraph:
+        graph = DiGraph()
+        for node in self.nodes:
+            graph.add_node(node, label=node)
+        graph.add_edges_from(self.edges, color='blue')
+        return graph
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def edges(self) -> Iterator[Tuple[Any, Any]]:
+        for position, row in enumerate(self.rows):
+            for target in iter_bits(row):
+                yield (self.nodes[position], self.nodes[target])
+
+    @property
+    def columns(self) -> List[int]:
+        if not self._columns:
+            columns = [0] * len(self.rows)
+            for position, row in enumerate(self.rows):
+                for target in iter_bits(row):
+                    columns[target] |= 1 << position
+            self._columns = columns
+        return self._columns
+
+    def has_edge(self, node_x: Any, node_y: Any) -> bool:
+        return bool(self.rows[self.index[node_x]] >> self.index[node_y] & 1)
+
+    def get_loops(self) -> Set[Any]:
+        return set(self.nodes[position]
+                   for position, row in enumerate(self.rows)
+                   if row >> position & 1)
+
+    def is_reflexive(self) -> bool:
+        return all(row >> position & 1
+                   for position, row in enumerate(self.rows))
+
+    def is_anti_reflexive(self) -> bool:
+        return not any(row >> position & 1
+                       for position, row in enumerate(self.rows))
+
+    def is_not_reflexive(self) -> bool:
+        return not self.is_reflexive() and not self.is_anti_reflexive()
+
+    def is_symmetric(self) -> bool:
+        return self.rows == self.columns
+
+    def _has_symmetric_pair(self) -> bool:
+        return any(row & column & ~(1 << position)
+                   for position, (row, column) in enumerate(
+                       zip(self.rows, self.columns)))
+
+    def is_anti_symmetric(self) -> bool:
+        return not self._has_symmetric_pair()
+
+    def is_not_symmetric(self) -> bool:
+        return not self.is_symmetric() and self._has_symmetric_pair()
+
+    def is_transitive(self) -> bool:
+        # M o M must be contained in M, steps through loops are ignored
+        rows = self.rows
+        for position, row in enumerate(rows):
+            composed = 0
+            for middle in iter_bits(row & ~(1 << position)):
+                composed |= rows[middle] & ~(1 << middle)
+            if composed & ~row:
+                return False
+        return True
+
+    def is_complete(self) -> bool:
+        full = (1 << len(self.rows)) - 1
+        return all(row == full for row in self.rows)
+
+    def is_connex(self) -> bool:
+        # every pair of nodes is related in at least one direction
+        full = (1 << len(self.rows)) - 1
+        return all(row | column == full
+                   for row, column in zip(self.rows, self.columns))
+
+    def has_first(self) -> bool:
+        return any(not column & ~(1 << position)
+                   for position, column in enumerate(self.columns))
+
+    def has_last(self) -> bool:
+        return any(not row for row in self.rows)
@@ -0,0 +1,181 @@
+# Standar import
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+from weakref import WeakKeyDictionary
+import functools
+
+# Third import
+from networkx import DiGraph
+
+# Constants
+MAXSIZE: int = 4096
+VERSION: str = 'discret_maths_version'
+
+TFun = TypeVar('TFun', bound=Callable[..., Any])
+Key = Tuple[str, str, Tuple[Any, ...], Tuple[Tuple[str, Any], ...]]
+
+
+class GraphCache:
+    __slots__ = ('version', 'entries', 'hits', 'misses')
+
+    def __init__(self, version: Hashable) -> None:
+        self.version: Hashable = version
+        self.entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+
+_CACHES: 'WeakKeyDictionary[DiGraph, GraphCache]' = WeakKeyDictionary()
+_SETTINGS = {'maxsize': MAXSIZE}
+# analysis objects passed along with a graph, e.g. a ReachabilityIndex;
+# calls given one are not cached, they would pin it in the cache
+_UNCACHED: List[type] = []
+# relations that never change once built, as CompactRelation, are cached
+# under a constant version
+_IMMUTABLE: List[type] = []
+
+
+def _get_root(graph: DiGraph) -> DiGraph:
+    # views keep the graph they filter in _graph
+    while getattr(graph, '_graph', None) is not None:
+        graph = graph._graph  # pylint:disable=protected-access
+    return graph
+
+
+def _get_version(graph: DiGraph) -> Hashable:
+    # networkx empties __networkx_cache__ on every change of the nodes or
+    # edges of a graph, so a token kept there lives until the next change;
+    # without it, networkx before 3.3, every call gets a new token and
+    # nothing is served stale
+    tokens = getattr(_get_root(graph), '__networkx_cache__', None)
+    if tokens is None:
+        return object()
+    token = tokens.get(VERSION)
+    if token is None:
+        token = tokens[VERSION] = object()
+    return token
+
+
+def get_cache(graph: DiGraph) -> GraphCache:
+    version: Hashable = 0
+    if not isinstance(graph, tuple(_IMMUTABLE)):
+        version = _get_version(graph)
+    cache = _CACHES.get(graph)
+    if cache is None or cache.version is not version:
+        cache = GraphCache(version)
+        _CACHES[graph] = cache
+    return cache
+
+
+def touch(graph: DiGraph) -> None:
+    # invalidates the entries of a graph, and of its views, after a change
+    # networkx does not see, as new edge or graph attributes
+    tokens = getattr(_get_root(graph), '__networkx_cache__', None)
+    if tokens is not None:
+        tokens.pop(VERSION, None)
+
+
+def uncached(cls: Type[Any]) -> Type[Any]:
+    _UNCACHED.append(cls)
+    return cls
+
+
+def immutable(cls: Type[Any]) -> Type[Any]:
+    _IMMUTABLE.append(cls)
+    return cls
+
+
+def clear_cache(graph: Optional[DiGraph] = None) -> None:
+    if graph is None:
+        _CACHES.clear()
+        return
+    _CACHES.pop(graph, None)
+
+
+def set_cache_size(maxsize: int) -> None:
+    _SETTINGS['maxsize'] = maxsize
+
+
+def _get_key(
+    function: Callable[..., Any],
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> Key:
+    return (function.__module__, function.__qualname__, args,
+            tuple(sorted(kwargs.items())))
+
+
+def lookup(
+    function: Callable[..., Any],
+    graph: DiGraph,
+    *args: Any,
+) -> Any:
+    # the result of function(graph, *args) if it is cached, else None
+    return get_cache(graph).entries.get(_get_key(function, args, {}))
+
+
+def prime(
+    function: Callable[..., Any],
+    graph: DiGraph,
+    value: Any,
+    *args: Any,
+) -> None:
+    # stores value as the result of function(graph, *args), e.g. an index
+    # loaded from disk
+    key = _get_key(function, args, {})
+    entries = get_cache(graph).entries
+    entries[key] = value
+    if len(entries) > _SETTINGS['maxsize']:
+        entries.popitem(last=False)
+
+
+def _copy(value: Any) -> Any:
+    # callers may mutate the sets and dicts they get back
+    if isinstance(value, (set, dict, list)):
+        return value.copy()
+    return value
+
+
+def graph_cache(function: TFun) -> TFun:
+    @functools.wraps(function)
+    def wrapper(graph: Any, *args: Any, **kwargs: Any) -> Any:
+        maxsize = _SETTINGS['maxsize']
+        if not isinstance(graph, (DiGraph, *_IMMUTABLE)) or maxsize <= 0:
+            return function(graph, *args, **kwargs)
+        uncached_types = tuple(_UNCACHED)
+        if any(
+                isinstance(value, uncached_types)
+                for value in (*args, *kwargs.values())):
+            return function(graph, *args, **kwargs)
+        key = _get_key(function, args, kwargs)
+        try:
+            hash(key)
+        except TypeError:
+            return function(graph, *args, **kwargs)
+
+        cache = get_cache(graph)
+        entries = cache.entries
+        if key in entries:
+            cache.hits += 1
+            entries.move_to_end(key)
+            return _copy(entries[key])
+
+        cache.misses += 1
+        value = function(graph, *args, **kwargs)
+        entries[key] = value
+        if len(entries) > maxsize:
+            entries.popitem(last=False)
+        return _copy(value)
+
+    return cast(TFun, wrapper)
@@ -1,40 +1,83 @@
 # Standar import
-import itertools
+from typing import (
+    Optional,
+    Union,
+)
+
 # Third imports
 from networkx import DiGraph
-import networkx as nx
 
 # Local imports
-from discret_maths.utils import get_set_combination
-from discret_maths.utils.logger import LOGGER
-
-
-def is_reflexive(graph: DiGraph) -> bool:
+from discret_maths.relations.bitset import BitRelation
+from discret_maths.relations.cache import graph_cache
+from discret_maths.relations.compact import CompactRelation
+from discret_maths.relations.lattice import (
+    DivisibilityAlgebra,
+    Lattice,
+    get_lattice,
+)
+from discret_maths.relations.order import get_linear_order
+from discret_maths.relations.quotient import get_quotient
+from discret_maths.relations.reachability import get_index
+from discret_maths.utils.logger import aggregated_logs
+from discret_maths.utils.profiling import instrument
+
+Relation = Union[DiGraph, BitRelation, CompactRelation]
+
+# relations that answer the checks from their own rows
+MATRICES = (BitRelation, CompactRelation)
+
+
+@instrument
+@graph_cache
+def is_reflexive(graph: Relation) -> bool:
+    if isinstance(graph, MATRICES):
+        return graph.is_reflexive()
     return all(graph.has_edge(node, node) for node in graph.nodes)
 
 
-def is_anti_reflexive(graph: DiGraph) -> bool:
+@instrument
+@graph_cache
+def is_anti_reflexive(graph: Relation) -> bool:
+    if isinstance(graph, MATRICES):
+        return graph.is_anti_reflexive()
     return all(not graph.has_edge(node, node) for node in graph.nodes)
 
 
-def is_not_reflexive(graph: DiGraph) -> bool:
+@instrument
+@graph_cache
+def is_not_reflexive(graph: Relation) -> bool:
+    if isinstance(graph, MATRICES):
+        return graph.is_not_reflexive()
     if is_reflexive(graph):
         return False
     return any(graph.has_edge(node, node) for node in graph.nodes)
 
 
-def is_symmetric(graph: DiGraph) -> bool:
+@instrument
+@graph_cache
+def is_symmetric(graph: Relation) -> bool:
+    if isinstance(graph, MATRICES):
+        return graph.is_symmetric()
     return all(
         graph.has_edge(y, x) for x, y in graph.edges
         if x != y and graph.has_edge(x, y))
 
 
-def is_anti_symmetric(graph: DiGraph) -> bool:
+@instrument
+@graph_cache
+def is_anti_symmetric(graph: Relation) -> bool:
+    if isinstance(graph, MATRICES):
+        return graph.is_anti_symmetric()
     return all(not graph.has_edge(y, x) for x, y in graph.edges if x != y
                if graph.has_edge(x, y))
 
 
-def is_not_symmetric(graph: DiGraph) -> bool:
+@instrument
+@graph_cache
+def is_not_symmetric(graph: Relation) -> bool:
+    if isinstance(graph, MATRICES):
+        return graph.is_not_symmetric()
     if is_symmetric(graph):
         return False
 
@@ -43,20 +86,30 @@ def is_not_symmetric(graph: DiGraph) -> bool:
         if x != y)
 
 
-def is_transitive(graph: DiGraph) -> bool:
+@instrument
+@graph_cache
+def is_transitive(graph: Relation) -> bool:
+    if isinstance(graph, MATRICES):
+        return graph.is_transitive()
     return all(
-        graph.has_edge(x, z) for x, y in get_set_combination(graph.nodes)
-        if x != y and graph.has_edge(x, y) for z in graph.adj[y] if y != z)
+        graph.has_edge(x, z) for x, y in graph.edges if x != y
+        for z in graph.adj[y] if y != z)
 
 
-def is_not_transitive(graph: DiGraph) -> bool:
-    return any(not graph.has_edge(x, z)
-               for x, y in get_set_combination(graph.nodes)
-               if x != y and graph.has_edge(x, y) for z in graph.adj[y]
-               if y != z)
+@instrument
+@graph_cache
+def is_not_transitive(graph: Relation) -> bool:
+    if isinstance(graph, MATRICES):
+        return not graph.is_transitive()
+    return any(not graph.has_edge(x, z) for x, y in graph.edges if x != y
+               for z in graph.adj[y] if y != z)
 
 
-def is_equivalent(graph: DiGraph) -> bool:
+@instrument
+@graph_cache
+def is_equivalent(graph: Relation) -> bool:
+    if not isinstance(graph, MATRICES):
+        return get_quotient(graph).is_equivalent
     reflexive = is_reflexive(graph)
     symmetric = is_symmetric(graph)
     transitive = is_transitive(graph)
@@ -64,14 +117,18 @@ def is_equivalent(graph: DiGraph) -> bool:
     return reflexive and symmetric and transitive
 
 
-def is_strict_order(graph: DiGraph) -> bool:
+@instrument
+@graph_cache
+def is_strict_order(graph: Relation) -> bool:
     transitive = is_transitive(graph)
     anti = is_anti_symmetric(graph)
 
     return anti and transitive
 
 
-def is_partial_order(graph: DiGraph) -> bool:
+@instrument
+@graph_cache
+def is_partial_order(graph: Relation) -> bool:
     reflexive = is_reflexive(graph)
     anti_symmetric = is_anti_symmetric(graph)
     transitive = is_transitive(graph)
@@ -79,22 +136,25 @@ def is_partial_order(graph: DiGraph) -> bool:
     return reflexive and anti_symmetric and transitive
 
 
-def is_total_order(graph: DiGraph) -> bool:
-    reflexive = is_reflexive(graph)
-    anti_symmetric = is_anti_symmetric(graph)
-    transitive = is_transitive(graph)
-    all_relatione = all(
-        graph.has_edge(x, y) and graph.has_edge(y, x)
-        for x, y in get_set_combination(graph.nodes))
+@instrument
+@graph_cache
+def is_total_order(graph: Relation) -> bool:
+    if isinstance(graph, MATRICES):
+        return is_partial_order(graph) and graph.is_connex()
+    return is_reflexive(graph) and get_linear_order(graph) is not None
 
-    return reflexive and anti_symmetric and transitive and all_relatione
 
+@instrument
+@graph_cache
+def is_bounded(graph: Relation) -> bool:
+    if isinstance(graph, MATRICES):
+        return graph.has_first() and graph.has_last()
 
-def is_bounded(graph: DiGraph) -> bool:
     first = False
     last = False
+    index = get_index(graph)
     for node in graph.nodes:
-        if not nx.ancestors(graph, node):
+        if not index.ancestor_bits(node):
             first = True
             break
 
@@ -106,55 +166,57 @@ def is_bounded(graph: DiGraph) -> bool:
     return first and last
 
 
-def is_complemented(graph: DiGraph) -> bool:
+@instrument
+@graph_cache
+def is_complemented(
+    graph: Relation,
+    tables: Optional[Lattice] = None,
+) -> bool:
     from discret_maths.relations import extract
 
-    return all(
-        extract.get_complement(graph, node) is not None
-        for node in graph.nodes)
+    if isinstance(graph, MATRICES):
+        graph = graph.to_graph()
+    tables = get_lattice(graph, tables)
+    if isinstance(tables, DivisibilityAlgebra):
+        return tables.is_complemented()
+
+    with aggregated_logs():
+        return all(
+            extract.get_complement(graph, node, tables) is not None
+            for node in graph.nodes)
+
+
+@instrument
+@graph_cache
+def is_distributed(
+    graph: Relation,
+    tables: Optional[Lattice] = None,
+    structural: bool = False,
+) -> bool:
+    from discret_maths.relations import extract
+
+    if isinstance(graph, MATRICES):
+        graph = graph.to_graph()
+    tables = get_lattice(graph, tables)
+    if isinstance(tables, DivisibilityAlgebra):
+        return tables.is_distributive()
+    if not tables.is_lattice():
+        return False
 
+    return extract.get_distributive_counterexample(graph, tables,
+                                                   structural) is None
 
-def is_distributed(graph: DiGraph) -> bool:
-    from discret_maths.relations import extract
 
-    result = list()
-    combi = set(itertools.combinations(graph.nodes, 3))
-    for n_a, n_b, n_c in combi:
-        # n_a . (n_b + n_c)
-        mcs_b_c = extract.get_mcs(graph, n_b, n_c)
-        _a = extract.get_mci(graph, n_a, mcs_b_c)
-        mci_a_b = extract.get_mci(graph, n_a, n_b)
-        mci_a_c = extract.get_mci(graph, n_a, n_c)
-        # (n_a . n_b) + (n_a . n_c)
-        _b = extract.get_mcs(graph, mci_a_b, mci_a_c)
-        # n_a . (n_b + n_c) = (n_a . n_b) + (n_a . n_c)
-        result.append(_a == _b)
-        LOGGER.debug(
-            "%s . (%s + %s) = (%s . %s) + (%s . %s)",
-            n_a,
-            n_b,
-            n_c,
-            n_a,
-            n_b,
-            n_a,
-            n_c,
-        )
-        # n_a . mcs_b_c = mci_a_b + mci_a_c
-        LOGGER.debug(
-            "%s . %s = %s + %s",
-            n_a,
-            mcs_b_c,
-            mci_a_b,
-            mci_a_c,
-        )
-        LOGGER.debug(
-            "%s = %s",
-            _a,
-            _b,
-        )
-
-    return all(result)
-
-
-def is_booblean_algebra(graph: DiGraph) -> bool:
-    return is_complemented(graph) and is_distributed(graph)
+@instrument
+@graph_cache
+def is_booblean_algebra(
+    graph: Relation,
+    tables: Optional[Lattice] = None,
+) -> bool:
+    if isinstance(graph, MATRICES):
+        graph = graph.to_graph()
+    tables = get_lattice(graph, tables)
+    if isinstance(tables, DivisibilityAlgebra):
+        return tables.is_boolean()
+
+    return is_complemented(graph, tables) and is_distributed(graph, tables)
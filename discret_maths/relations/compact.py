@@ -0,0 +1,250 @@
+# Standar import
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+# Third import
+from networkx import DiGraph
+
+# Local import
+from discret_maths.relations.bitset import BitRelation
+from discret_maths.relations.cache import immutable
+
+Pair = Tuple[Any, Any]
+
+# the rows are arrays, or int32 views of a memory mapped file
+Rows = Union[array, memoryview]
+
+
+def _to_rows(
+    size: int,
+    sources: array,
+    targets: array,
+) -> Tuple[array, array]:
+    # counting sort of the pairs by source, each row is then sorted and
+    # repeated pairs are dropped
+    counts = array('i', [0]) * (size + 1)
+    for source in sources:
+        counts[source + 1] += 1
+    for position in range(size):
+        counts[position + 1] += counts[position]
+    cursor = array('i', counts)
+    rows = array('i', [0]) * len(sources)
+    for source, target in zip(sources, targets):
+        rows[cursor[source]] = target
+        cursor[source] += 1
+
+    offsets = array('i', [0]) * (size + 1)
+    unique = array('i')
+    for position in range(size):
+        row = rows[counts[position]:counts[position + 1]]
+        unique.extend(sorted(set(row)))
+        offsets[position + 1] = len(unique)
+    return offsets, unique
+
+
+@immutable
+class CompactRelation:
+    # the nodes are interned to the ids 0..n-1 and the relation is stored as
+    # compressed sparse rows, the successors of id i are the sorted ids
+    # targets[offsets[i]:offsets[i + 1]]; an edge costs four bytes and user
+    # nodes are only hashed when they come in or go out; nothing changes it
+    # once built, so its analyses are cached for as long as it lives
+    __slots__ = ('nodes', 'index', 'offsets', 'targets', '__weakref__')
+
+    def __init__(
+        self,
+        nodes: Sequence[Any],
+        offsets: Rows,
+        targets: Rows,
+    ) -> None:
+        self.nodes: Tuple[Any, ...] = tuple(nodes)
+        self.index: Dict[Any, int] = {
+            node: position
+            for position, node in enumerate(self.nodes)
+        }
+        self.offsets: Rows = offsets
+        self.targets: Rows = targets
+
+    @classmethod
+    def from_pairs(
+        cls,
+        domain: Iterable[Any],
+        relations: Iterable[Pair],
+    ) -> 'CompactRelation':
+        nodes = list(domain)
+        index = {node: position for position, node in enumerate(nodes)}
+        sources = array('i')
+        targets = array('i')
+        for pair in relations:
+            for node in pair:
+                if node not in index:
+                    index[node] = len(nodes)
+                    nodes.append(node)
+            sources.append(index[pair[0]])
+            targets.append(index[pair[1]])
+        return cls(nodes, *_to_rows(len(nodes), sources, targets))
+
+    @classmethod
+    def from_graph(cls, graph: DiGraph) -> 'CompactRelation':
+        return cls.from_pairs(graph.nodes, graph.edges)
+
+    def to_graph(self) -> DiGraph:
+        graph = DiGraph()
+        for node in self.nodes:
+            graph.add_node(node, label=node)
+        graph.add_edges_from(self.edges, color='blue')
+        return graph
+
+    def inverse(self) -> 'CompactRelation':
+        # the rows of the predecessors, the same counting sort with the
+        # sources and the targets swapped
+        sources = array('i')
+        for position in range(len(self.nodes)):
+            sources.extend(
+                [position] * (self.offsets[position + 1] -
+                              self.offsets[position]))
+        return CompactRelation(
+            self.nodes, *_to_rows(len(self.nodes), array('i', self.targets),
+                                  sources))
+
+    def to_bits(self) -> BitRelation:
+        rows = []
+        for position in range(len(self.nodes)):
+            row = 0
+            for target in self.successor_ids(position):
+                row |= 1 << target
+            rows.append(row)
+        return BitRelation(self.nodes, rows)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, node: Any) -> bool:
+        return node in self.index
+
+    def number_of_edges(self) -> int:
+        return len(self.targets)
+
+    def successor_ids(self, position: int) -> Rows:
+        return self.targets[self.offsets[position]:self.offsets[position + 1]]
+
+    @property
+    def adj(self) -> 'Successors':
+        return Successors(self)
+
+    @property
+    def edges(self) -> Iterator[Pair]:
+        nodes = self.nodes
+        offsets = self.offsets
+        targets = self.targets
+        for position in range(len(nodes)):
+            for edge in range(offsets[position], offsets[position + 1]):
+                yield (nodes[position], nodes[targets[edge]])
+
+    def _iter_ids(self) -> Iterator[Tuple[int, int]]:
+        offsets = self.offsets
+        targets = self.targets
+        for position in range(len(self.nodes)):
+            for edge in range(offsets[position], offsets[position + 1]):
+                yield (position, targets[edge])
+
+    def _has(self, position_x: int, position_y: int) -> bool:
+        start = self.offsets[position_x]
+        end = self.offsets[position_x + 1]
+        edge = bisect_left(self.targets, position_y, start, end)
+        return edge < end and self.targets[edge] == position_y
+
+    def has_edge(self, node_x: Any, node_y: Any) -> bool:
+        if node_x not in self.index or node_y not in self.index:
+            return False
+        return self._has(self.index[node_x], self.index[node_y])
+
+    def is_reflexive(self) -> bool:
+        return all(self._has(position, position)
+                   for position in range(len(self.nodes)))
+
+    def is_anti_reflexive(self) -> bool:
+        return not any(self._has(position, position)
+                       for position in range(len(self.nodes)))
+
+    def is_not_reflexive(self) -> bool:
+        return not self.is_reflexive() and not self.is_anti_reflexive()
+
+    def is_symmetric(self) -> bool:
+        return all(self._has(target, position)
+                   for position, target in self._iter_ids())
+
+    def _has_symmetric_pair(self) -> bool:
+        return any(position != target and self._has(target, position)
+                   for position, target in self._iter_ids())
+
+    def is_anti_symmetric(self) -> bool:
+        return not self._has_symmetric_pair()
+
+    def is_not_symmetric(self) -> bool:
+        return not self.is_symmetric() and self._has_symmetric_pair()
+
+    def is_transitive(self) -> bool:
+        # steps through loops are ignored, as in check.is_transitive
+        offsets = self.offsets
+        targets = self.targets
+        for position, middle in self._iter_ids():
+            if position == middle:
+                continue
+            for edge in range(offsets[middle], offsets[middle + 1]):
+                target = targets[edge]
+                if target != middle and not self._has(position, target):
+                    return False
+        return True
+
+    def is_connex(self) -> bool:
+        # every pair of nodes is related in at least one direction, that is
+        # n * (n + 1) / 2 distinct unordered pairs
+        size = len(self.nodes)
+        pairs = sum(1 for position, target in self._iter_ids()
+                    if position <= target or not self._has(target, position))
+        return pairs == size * (size + 1) // 2
+
+    def has_first(self) -> bool:
+        predecessors = array('i', [0]) * len(self.nodes)
+        for position, target in self._iter_ids():
+            if position != target:
+                predecessors[target] += 1
+        return 0 in predecessors
+
+    def has_last(self) -> bool:
+        offsets = self.offsets
+        return any(offsets[position] == offsets[position + 1]
+                   for position in range(len(self.nodes)))
+
+
+class Successors(Mapping):
+    # read only view of the successors of every node, what the functions
+    # written for a DiGraph read from graph.adj
+    __slots__ = ('relation', )
+
+    def __init__(self, relation: CompactRelation) -> None:
+        self.relation: CompactRelation = relation
+
+    def __getitem__(self, node: Any) -> Tuple[Any, ...]:
+        relation = self.relation
+        nodes = relation.nodes
+        position = relation.index[node]
+        return tuple(nodes[target]
+                     for target in relation.successor_ids(position))
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.relation.nodes)
+
+    def __len__(self) -> int:
+        return len(self.relation.nodes)
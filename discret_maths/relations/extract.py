@@ -2,30 +2,55 @@
 from typing import (
     Any,
     Dict,
+    Iterable,
     Iterator,
     List,
     Optional,
     Set,
     Tuple,
 )
+import logging
 import math
-from contextlib import suppress
 
 # Third import
 from networkx import DiGraph
-from networkx.algorithms.shortest_paths.generic import all_shortest_paths
-from networkx.exception import NetworkXNoPath
-import networkx as nx
 
 # Local import
 from discret_maths.relations import check
-from discret_maths.utils.logger import LOGGER
-from discret_maths.utils import get_set_combination
+from discret_maths.relations.cache import graph_cache
+from discret_maths.relations.lattice import (
+    DivisibilityAlgebra,
+    Lattice,
+    LatticeTables,
+    get_algebra,
+    get_filters,
+    get_ideals,
+    get_lattice,
+    get_maximal_lower_bounds,
+    get_minimal_upper_bounds,
+)
+from discret_maths.relations.reachability import (
+    ReachabilityIndex,
+    get_index,
+)
+from discret_maths.utils.logger import (
+    aggregated_logs,
+    get_logger,
+    log,
+)
+from discret_maths.utils.profiling import instrument
+from discret_maths.utils import iter_set_combination
 
 # Constants
 STRICT: bool = True
 
+LOGGER = get_logger(__name__)
+
+Pairs = Iterable[Tuple[Any, Any]]
+
 
+@instrument
+@graph_cache
 def get_reflexive(
     graph: DiGraph,
     strict: bool = STRICT,
@@ -36,6 +61,18 @@ def get_reflexive(
     return set((node, node) for node in nodes if graph.has_edge(node, node))
 
 
+def iter_symmetric(
+        graph: DiGraph) -> Iterator[Tuple[Tuple[Any, Any], Tuple[Any, Any]]]:
+    # every symmetric pair is reported once, oriented by the first node in the
+    # graph order
+    positions = {node: position for position, node in enumerate(graph.nodes)}
+    for n_x, n_y in graph.edges:
+        if positions[n_x] < positions[n_y] and graph.has_edge(n_y, n_x):
+            yield ((n_x, n_y), (n_y, n_x))
+
+
+@instrument
+@graph_cache
 def get_symmetric(
     graph: DiGraph,
     strict: bool = STRICT,
@@ -43,20 +80,11 @@ def get_symmetric(
     if strict and not check.is_symmetric(graph):
         return set()
 
-    result = set()
-    analyzed = set()
-    for n_x, n_y in graph.edges:
-        if n_x == n_y:
-            continue
-        if (graph.has_edge(n_x, n_y) and graph.has_edge(n_y, n_x)
-                and (n_x, n_y) not in analyzed and (n_y, n_x) not in analyzed):
-            result.add(((n_x, n_y), (n_y, n_x)))
-            analyzed.add((n_x, n_y))
-            analyzed.add((n_y, n_x))
-
-    return result
+    return set(iter_symmetric(graph))
 
 
+@instrument
+@graph_cache
 def get_not_symmetric(
     graph: DiGraph,
     strict: bool = STRICT,
@@ -67,6 +95,24 @@ def get_not_symmetric(
     return get_symmetric(graph, False)
 
 
+def iter_transitive(
+    graph: DiGraph
+) -> Iterator[Tuple[Tuple[Any, Any], Tuple[Any, Any], Tuple[Any, Any]]]:
+    return (((x, y), (y, z), (x, z)) for x, y in graph.edges
+            if x != y for z in graph.adj[y]
+            if y != z and graph.has_edge(x, z))
+
+
+def iter_not_transitive(
+    graph: DiGraph
+) -> Iterator[Tuple[Tuple[Any, Any], Tuple[Any, Any], Tuple[Any, Any]]]:
+    return (((x, y), (y, z), (x, z)) for x, y in graph.edges
+            if x != y for z in graph.adj[y]
+            if y != z and not graph.has_edge(x, z))
+
+
+@instrument
+@graph_cache
 def get_transitive(
     graph: DiGraph,
     strict: bool = STRICT
@@ -74,11 +120,11 @@ def get_transitive(
     if strict and not check.is_transitive(graph):
         return set()
 
-    return set(((x, y), (y, z), (x, z)) for x, y in graph.edges
-               if x != y and graph.has_edge(x, y) for z in graph.adj[y]
-               if y != z and graph.has_edge(x, z))
+    return set(iter_transitive(graph))
 
 
+@instrument
+@graph_cache
 def get_not_transitive(
     graph: DiGraph,
     strict: bool = STRICT,
@@ -86,211 +132,281 @@ def get_not_transitive(
     if strict and not check.is_not_transitive(graph):
         return set()
 
-    return set(((x, y), (y, z), (x, z)) for x, y in graph.edges
-               if x != y and graph.has_edge(x, y) for z in graph.adj[y]
-               if y != z and not graph.has_edge(x, z))
+    return set(iter_not_transitive(graph))
 
 
+@instrument
+@graph_cache
 def get_inverse(graph: DiGraph, ) -> Tuple[Tuple[int, int], ...]:
     return tuple((y, x) for x, y in graph.edges)
 
 
+@instrument
+@graph_cache
 def get_relations(graph: DiGraph, ) -> Tuple[Tuple[int, int], ...]:
 
     return tuple((x, y) for x, y in graph.edges)
 
 
+@instrument
+@graph_cache
 def math_get_mci(graph: DiGraph, node_x: int, node_y: int) -> Optional[int]:
     # maxima cuota inferior
     mci = math.gcd(node_x, node_y)
-    return mci if graph.has_node(mci) else None
+    return mci if mci in graph else None
 
 
+@instrument
+@graph_cache
 def math_get_mcs(graph: DiGraph, node_x: int, node_y: int) -> Optional[int]:
     # minima cuota superior
     mci = math.lcm(node_x, node_y)
-    return mci if graph.has_node(mci) else None
-
-
-def _recursive_pred(graph: DiGraph, node: Any) -> Iterator[Any]:
-    for pred in graph.pred[node].keys():
-        if pred == node:
-            continue
-        yield pred
-        yield from _recursive_pred(graph, pred)
+    return mci if mci in graph else None
 
 
-def _recursive_adj(graph: DiGraph, node: Any) -> Iterator[Any]:
-    for pred in graph.adj[node].keys():
-        if pred == node:
-            continue
-        yield pred
-        yield from (_recursive_adj(graph, pred))
-
-
-def get_avg_lent_paths(paths: Tuple[List[Any], ...]) -> float:
-    lengths = tuple(len(path) for path in paths)
-    return sum(lengths) / len(paths)
-
-
-def get_cs(graph: DiGraph, node_x: Any, node_y: Any) -> Set[Any]:
-    x_adj = set(_recursive_adj(graph, node_x))
-    y_adj = set(_recursive_adj(graph, node_y))
-    result = x_adj.intersection(y_adj)
-    with suppress(NetworkXNoPath):
-        if tuple(all_shortest_paths(graph, node_x, node_y)):
-            result.add(node_y)
-    with suppress(NetworkXNoPath):
-        if tuple(all_shortest_paths(graph, node_y, node_x)):
-            result.add(node_x)
+@instrument
+@graph_cache
+def get_cs(
+    graph: DiGraph,
+    node_x: Any,
+    node_y: Any,
+    index: Optional[ReachabilityIndex] = None,
+) -> Set[Any]:
+    index = index or get_index(graph)
+    result = index.common_descendants(node_x, node_y)
+    if index.leq(node_x, node_y):
+        result.add(node_y)
+    if index.leq(node_y, node_x):
+        result.add(node_x)
     return result
 
 
-def get_ci(graph: DiGraph, node_x: Any, node_y: Any) -> Set[Any]:
-    x_pred = set(_recursive_pred(graph, node_x))
-    y_pred = set(_recursive_pred(graph, node_y))
-    result = x_pred.intersection(y_pred)
-    with suppress(NetworkXNoPath):
-        if tuple(all_shortest_paths(graph, node_x, node_y)):
-            result.add(node_x)
-    with suppress(NetworkXNoPath):
-        if tuple(all_shortest_paths(graph, node_y, node_x)):
-            result.add(node_y)
+@instrument
+@graph_cache
+def get_ci(
+    graph: DiGraph,
+    node_x: Any,
+    node_y: Any,
+    index: Optional[ReachabilityIndex] = None,
+) -> Set[Any]:
+    index = index or get_index(graph)
+    result = index.common_ancestors(node_x, node_y)
+    if index.leq(node_x, node_y):
+        result.add(node_x)
+    if index.leq(node_y, node_x):
+        result.add(node_y)
     return result
 
 
-def get_all_cs(graph: DiGraph) -> Iterator[Tuple[Set[Any], Set[Any]]]:
-    for node_x, node_y in get_set_combination(graph.nodes):
-        yield ({node_x, node_y}, get_cs(graph, node_x, node_y))
-
-
-def get_all_ci(graph: DiGraph) -> Iterator[Tuple[Set[Any], Set[Any]]]:
-    for node_x, node_y in get_set_combination(graph.nodes):
-        yield ({node_x, node_y}, get_ci(graph, node_x, node_y))
-
-
-def _get_mci(graph: DiGraph, node_x: Any, node_y: Any) -> Optional[Any]:
-    with suppress(NetworkXNoPath):
-        if tuple(all_shortest_paths(graph, node_x, node_y)):
-            return {node_x}
-    with suppress(NetworkXNoPath):
-        if tuple(all_shortest_paths(graph, node_y, node_x)):
-            return {node_y}
-
-    x_pred = set(_recursive_pred(graph, node_x))
-    y_pred = set(_recursive_pred(graph, node_y))
-
-    adj_common = x_pred.intersection(y_pred)
-
-    short_common_pred: List[Tuple[Any, float]] = list()
-    for node in adj_common:
-        x_to_node = tuple(all_shortest_paths(graph, node, node_x))
-        avg_x = get_avg_lent_paths(x_to_node)
-        y_to_node = tuple(all_shortest_paths(graph, node, node_y))
-        avg_y = get_avg_lent_paths(y_to_node)
-
-        tow_paths_length = avg_x + avg_y
-        if not short_common_pred:
-            short_common_pred = [(node, avg_x + avg_y)]
-        elif tow_paths_length == short_common_pred[0][1]:
-            short_common_pred.append((node, tow_paths_length))
-        elif tow_paths_length < short_common_pred[0][1]:
-            short_common_pred = [(node, tow_paths_length)]
-
-    return {node for node, _ in short_common_pred}
+def get_all_cs(
+    graph: DiGraph,
+    unordered: bool = False,
+) -> Iterator[Tuple[Set[Any], Set[Any]]]:
+    index = get_index(graph)
+    pairs = iter_set_combination(graph.nodes, unordered=unordered)
+    for node_x, node_y in pairs:
+        yield ({node_x, node_y}, get_cs(graph, node_x, node_y, index))
 
 
-def _get_mcs(graph: DiGraph, node_x: Any, node_y: Any) -> Optional[Any]:
-    with suppress(NetworkXNoPath):
-        if tuple(all_shortest_paths(graph, node_x, node_y)):
-            return {node_y}
-    with suppress(NetworkXNoPath):
-        if tuple(all_shortest_paths(graph, node_y, node_x)):
-            return {node_x}
+def get_all_ci(
+    graph: DiGraph,
+    unordered: bool = False,
+) -> Iterator[Tuple[Set[Any], Set[Any]]]:
+    index = get_index(graph)
+    pairs = iter_set_combination(graph.nodes, unordered=unordered)
+    for node_x, node_y in pairs:
+        yield ({node_x, node_y}, get_ci(graph, node_x, node_y, index))
 
-    adj_common = set(_recursive_adj(graph, node_x)).intersection(
-        set(_recursive_adj(graph, node_y)))
 
-    short_common_adj: List[Tuple[Any, float]] = list()
-    for node in adj_common:
-        x_to_node = tuple(all_shortest_paths(graph, node_x, node))
-        avg_x = get_avg_lent_paths(x_to_node)
-        y_to_node = tuple(all_shortest_paths(graph, node_y, node))
-        avg_y = get_avg_lent_paths(y_to_node)
+@instrument
+@graph_cache
+def _get_mci(
+    graph: DiGraph,
+    node_x: Any,
+    node_y: Any,
+    index: Optional[ReachabilityIndex] = None,
+) -> Set[Any]:
+    index = index or get_index(graph)
+    return get_maximal_lower_bounds(index, node_x, node_y)
 
-        tow_paths_length = avg_x + avg_y
-        if not short_common_adj:
-            short_common_adj = [(node, avg_x + avg_y)]
-        elif tow_paths_length == short_common_adj[0][1]:
-            short_common_adj.append((node, tow_paths_length))
-        elif tow_paths_length < short_common_adj[0][1]:
-            short_common_adj = [(node, tow_paths_length)]
 
-    return {node for node, _ in short_common_adj}
+@instrument
+@graph_cache
+def _get_mcs(
+    graph: DiGraph,
+    node_x: Any,
+    node_y: Any,
+    index: Optional[ReachabilityIndex] = None,
+) -> Set[Any]:
+    index = index or get_index(graph)
+    return get_minimal_upper_bounds(index, node_x, node_y)
 
 
-def get_all_mci(graph: DiGraph) -> Iterator[Tuple[Set[Any], Any]]:
-    for node_x, node_y in get_set_combination(graph.nodes):
-        yield ({node_x, node_y}, _get_mci(graph, node_x, node_y))
+def get_all_mci(
+    graph: DiGraph,
+    unordered: bool = False,
+) -> Iterator[Tuple[Set[Any], Any]]:
+    index = get_index(graph)
+    pairs = iter_set_combination(graph.nodes, unordered=unordered)
+    for node_x, node_y in pairs:
+        yield ({node_x, node_y}, _get_mci(graph, node_x, node_y, index))
 
 
-def get_all_mcs(graph: DiGraph) -> Iterator[Tuple[Set[Any], Any]]:
-    for node_x, node_y in get_set_combination(graph.nodes):
-        yield ({node_x, node_y}, _get_mcs(graph, node_x, node_y))
+def get_all_mcs(
+    graph: DiGraph,
+    unordered: bool = False,
+) -> Iterator[Tuple[Set[Any], Any]]:
+    index = get_index(graph)
+    pairs = iter_set_combination(graph.nodes, unordered=unordered)
+    for node_x, node_y in pairs:
+        yield ({node_x, node_y}, _get_mcs(graph, node_x, node_y, index))
 
 
-def get_mci(graph: DiGraph, node_x: Any, node_y: Any) -> Optional[Any]:
+@instrument
+@graph_cache
+def get_mci(
+    graph: DiGraph,
+    node_x: Any,
+    node_y: Any,
+    tables: Optional[Lattice] = None,
+) -> Optional[Any]:
     # maxima cuota inferior
-
-    bounds = _get_mci(graph, node_x, node_y)
+    lattice = get_algebra(graph, tables)
+    if lattice is not None:
+        mci = lattice.meet(node_x, node_y)
+        if mci is not None:
+            return mci
+
+    index = tables.index if isinstance(tables, LatticeTables) else None
+    bounds = _get_mci(graph, node_x, node_y, index)
     if not bounds:
-        LOGGER.warning(
-            'nodes %s and %s have no maximum lower cote',
-            node_x,
-            node_y,
-        )
+        log(LOGGER, logging.WARNING, 'pairs had no maximum lower cote',
+            'nodes %s and %s have no maximum lower cote', node_x, node_y)
         return None
 
     if len(bounds) > 1:
-        LOGGER.warning(
+        log(LOGGER, logging.WARNING,
+            'pairs had more than one maximum lower cote',
             'nodes %s and %s have more than one maximum lower cote: %s',
-            node_x,
-            node_y,
-            bounds,
-        )
+            node_x, node_y, bounds)
         return None
 
-    return bounds.pop()
+    return next(iter(bounds))
 
 
-def get_mcs(graph: DiGraph, node_x: Any, node_y: Any) -> Optional[Any]:
+@instrument
+@graph_cache
+def get_mcs(
+    graph: DiGraph,
+    node_x: Any,
+    node_y: Any,
+    tables: Optional[Lattice] = None,
+) -> Optional[Any]:
     # minima cuota superior
-    bounds = _get_mcs(graph, node_x, node_y)
+    lattice = get_algebra(graph, tables)
+    if lattice is not None:
+        mcs = lattice.join(node_x, node_y)
+        if mcs is not None:
+            return mcs
+
+    index = tables.index if isinstance(tables, LatticeTables) else None
+    bounds = _get_mcs(graph, node_x, node_y, index)
     if not bounds:
-        LOGGER.warning(
-            'nodes %s and %s have no upper minimum quota',
-            node_x,
-            node_y,
-        )
+        log(LOGGER, logging.WARNING, 'pairs had no upper minimum quota',
+            'nodes %s and %s have no upper minimum quota', node_x, node_y)
         return None
 
     if len(bounds) > 1:
-        LOGGER.warning(
+        log(LOGGER, logging.WARNING,
+            'pairs had more than one higher minimum quota',
             'nodes %s and %s has more than one higher minimum quota: %s',
-            node_x,
-            node_y,
-            bounds,
-        )
+            node_x, node_y, bounds)
         return None
 
-    return bounds.pop()
+    return next(iter(bounds))
+
+
+def _get_batch_bounds(
+    index: ReachabilityIndex,
+    cones: List[int],
+    pairs: Pairs,
+) -> Dict[Tuple[Any, Any], Set[Any]]:
+    # the cone of every node is built once for the whole batch, each pair is
+    # then a single intersection
+    positions = index.index
+    return {(node_x, node_y):
+            index.nodes_of(cones[positions[node_x]] & cones[positions[node_y]])
+            for node_x, node_y in pairs}
+
+
+@instrument
+def get_batch_cs(
+    graph: DiGraph,
+    pairs: Pairs,
+    index: Optional[ReachabilityIndex] = None,
+) -> Dict[Tuple[Any, Any], Set[Any]]:
+    index = index or get_index(graph)
+    return _get_batch_bounds(index, get_filters(index), pairs)
+
+
+@instrument
+def get_batch_ci(
+    graph: DiGraph,
+    pairs: Pairs,
+    index: Optional[ReachabilityIndex] = None,
+) -> Dict[Tuple[Any, Any], Set[Any]]:
+    index = index or get_index(graph)
+    return _get_batch_bounds(index, get_ideals(index), pairs)
+
+
+@instrument
+def get_batch_mci(
+    graph: DiGraph,
+    pairs: Pairs,
+    tables: Optional[Lattice] = None,
+) -> Dict[Tuple[Any, Any], Optional[Any]]:
+    # a pair without a meet in the tables has no maximal lower bound or more
+    # than one, as get_mci those pairs map to None
+    meet = get_lattice(graph, tables).meet
+    result = {}
+    with aggregated_logs():
+        for node_x, node_y in pairs:
+            mci = result[(node_x, node_y)] = meet(node_x, node_y)
+            if mci is None:
+                log(LOGGER, logging.WARNING,
+                    'pairs had no single maximum lower cote',
+                    'nodes %s and %s have no single maximum lower cote',
+                    node_x, node_y)
+    return result
+
+
+@instrument
+def get_batch_mcs(
+    graph: DiGraph,
+    pairs: Pairs,
+    tables: Optional[Lattice] = None,
+) -> Dict[Tuple[Any, Any], Optional[Any]]:
+    join = get_lattice(graph, tables).join
+    result = {}
+    with aggregated_logs():
+        for node_x, node_y in pairs:
+            mcs = result[(node_x, node_y)] = join(node_x, node_y)
+            if mcs is None:
+                log(LOGGER, logging.WARNING,
+                    'pairs had no single upper minimum quota',
+                    'nodes %s and %s have no single upper minimum quota',
+                    node_x, node_y)
+    return result
 
 
+@instrument
+@graph_cache
 def get_bounded(graph: DiGraph) -> Tuple[Any, Any]:
     first = None
     last = None
+    index = get_index(graph)
     for node in graph.nodes:
-        if not nx.ancestors(graph, node):
+        if not index.ancestor_bits(node):
             first = node
             break
 
@@ -302,22 +418,122 @@ def get_bounded(graph: DiGraph) -> Tuple[Any, Any]:
     return (first, last)
 
 
-def get_complement(graph: DiGraph, node: Any) -> Optional[Any]:
+@instrument
+@graph_cache
+def get_complement(
+    graph: DiGraph,
+    node: Any,
+    tables: Optional[Lattice] = None,
+) -> Optional[Any]:
+    tables = get_lattice(graph, tables)
+    if isinstance(tables, DivisibilityAlgebra):
+        return tables.get_complement(node)
     minimum, maximum = get_bounded(graph)
 
     for _node in graph.nodes:
         if node == _node:
             continue
-        mcs = get_mcs(graph, node, _node)
-        mci = get_mci(graph, node, _node)
+        mcs = tables.join(node, _node)
+        mci = tables.meet(node, _node)
+        # a pair without a join or a meet is no complement, even when the
+        # relation has no maximum or minimum either
+        if mcs is None or mci is None:
+            continue
         if mcs == maximum and mci == minimum:
             return _node
 
-    LOGGER.info(" %s + %s = %s", node, _node, mcs)
-    LOGGER.info(" %s . %s = %s", node, _node, mci)
+    log(LOGGER, logging.INFO, 'nodes had no complement',
+        'node %s has no complement', node)
 
     return None
 
 
-def get_complements(graph: DiGraph) -> Dict[Any, Optional[Any]]:
-    return {node: get_complement(graph, node) for node in graph.nodes}
+@instrument
+@graph_cache
+def get_complements(
+    graph: DiGraph,
+    tables: Optional[Lattice] = None,
+) -> Dict[Any, Optional[Any]]:
+    tables = get_lattice(graph, tables)
+    with aggregated_logs():
+        return {
+            node: get_complement(graph, node, tables)
+            for node in graph.nodes
+        }
+
+
+def _iter_distributive_counterexamples(
+    graph: DiGraph,
+    tables: Lattice,
+) -> Iterator[Tuple[Any, Any, Any]]:
+    # the law is symmetric in n_b and n_c and trivial when n_a is one of them
+    nodes = graph.nodes
+    for n_a in nodes:
+        for n_b, n_c in iter_set_combination(nodes,
+                                             unordered=True,
+                                             diagonal=False):
+            if n_a in (n_b, n_c):
+                continue
+            # n_a . (n_b + n_c)
+            left = tables.meet(n_a, tables.join(n_b, n_c))
+            # (n_a . n_b) + (n_a . n_c)
+            right = tables.join(tables.meet(n_a, n_b), tables.meet(n_a, n_c))
+            if left is None or left != right:
+                yield (n_a, n_b, n_c)
+
+
+def _iter_cancellation_counterexamples(
+    graph: DiGraph,
+    tables: Lattice,
+) -> Iterator[Tuple[Any, Any, Any]]:
+    # a lattice is distributive when n_a . n_b = n_a . n_c and
+    # n_a + n_b = n_a + n_c force n_b = n_c; two nodes sharing both values
+    # with n_a span an N5 or M3 sublattice with them
+    nodes = graph.nodes
+    for n_a in nodes:
+        seen: Dict[Tuple[Any, Any], Any] = {}
+        for n_b in nodes:
+            if n_b == n_a:
+                continue
+            key = (tables.meet(n_a, n_b), tables.join(n_a, n_b))
+            n_c = seen.setdefault(key, n_b)
+            if n_c == n_b:
+                continue
+            # n_b . (n_a + n_c) = n_b while (n_b . n_a) + (n_b . n_c) =
+            # n_b . n_c, so the law fails on whichever node is not below
+            # the other one
+            if tables.meet(n_b, n_c) != n_b:
+                yield (n_b, n_a, n_c)
+            else:
+                yield (n_c, n_a, n_b)
+
+
+@instrument
+@graph_cache
+def get_distributive_counterexample(
+    graph: DiGraph,
+    tables: Optional[Lattice] = None,
+    structural: bool = False,
+) -> Optional[Tuple[Any, Any, Any]]:
+    # first (n_a, n_b, n_c) with n_a . (n_b + n_c) != (n_a . n_b) + (n_a . n_c)
+    tables = get_lattice(graph, tables)
+    if isinstance(tables, DivisibilityAlgebra):
+        return None
+    if structural and tables.is_lattice():
+        witnesses = _iter_cancellation_counterexamples(graph, tables)
+    else:
+        witnesses = _iter_distributive_counterexamples(graph, tables)
+
+    witness = next(witnesses, None)
+    if witness is not None and LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug(
+            '%s . (%s + %s) != (%s . %s) + (%s . %s)',
+            witness[0],
+            witness[1],
+            witness[2],
+            witness[0],
+            witness[1],
+            witness[0],
+            witness[2],
+        )
+    return witness
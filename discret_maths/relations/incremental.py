@@ -0,0 +1,365 @@
+# Standar import
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+# Third import
+from networkx import DiGraph
+
+# Local import
+from discret_maths.relations.bitset import (
+    BitRelation,
+    iter_bits,
+)
+
+Pair = Tuple[Any, Any]
+
+
+def _drop_bit(row: int, position: int) -> int:
+    low = row & ((1 << position) - 1)
+    return low | row >> (position + 1) << position
+
+
+class IncrementalRelation:
+    # a relation kept as successor and predecessor bitsets together with the
+    # counters of every property, each insert or delete updates them with a
+    # few bitset operations so the property checks never scan the relation;
+    # the closure ignores loops like ReachabilityIndex, it is extended in
+    # place on insert and rebuilt on demand after a delete, the Hasse
+    # reduction is derived from it the first time it is asked after a change
+    __slots__ = (
+        'nodes',
+        'index',
+        'rows',
+        'columns',
+        'edges_count',
+        'loops_count',
+        'symmetric_count',
+        'not_symmetric_count',
+        'not_transitive_count',
+        '_descendants',
+        '_ancestors',
+        '_closed',
+        '_hasse',
+    )
+
+    def __init__(
+        self,
+        domain: Iterable[Any] = (),
+        relations: Iterable[Pair] = (),
+    ) -> None:
+        self.nodes: List[Any] = []
+        self.index: Dict[Any, int] = {}
+        self.rows: List[int] = []
+        self.columns: List[int] = []
+        self.edges_count: int = 0
+        self.loops_count: int = 0
+        self.symmetric_count: int = 0
+        self.not_symmetric_count: int = 0
+        self.not_transitive_count: int = 0
+        self._descendants: List[int] = []
+        self._ancestors: List[int] = []
+        self._closed: bool = True
+        self._hasse: Optional[List[Pair]] = None
+        self.add_nodes_from(domain)
+        self.add_edges_from(relations)
+
+    @classmethod
+    def from_graph(cls, graph: DiGraph) -> 'IncrementalRelation':
+        return cls(graph.nodes, graph.edges)
+
+    def to_graph(self) -> DiGraph:
+        graph = DiGraph()
+        for node in self.nodes:
+            graph.add_node(node, label=node)
+        graph.add_edges_from(self.edges, color='blue')
+        return graph
+
+    def to_bits(self) -> BitRelation:
+        return BitRelation(self.nodes, list(self.rows))
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, node: Any) -> bool:
+        return node in self.index
+
+    @property
+    def edges(self) -> Iterator[Pair]:
+        for position, row in enumerate(self.rows):
+            for target in iter_bits(row):
+                yield (self.nodes[position], self.nodes[target])
+
+    def has_edge(self, node_x: Any, node_y: Any) -> bool:
+        if node_x not in self.index or node_y not in self.index:
+            return False
+        return bool(self.rows[self.index[node_x]] >> self.index[node_y] & 1)
+
+    def add_node(self, node: Any, **attr: Any) -> int:
+        # attributes are accepted so draw_graph and draw_relation can feed
+        # the relation, they are not kept
+        position = self.index.get(node)
+        if position is not None:
+            return position
+        position = len(self.nodes)
+        self.index[node] = position
+        self.nodes.append(node)
+        for table in (self.rows, self.columns, self._descendants,
+                      self._ancestors):
+            table.append(0)
+        self._hasse = None
+        return position
+
+    def add_nodes_from(self, nodes: Iterable[Any]) -> None:
+        for node in nodes:
+            self.add_node(node)
+
+    def remove_node(self, node: Any) -> None:
+        position = self.index[node]
+        for target in list(iter_bits(self.rows[position])):
+            self.remove_edge(node, self.nodes[target])
+        for source in list(iter_bits(self.columns[position])):
+            self.remove_edge(self.nodes[source], node)
+
+        # the node has no edges left, so only the bit positions move
+        del self.nodes[position]
+        self.index = {node: index for index, node in enumerate(self.nodes)}
+        for table in (self.rows, self.columns, self._descendants,
+                      self._ancestors):
+            del table[position]
+            table[:] = [_drop_bit(row, position) for row in table]
+        self._hasse = None
+
+    def _count(self, node_x: int, node_y: int) -> Tuple[int, int]:
+        # the triples x -> y -> z without x -> z that the edge (x, y)
+        # creates, and the ones it solves as the edge x -> z
+        rows = self.rows
+        columns = self.columns
+        bit_x = 1 << node_x
+        bit_y = 1 << node_y
+        if node_x == node_y:
+            return 0, bin(rows[node_x] & columns[node_x] & ~bit_x).count('1')
+        created = (bin(rows[node_y] & ~bit_y & ~rows[node_x]).count('1') +
+                   bin(columns[node_x] & ~bit_x & ~columns[node_y]).count('1'))
+        solved = bin(rows[node_x] & columns[node_y] & ~bit_x
+                     & ~bit_y).count('1')
+        return created, solved
+
+    def add_edge(self, node_x: Any, node_y: Any, **attr: Any) -> None:
+        position_x = self.add_node(node_x)
+        position_y = self.add_node(node_y)
+        if self.rows[position_x] >> position_y & 1:
+            return
+
+        created, solved = self._count(position_x, position_y)
+        self.not_transitive_count += created - solved
+        self._update_symmetry(position_x, position_y, 1)
+        self.rows[position_x] |= 1 << position_y
+        self.columns[position_y] |= 1 << position_x
+        self.edges_count += 1
+        self._hasse = None
+        if position_x != position_y and self._closed:
+            self._extend(position_x, position_y)
+
+    def add_edges_from(self, relations: Iterable[Pair]) -> None:
+        for node_x, node_y in relations:
+            self.add_edge(node_x, node_y)
+
+    def remove_edge(self, node_x: Any, node_y: Any) -> None:
+        position_x = self.index[node_x]
+        position_y = self.index[node_y]
+        if not self.rows[position_x] >> position_y & 1:
+            raise ValueError(f'unknown edge: ({node_x}, {node_y})')
+
+        self.rows[position_x] &= ~(1 << position_y)
+        self.columns[position_y] &= ~(1 << position_x)
+        self.edges_count -= 1
+        self._update_symmetry(position_x, position_y, -1)
+        created, solved = self._count(position_x, position_y)
+        self.not_transitive_count -= created - solved
+        self._hasse = None
+        if position_x != position_y:
+            self._closed = False
+
+    def remove_edges_from(self, relations: Iterable[Pair]) -> None:
+        for node_x, node_y in relations:
+            self.remove_edge(node_x, node_y)
+
+    def _update_symmetry(self, node_x: int, node_y: int, sign: int) -> None:
+        if node_x == node_y:
+            self.loops_count += sign
+        elif self.rows[node_y] >> node_x & 1:
+            # the reverse edge was alone and now has its pair, or the other
+            # way around when the edge is removed
+            self.symmetric_count += 2 * sign
+            self.not_symmetric_count -= sign
+        else:
+            self.not_symmetric_count += sign
+
+    def _extend(self, node_x: int, node_y: int) -> None:
+        sources = self._ancestors[node_x] | 1 << node_x
+        targets = self._descendants[node_y] | 1 << node_y
+        for position in iter_bits(sources):
+            self._descendants[position] |= targets
+        for position in iter_bits(targets):
+            self._ancestors[position] |= sources
+
+    def _close(self) -> None:
+        # warshall over the bit rows, loops do not take part in the closure
+        descendants = [
+            row & ~(1 << position) for position, row in enumerate(self.rows)
+        ]
+        for middle in range(len(descendants)):
+            bit = 1 << middle
+            for position, row in enumerate(descendants):
+                if row & bit:
+                    descendants[position] = row | descendants[middle]
+        ancestors = [0] * len(descendants)
+        for position, row in enumerate(descendants):
+            for target in iter_bits(row):
+                ancestors[target] |= 1 << position
+        self._descendants = descendants
+        self._ancestors = ancestors
+        self._closed = True
+
+    @property
+    def descendants_bits(self) -> List[int]:
+        if not self._closed:
+            self._close()
+        return self._descendants
+
+    @property
+    def ancestors_bits(self) -> List[int]:
+        if not self._closed:
+            self._close()
+        return self._ancestors
+
+    def nodes_of(self, bits: int) -> Set[Any]:
+        return set(self.nodes[position] for position in iter_bits(bits))
+
+    def descendant_bits(self, node: Any) -> int:
+        # a node on a cycle reaches itself, like ReachabilityIndex it is not
+        # counted as its own descendant
+        position = self.index[node]
+        return self.descendants_bits[position] & ~(1 << position)
+
+    def ancestor_bits(self, node: Any) -> int:
+        position = self.index[node]
+        return self.ancestors_bits[position] & ~(1 << position)
+
+    def descendants(self, node: Any) -> Set[Any]:
+        return self.nodes_of(self.descendant_bits(node))
+
+    def ancestors(self, node: Any) -> Set[Any]:
+        return self.nodes_of(self.ancestor_bits(node))
+
+    def reaches(self, node_x: Any, node_y: Any) -> bool:
+        return bool(self.descendant_bits(node_x) >> self.index[node_y] & 1)
+
+    def is_acyclic(self) -> bool:
+        return not any(row >> position & 1
+                       for position, row in enumerate(self.descendants_bits))
+
+    def get_hasse_edges(self) -> List[Pair]:
+        # same rule as transform.get_hasse_edges, an edge of a transitive
+        # relation is a cover when no other node lies between its ends and
+        # the loops stay unless the relation is reflexive
+        if self._hasse is not None:
+            return self._hasse
+        if not self.transitive:
+            between = [0] * sum(1 for _ in self._iter_positions())
+        elif self.is_acyclic():
+            descendants = self.descendants_bits
+            ancestors = self.ancestors_bits
+            between = [
+                descendants[position_x] & ancestors[position_y]
+                for position_x, position_y in self._iter_positions()
+            ]
+        else:
+            rows = self.rows
+            columns = self.columns
+            between = [
+                rows[position_x] & columns[position_y]
+                & ~(1 << position_x | 1 << position_y)
+                for position_x, position_y in self._iter_positions()
+            ]
+        self._hasse = [
+            (self.nodes[position_x], self.nodes[position_y])
+            for (position_x, position_y), bits in zip(self._iter_positions(),
+                                                      between) if not bits
+        ]
+        if not self.reflexive:
+            self._hasse.extend(
+                (node, node) for position, node in enumerate(self.nodes)
+                if self.rows[position] >> position & 1)
+        return self._hasse
+
+    def _iter_positions(self) -> Iterator[Tuple[int, int]]:
+        for position, row in enumerate(self.rows):
+            for target in iter_bits(row & ~(1 << position)):
+                yield (position, target)
+
+    def to_hasse(self) -> DiGraph:
+        graph = DiGraph()
+        for node in self.nodes:
+            graph.add_node(node, label=node)
+        graph.add_edges_from(self.get_hasse_edges(), color='blue')
+        return graph
+
+    @property
+    def reflexive(self) -> bool:
+        return self.loops_count == len(self.nodes)
+
+    @property
+    def anti_reflexive(self) -> bool:
+        return self.loops_count == 0
+
+    @property
+    def not_reflexive(self) -> bool:
+        return not self.reflexive and not self.anti_reflexive
+
+    @property
+    def symmetric(self) -> bool:
+        return self.not_symmetric_count == 0
+
+    @property
+    def anti_symmetric(self) -> bool:
+        return self.symmetric_count == 0
+
+    @property
+    def not_symmetric(self) -> bool:
+        return not self.symmetric and not self.anti_symmetric
+
+    @property
+    def transitive(self) -> bool:
+        return self.not_transitive_count == 0
+
+    @property
+    def not_transitive(self) -> bool:
+        return not self.transitive
+
+    @property
+    def equivalent(self) -> bool:
+        return self.reflexive and self.symmetric and self.transitive
+
+    @property
+    def strict_order(self) -> bool:
+        return self.anti_symmetric and self.transitive
+
+    @property
+    def partial_order(self) -> bool:
+        return self.reflexive and self.anti_symmetric and self.transitive
+
+    @property
+    def total_order(self) -> bool:
+        # an order relates every pair of distinct nodes in one direction
+        size = len(self.nodes)
+        return (self.partial_order
+                and self.edges_count == size * (size + 1) // 2)
@@ -0,0 +1,141 @@
+# Standar import
+from itertools import (
+    chain,
+    islice,
+)
+from typing import (
+    Any,
+    Callable,
+    IO,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from os import PathLike
+import csv
+import os
+
+# Third import
+from networkx import DiGraph
+
+# Local import
+from discret_maths.relations import draw_relation
+from discret_maths.relations.compact import CompactRelation
+
+# Constants
+CSV: str = 'csv'
+TSV: str = 'tsv'
+EDGES: str = 'edges'
+PARQUET: str = 'parquet'
+CHUNK_SIZE: int = 1 << 16
+DELIMITERS = {CSV: ',', TSV: '\t'}
+SUFFIXES = {'.csv': CSV, '.tsv': TSV, '.parquet': PARQUET}
+
+Source = Union[str, PathLike, IO[str]]
+Pair = Tuple[Any, Any]
+
+
+def _get_format(source: Source, fmt: Optional[str]) -> str:
+    if fmt is not None:
+        if fmt not in (CSV, TSV, EDGES, PARQUET):
+            raise ValueError(f'unknown edge list format: {fmt}')
+        return fmt
+    if hasattr(source, 'read'):
+        return EDGES
+    suffix = os.path.splitext(os.fspath(source))[1].lower()  # type: ignore
+    return SUFFIXES.get(suffix, EDGES)
+
+
+def _iter_rows(streamer: IO[str], fmt: str) -> Iterator[List[str]]:
+    if fmt in DELIMITERS:
+        # blank lines come as empty rows
+        return (row for row in csv.reader(streamer,
+                                          delimiter=DELIMITERS[fmt]) if row)
+    # whitespace separated pairs, blank lines and # comments are skipped
+    return (line.split() for line in streamer
+            if line.strip() and not line.lstrip().startswith('#'))
+
+
+def _iter_parquet(
+    source: Source,
+    columns: Tuple[int, int],
+    node_type: Callable[[Any], Any],
+    chunk_size: int,
+) -> Iterator[List[Pair]]:
+    try:
+        # pylint:disable=import-outside-toplevel
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise ImportError('reading parquet files needs pyarrow') from error
+
+    parquet = pq.ParquetFile(source)
+    names = [parquet.schema_arrow.names[column] for column in columns]
+    for batch in parquet.iter_batches(batch_size=chunk_size, columns=names):
+        # a whole column crosses into python at once, not a value at a time
+        sources = batch.column(names[0]).to_pylist()
+        targets = batch.column(names[1]).to_pylist()
+        yield [(node_type(node_x), node_type(node_y))
+               for node_x, node_y in zip(sources, targets)]
+
+
+def iter_edge_chunks(
+    source: Source,
+    fmt: Optional[str] = None,
+    columns: Tuple[int, int] = (0, 1),
+    header: bool = False,
+    node_type: Callable[[Any], Any] = str,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[List[Pair]]:
+    # lists of at most chunk_size pairs read from a csv, tsv, parquet or
+    # whitespace separated edge list, given as a path or a text stream; the
+    # format follows the file suffix unless fmt says otherwise
+    fmt = _get_format(source, fmt)
+    if fmt == PARQUET:
+        yield from _iter_parquet(source, columns, node_type, chunk_size)
+        return
+
+    if not hasattr(source, 'read'):
+        with open(source, newline='') as streamer:  # type: ignore
+            yield from iter_edge_chunks(streamer, fmt, columns, header,
+                                        node_type, chunk_size)
+        return
+
+    rows = _iter_rows(source, fmt)  # type: ignore
+    if header:
+        next(rows, None)
+    column_x, column_y = columns
+    while True:
+        chunk = [(node_type(row[column_x]), node_type(row[column_y]))
+                 for row in islice(rows, chunk_size)]
+        if not chunk:
+            return
+        yield chunk
+
+
+def load_relation(
+    graph: DiGraph,
+    source: Source,
+    fmt: Optional[str] = None,
+    color: Optional[str] = None,
+    inverse: bool = False,
+    **kwargs: Any,
+) -> None:
+    # draw_relation for every chunk of the edge list, the edges carry no
+    # attributes unless a color is given
+    for chunk in iter_edge_chunks(source, fmt, **kwargs):
+        draw_relation(graph, chunk, inverse, color)
+
+
+def load_compact(
+    source: Source,
+    fmt: Optional[str] = None,
+    domain: Iterable[Any] = (),
+    **kwargs: Any,
+) -> CompactRelation:
+    # the pairs go chunk by chunk into the int32 arrays of a
+    # CompactRelation, networkx is never involved
+    return CompactRelation.from_pairs(
+        domain, chain.from_iterable(iter_edge_chunks(source, fmt, **kwargs)))
@@ -0,0 +1,331 @@
+# Standar import
+from array import array
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
+import math
+
+# Third import
+from networkx import DiGraph
+
+# Local import
+from discret_maths.relations.cache import (
+    graph_cache,
+    uncached,
+)
+from discret_maths.relations.reachability import (
+    ReachabilityIndex,
+    get_index,
+)
+from discret_maths.utils import (
+    factorize,
+    get_dividers,
+)
+from discret_maths.utils.profiling import count
+
+# Constants
+NO_BOUND: int = -1
+ALGEBRA: str = 'algebra'
+DIVISIBILITY: str = 'divisibility'
+NUMBER: str = 'number'
+
+
+def _least(ups: List[int], bits: int) -> int:
+    # positions follow a topological order, so the lowest bit is minimal and
+    # it is the least element only when its filter is the whole set
+    if not bits:
+        return NO_BOUND
+    position = (bits & -bits).bit_length() - 1
+    return position if ups[position] == bits else NO_BOUND
+
+
+def _greatest(downs: List[int], bits: int) -> int:
+    if not bits:
+        return NO_BOUND
+    position = bits.bit_length() - 1
+    return position if downs[position] == bits else NO_BOUND
+
+
+def _get_single(index: ReachabilityIndex, bounds: Set[Any]) -> int:
+    if len(bounds) != 1:
+        return NO_BOUND
+    return index.index[next(iter(bounds))]
+
+
+def get_filters(index: ReachabilityIndex) -> List[int]:
+    return [
+        bits | 1 << position
+        for position, bits in enumerate(index.descendants_bits)
+    ]
+
+
+def get_ideals(index: ReachabilityIndex) -> List[int]:
+    return [
+        bits | 1 << position
+        for position, bits in enumerate(index.ancestors_bits)
+    ]
+
+
+def get_minimal_upper_bounds(
+    index: ReachabilityIndex,
+    node_x: Any,
+    node_y: Any,
+) -> Set[Any]:
+    position_x = index.index[node_x]
+    position_y = index.index[node_y]
+    ancestors = index.ancestors_bits
+    upper = ((index.descendants_bits[position_x] | 1 << position_x)
+             & (index.descendants_bits[position_y] | 1 << position_y))
+    return set(node for node in index.nodes_of(upper)
+               if not ancestors[index.index[node]] & upper)
+
+
+def get_maximal_lower_bounds(
+    index: ReachabilityIndex,
+    node_x: Any,
+    node_y: Any,
+) -> Set[Any]:
+    position_x = index.index[node_x]
+    position_y = index.index[node_y]
+    descendants = index.descendants_bits
+    lower = ((index.ancestors_bits[position_x] | 1 << position_x)
+             & (index.ancestors_bits[position_y] | 1 << position_y))
+    return set(node for node in index.nodes_of(lower)
+               if not descendants[index.index[node]] & lower)
+
+
+@uncached
+class LatticeTables:
+    # join and meet of every pair of nodes, stored as positions of the
+    # reachability index with NO_BOUND when the pair has no supremum/infimum
+    __slots__ = ('index', 'joins', 'meets')
+
+    def __init__(
+        self,
+        graph: DiGraph,
+        index: Optional[ReachabilityIndex] = None,
+    ) -> None:
+        count('lattice_tables')
+        self.index: ReachabilityIndex = index or get_index(graph)
+        size = len(self.index.nodes)
+        self.joins: List[array] = [
+            array('i', [NO_BOUND]) * size for _ in range(size)
+        ]
+        self.meets: List[array] = [
+            array('i', [NO_BOUND]) * size for _ in range(size)
+        ]
+        self._build()
+
+    @classmethod
+    def from_rows(
+        cls,
+        index: ReachabilityIndex,
+        joins: Sequence[Sequence[int]],
+        meets: Sequence[Sequence[int]],
+    ) -> 'LatticeTables':
+        # tables saved before, any sequence of int rows works, as the rows of
+        # a memory mapped file
+        tables = cls.__new__(cls)
+        tables.index = index
+        tables.joins = joins  # type: ignore
+        tables.meets = meets  # type: ignore
+        return tables
+
+    def _build(self) -> None:
+        if not self.index.is_acyclic():
+            self._build_bounds()
+            return
+        ups = get_filters(self.index)
+        downs = get_ideals(self.index)
+        joins = self.joins
+        meets = self.meets
+        for position_x, (up_x, down_x) in enumerate(zip(ups, downs)):
+            join_row = joins[position_x]
+            meet_row = meets[position_x]
+            for position_y in range(position_x, len(ups)):
+                join = _least(ups, up_x & ups[position_y])
+                meet = _greatest(downs, down_x & downs[position_y])
+                join_row[position_y] = joins[position_y][position_x] = join
+                meet_row[position_y] = meets[position_y][position_x] = meet
+
+    def _build_bounds(self) -> None:
+        # _least and _greatest assume an order, on a cycle a pair keeps its
+        # bound only when it is the single one, as get_mcs and get_mci do
+        index = self.index
+        nodes = index.nodes
+        for position_x, node_x in enumerate(nodes):
+            for position_y in range(position_x, len(nodes)):
+                node_y = nodes[position_y]
+                join = _get_single(
+                    index, get_minimal_upper_bounds(index, node_x, node_y))
+                meet = _get_single(
+                    index, get_maximal_lower_bounds(index, node_x, node_y))
+                self.joins[position_x][position_y] = join
+                self.joins[position_y][position_x] = join
+                self.meets[position_x][position_y] = meet
+                self.meets[position_y][position_x] = meet
+
+    def _lookup(
+        self,
+        table: List[array],
+        node_x: Any,
+        node_y: Any,
+    ) -> Optional[Any]:
+        if node_x is None or node_y is None:
+            return None
+        index = self.index.index
+        position = table[index[node_x]][index[node_y]]
+        return None if position == NO_BOUND else self.index.nodes[position]
+
+    def join(self, node_x: Any, node_y: Any) -> Optional[Any]:
+        return self._lookup(self.joins, node_x, node_y)
+
+    def meet(self, node_x: Any, node_y: Any) -> Optional[Any]:
+        return self._lookup(self.meets, node_x, node_y)
+
+    def is_lattice(self) -> bool:
+        # a relation with cycles is not an order, so it is never a lattice
+        return self.index.is_acyclic() and all(
+            NO_BOUND not in row
+            for table in (self.joins, self.meets) for row in table)
+
+
+@uncached
+class DivisibilityAlgebra:
+    # the dividers of a number ordered by divisibility, meet and join are the
+    # gcd and the lcm and every lattice property follows from the prime
+    # factorization of the number
+    __slots__ = ('number', 'factors', 'nodes')
+
+    def __init__(self, number: int) -> None:
+        self.number: int = number
+        self.factors: Dict[int, int] = factorize(number)
+        self.nodes: Set[int] = set(get_dividers(self.factors))
+
+    def _lookup(self, node: Optional[int]) -> Optional[int]:
+        return node if node in self.nodes else None
+
+    def join(self, node_x: Any, node_y: Any) -> Optional[int]:
+        if node_x is None or node_y is None:
+            return None
+        return self._lookup(math.lcm(node_x, node_y))
+
+    def meet(self, node_x: Any, node_y: Any) -> Optional[int]:
+        if node_x is None or node_y is None:
+            return None
+        return self._lookup(math.gcd(node_x, node_y))
+
+    def is_lattice(self) -> bool:
+        return True
+
+    def is_distributive(self) -> bool:
+        return True
+
+    def is_complemented(self) -> bool:
+        # every divider has a complement only when n is square free, the
+        # complement of a node is never the node itself
+        return self.number > 1 and all(
+            exponent == 1 for exponent in self.factors.values())
+
+    def is_boolean(self) -> bool:
+        return self.is_complemented()
+
+    def get_complement(self, node: int) -> Optional[int]:
+        # d has a complement when each prime appears in d with exponent zero
+        # or with its full exponent in n, and the complement is n / d
+        if node not in self.nodes or self.number == 1:
+            return None
+        rest = self.number // node
+        if math.gcd(node, rest) != 1:
+            return None
+        return rest
+
+
+Lattice = Union[LatticeTables, DivisibilityAlgebra]
+
+
+def get_tags(graph: DiGraph) -> Dict[str, Any]:
+    # the graph attributes, relations stored without networkx have none
+    return getattr(graph, 'graph', {})
+
+
+@graph_cache
+def get_divisibility_number(graph: DiGraph) -> Optional[int]:
+    # the number n when graph is D(n) ordered by divisibility, either as the
+    # Hasse diagram or as the whole order, with or without loops
+    tags = get_tags(graph)
+    if tags.get(ALGEBRA) == DIVISIBILITY:
+        return tags.get(NUMBER)
+    nodes = graph.nodes
+    if not nodes or not all(
+            isinstance(node, int) and not isinstance(node, bool) and node > 0
+            for node in nodes):
+        return None
+
+    # the smallest node left dividing n is its next prime when nodes is D(n)
+    number = max(nodes)
+    rest = number
+    factors: Dict[int, int] = {}
+    for node in sorted(nodes):
+        if node == 1 or rest % node:
+            continue
+        if factorize(node) != {node: 1}:
+            return None
+        while rest % node == 0:
+            factors[node] = factors.get(node, 0) + 1
+            rest //= node
+    size = math.prod(exponent + 1 for exponent in factors.values())
+    if rest != 1 or len(nodes) != size or any(number % node
+                                              for node in nodes):
+        return None
+
+    covers = 0
+    relations = 0
+    for node_x, node_y in graph.edges:
+        if node_x == node_y:
+            continue
+        if node_y % node_x:
+            return None
+        relations += 1
+        covers += node_y // node_x in factors
+    hasse_size = sum(exponent * size // (exponent + 1)
+                     for exponent in factors.values())
+    order_size = math.prod((exponent + 1) * (exponent + 2) // 2
+                           for exponent in factors.values()) - size
+    if covers == relations == hasse_size or relations == order_size:
+        return number
+    return None
+
+
+def get_algebra(
+    graph: DiGraph,
+    tables: Optional[Lattice] = None,
+) -> Optional[Lattice]:
+    # divisibility lattices are answered arithmetically, any other graph keeps
+    # the tables given by the caller; recognising an untagged graph walks its
+    # edges, so it is only tried when no tables were built
+    if isinstance(tables, DivisibilityAlgebra):
+        return tables
+    if tables is None or get_tags(graph).get(ALGEBRA) == DIVISIBILITY:
+        number = get_divisibility_number(graph)
+        if number is not None:
+            return DivisibilityAlgebra(number)
+    return tables
+
+
+@graph_cache
+def get_tables(graph: DiGraph) -> LatticeTables:
+    return LatticeTables(graph)
+
+
+def get_lattice(
+    graph: DiGraph,
+    tables: Optional[Lattice] = None,
+) -> Lattice:
+    return get_algebra(graph, tables) or get_tables(graph)
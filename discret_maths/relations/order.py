@@ -0,0 +1,168 @@
+# Standar import
+from collections import deque
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+# Third import
+from networkx import DiGraph
+import networkx as nx
+
+# Local import
+from discret_maths.relations.bitset import iter_bits
+from discret_maths.relations.cache import graph_cache
+from discret_maths.relations.reachability import get_index
+
+# Constants
+UNMATCHED: int = -1
+
+
+def _topological_sort(graph: DiGraph) -> Optional[List[Any]]:
+    # kahn over the relation without its loops, None when there is a cycle
+    degrees: Dict[Any, int] = {
+        node: len(graph.pred[node]) - (node in graph.pred[node])
+        for node in graph.nodes
+    }
+    queue = deque(node for node, degree in degrees.items() if not degree)
+    order = []
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for successor in graph.adj[node]:
+            if successor == node:
+                continue
+            degrees[successor] -= 1
+            if not degrees[successor]:
+                queue.append(successor)
+    return order if len(order) == len(degrees) else None
+
+
+@graph_cache
+def get_linear_order(graph: DiGraph) -> Optional[List[Any]]:
+    # the nodes from the first to the last when every pair of distinct nodes
+    # is related in exactly one direction and the relation is transitive;
+    # an acyclic relation with n * (n - 1) / 2 pairs relates every pair once,
+    # and it is transitive when each node is related to the next one
+    order = _topological_sort(graph)
+    if order is None:
+        return None
+    size = len(order)
+    pairs = graph.number_of_edges() - nx.number_of_selfloops(graph)
+    if pairs != size * (size - 1) // 2:
+        return None
+    if not all(
+            graph.has_edge(node_x, node_y)
+            for node_x, node_y in zip(order, order[1:])):
+        return None
+    return order
+
+
+@graph_cache
+def get_linear_extension(graph: DiGraph) -> List[Any]:
+    order = _topological_sort(graph)
+    if order is None:
+        raise ValueError('the relation has a cycle')
+    return order
+
+
+@graph_cache
+def get_height(graph: DiGraph) -> int:
+    # number of nodes of the longest chain
+    heights: Dict[Any, int] = {}
+    for node in get_linear_extension(graph):
+        heights[node] = 1 + max((heights[predecessor]
+                                 for predecessor in graph.pred[node]
+                                 if predecessor != node),
+                                default=0)
+    return max(heights.values(), default=0)
+
+
+def _match(descendants: List[int]) -> List[int]:
+    # hopcroft karp between the nodes as left side and as right side, x is
+    # joined to y when x < y in the order
+    size = len(descendants)
+    left = [UNMATCHED] * size
+    right = [UNMATCHED] * size
+    while True:
+        # layers of free left nodes by alternating paths
+        layers = [UNMATCHED] * size
+        queue = deque()
+        for node in range(size):
+            if left[node] == UNMATCHED:
+                layers[node] = 0
+                queue.append(node)
+        found = False
+        while queue:
+            node = queue.popleft()
+            for target in iter_bits(descendants[node]):
+                partner = right[target]
+                if partner == UNMATCHED:
+                    found = True
+                elif layers[partner] == UNMATCHED:
+                    layers[partner] = layers[node] + 1
+                    queue.append(partner)
+        if not found:
+            return left
+
+        for root in range(size):
+            if left[root] == UNMATCHED:
+                _augment(root, descendants, layers, left, right)
+
+
+def _augment(
+    root: int,
+    descendants: List[int],
+    layers: List[int],
+    left: List[int],
+    right: List[int],
+) -> bool:
+    # iterative depth first search along the layers, flips the path found
+    path = [root]
+    calls = [iter_bits(descendants[root])]
+    while calls:
+        node = path[-1]
+        for target in calls[-1]:
+            partner = right[target]
+            if partner == UNMATCHED:
+                # walk back flipping the matched pairs
+                while path:
+                    source = path.pop()
+                    previous = left[source]
+                    left[source] = target
+                    right[target] = source
+                    target = previous
+                return True
+            if layers[partner] == layers[node] + 1:
+                path.append(partner)
+                calls.append(iter_bits(descendants[partner]))
+                break
+        else:
+            layers[node] = UNMATCHED
+            path.pop()
+            calls.pop()
+    return False
+
+
+@graph_cache
+def get_chains(graph: DiGraph) -> List[List[Any]]:
+    # dilworth, the fewest chains covering the order are the nodes minus a
+    # maximum matching between each node and the nodes above it
+    get_linear_extension(graph)
+    index = get_index(graph)
+    following = _match(index.descendants_bits)
+    starts = set(range(len(index.nodes))) - set(following)
+    chains = []
+    for position in sorted(starts):
+        chain = []
+        while position != UNMATCHED:
+            chain.append(index.nodes[position])
+            position = following[position]
+        chains.append(chain)
+    return chains
+
+
+def get_width(graph: DiGraph) -> int:
+    return len(get_chains(graph))
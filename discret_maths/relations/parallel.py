@@ -0,0 +1,99 @@
+# Standar import
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+import itertools
+import os
+
+# Third import
+from networkx import DiGraph
+
+# Local import
+from discret_maths.relations import extract
+from discret_maths.relations.reachability import (
+    ReachabilityIndex,
+    get_index,
+)
+from discret_maths.utils import chunk_set_combination, iter_set_combination
+
+# Constants
+CHUNK_SIZE: int = 512
+BOUNDS: Dict[str, Callable[..., Any]] = {
+    'ci': extract.get_ci,
+    'cs': extract.get_cs,
+    'mci': extract._get_mci,  # pylint:disable=protected-access
+    'mcs': extract._get_mcs,  # pylint:disable=protected-access
+}
+
+# the graph and its index live once per worker process, only the pairs
+# travel with every task
+_WORKER: Dict[str, Any] = {}
+
+Bound = Tuple[Set[Any], Any]
+
+
+def _initialize(graph: DiGraph) -> None:
+    _WORKER['graph'] = graph
+    _WORKER['index'] = ReachabilityIndex(graph)
+
+
+def _solve(kind: str, pairs: List[Tuple[Any, Any]]) -> List[Bound]:
+    function = BOUNDS[kind]
+    graph = _WORKER['graph']
+    index = _WORKER['index']
+    return [({node_x, node_y}, function(graph, node_x, node_y, index))
+            for node_x, node_y in pairs]
+
+
+def get_all_bounds(
+    graph: DiGraph,
+    kind: str,
+    workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[Bound]:
+    # the bounds of (x, y) and (y, x) are the same, so only the unordered
+    # pairs are sharded; results are yielded in completion order
+    if kind not in BOUNDS:
+        raise ValueError(f'unknown bound: {kind}')
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        function = BOUNDS[kind]
+        index = get_index(graph)
+        for node_x, node_y in iter_set_combination(graph.nodes,
+                                                   unordered=True):
+            yield ({node_x, node_y}, function(graph, node_x, node_y, index))
+        return
+
+    with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_initialize,
+            initargs=(graph, ),
+    ) as executor:
+        # keep a bounded number of shards in flight so the pair space is
+        # never materialized
+        chunks = chunk_set_combination(graph.nodes,
+                                       unordered=True,
+                                       size=chunk_size)
+        pending: Set[Future] = set()
+        for chunk in itertools.islice(chunks, 2 * workers):
+            pending.add(executor.submit(_solve, kind, chunk))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    pending.add(executor.submit(_solve, kind, chunk))
@@ -0,0 +1,206 @@
+# Standar import
+from typing import (
+    Any,
+    Set,
+    Tuple,
+    Union,
+)
+
+# Third import
+from networkx import DiGraph
+
+# Local import
+from discret_maths.relations.compact import CompactRelation
+
+# Constants
+STRICT: bool = True
+
+Pair = Tuple[Any, Any]
+
+
+class RelationProfile:
+    # scans the edges of the relation only once and serves every property
+    # check and every witness set from the result of that scan
+    def __init__(
+        self,
+        graph: Union[DiGraph, CompactRelation],
+        witnesses: bool = True,
+    ) -> None:
+        self.nodes_count: int = len(graph)
+        self.edges_count: int = 0
+        self.reflexive_pairs: Set[Pair] = set()
+        self.symmetric_pairs: Set[Tuple[Pair, Pair]] = set()
+        self.transitive_triples: Set[Tuple[Pair, Pair, Pair]] = set()
+        self.not_transitive_triples: Set[Tuple[Pair, Pair, Pair]] = set()
+        self.symmetric_count: int = 0
+        self.not_symmetric_count: int = 0
+        self.not_transitive_count: int = 0
+        if isinstance(graph, CompactRelation):
+            self._scan_compact(graph, witnesses)
+        else:
+            self._scan(graph, witnesses)
+
+    def _scan_compact(
+        self,
+        relation: CompactRelation,
+        witnesses: bool,
+    ) -> None:
+        # the same scan over the interned ids, the rows are sorted so every
+        # membership test is a bisection
+        # pylint:disable=protected-access
+        nodes = relation.nodes
+        has = relation._has
+        for position_x, position_y in relation._iter_ids():
+            self.edges_count += 1
+            node_x = nodes[position_x]
+            node_y = nodes[position_y]
+            if position_x == position_y:
+                self.reflexive_pairs.add((node_x, node_y))
+                continue
+
+            if has(position_y, position_x):
+                self.symmetric_count += 1
+                reverse = ((node_y, node_x), (node_x, node_y))
+                if witnesses and reverse not in self.symmetric_pairs:
+                    self.symmetric_pairs.add(
+                        ((node_x, node_y), (node_y, node_x)))
+            else:
+                self.not_symmetric_count += 1
+
+            for position_z in relation.successor_ids(position_y):
+                if position_z == position_y:
+                    continue
+                if has(position_x, position_z):
+                    if witnesses:
+                        node_z = nodes[position_z]
+                        self.transitive_triples.add(
+                            ((node_x, node_y), (node_y, node_z),
+                             (node_x, node_z)))
+                    continue
+                self.not_transitive_count += 1
+                if witnesses:
+                    node_z = nodes[position_z]
+                    self.not_transitive_triples.add(
+                        ((node_x, node_y), (node_y, node_z),
+                         (node_x, node_z)))
+
+    def _scan(self, graph: DiGraph, witnesses: bool) -> None:
+        adj = graph.adj
+        for node_x, node_y in graph.edges:
+            self.edges_count += 1
+            if node_x == node_y:
+                self.reflexive_pairs.add((node_x, node_y))
+                continue
+
+            if node_x in adj[node_y]:
+                self.symmetric_count += 1
+                reverse = ((node_y, node_x), (node_x, node_y))
+                if witnesses and reverse not in self.symmetric_pairs:
+                    self.symmetric_pairs.add(
+                        ((node_x, node_y), (node_y, node_x)))
+            else:
+                self.not_symmetric_count += 1
+
+            adj_x = adj[node_x]
+            for node_z in adj[node_y]:
+                if node_z == node_y:
+                    continue
+                if node_z in adj_x:
+                    if witnesses:
+                        self.transitive_triples.add(
+                            ((node_x, node_y), (node_y, node_z),
+                             (node_x, node_z)))
+                    continue
+                self.not_transitive_count += 1
+                if witnesses:
+                    self.not_transitive_triples.add(
+                        ((node_x, node_y), (node_y, node_z),
+                         (node_x, node_z)))
+
+    @property
+    def reflexive(self) -> bool:
+        return len(self.reflexive_pairs) == self.nodes_count
+
+    @property
+    def anti_reflexive(self) -> bool:
+        return not self.reflexive_pairs
+
+    @property
+    def not_reflexive(self) -> bool:
+        return not self.reflexive and not self.anti_reflexive
+
+    @property
+    def symmetric(self) -> bool:
+        return self.not_symmetric_count == 0
+
+    @property
+    def anti_symmetric(self) -> bool:
+        return self.symmetric_count == 0
+
+    @property
+    def not_symmetric(self) -> bool:
+        return not self.symmetric and not self.anti_symmetric
+
+    @property
+    def transitive(self) -> bool:
+        return self.not_transitive_count == 0
+
+    @property
+    def not_transitive(self) -> bool:
+        return not self.transitive
+
+    @property
+    def equivalent(self) -> bool:
+        return self.reflexive and self.symmetric and self.transitive
+
+    @property
+    def strict_order(self) -> bool:
+        return self.anti_symmetric and self.transitive
+
+    @property
+    def partial_order(self) -> bool:
+        return self.reflexive and self.anti_symmetric and self.transitive
+
+    @property
+    def total_order(self) -> bool:
+        # an order relates every pair of distinct nodes in one direction
+        size = self.nodes_count
+        return (self.partial_order
+                and self.edges_count == size * (size + 1) // 2)
+
+    def get_reflexive(self, strict: bool = STRICT) -> Set[Pair]:
+        if strict and not self.reflexive:
+            return set()
+        return set(self.reflexive_pairs)
+
+    def get_symmetric(
+        self,
+        strict: bool = STRICT,
+    ) -> Set[Tuple[Pair, Pair]]:
+        if strict and not self.symmetric:
+            return set()
+        return set(self.symmetric_pairs)
+
+    def get_not_symmetric(
+        self,
+        strict: bool = STRICT,
+    ) -> Set[Tuple[Pair, Pair]]:
+        if strict and not self.not_symmetric:
+            return set()
+        return set(self.symmetric_pairs)
+
+    def get_transitive(
+        self,
+        strict: bool = STRICT,
+    ) -> Set[Tuple[Pair, Pair, Pair]]:
+        if strict and not self.transitive:
+            return set()
+        return set(self.transitive_triples)
+
+    def get_not_transitive(
+        self,
+        strict: bool = STRICT,
+    ) -> Set[Tuple[Pair, Pair, Pair]]:
+        if strict and not self.not_transitive:
+            return set()
+        return set(self.not_transitive_triples)
@@ -0,0 +1,148 @@
+# Standar import
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    Tuple,
+)
+
+# Third import
+from networkx import DiGraph
+
+# Local import
+from discret_maths.relations.bitset import BitRelation
+
+Pair = Tuple[Any, Any]
+
+
+class DisjointSet:
+    # union by size with path halving, every operation is amortized almost
+    # constant
+    __slots__ = ('parent', 'size')
+
+    def __init__(self, nodes: Iterable[Any] = ()) -> None:
+        self.parent: Dict[Any, Any] = {}
+        self.size: Dict[Any, int] = {}
+        for node in nodes:
+            self.add(node)
+
+    def __contains__(self, node: Any) -> bool:
+        return node in self.parent
+
+    def add(self, node: Any) -> None:
+        if node not in self.parent:
+            self.parent[node] = node
+            self.size[node] = 1
+
+    def find(self, node: Any) -> Any:
+        parent = self.parent
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def union(self, node_x: Any, node_y: Any) -> Any:
+        root_x = self.find(node_x)
+        root_y = self.find(node_y)
+        if root_x == root_y:
+            return root_x
+        if self.size[root_x] < self.size[root_y]:
+            root_x, root_y = root_y, root_x
+        self.parent[root_y] = root_x
+        self.size[root_x] += self.size.pop(root_y)
+        return root_x
+
+
+class Quotient:
+    # classes of the equivalence closure of a relation; a relation is an
+    # equivalence when it already holds every pair of its closure, that is
+    # when it has sum(size ** 2) distinct pairs; repeated pairs, as in a raw
+    # edge stream, are counted once
+    __slots__ = ('sets', 'pairs')
+
+    def __init__(
+        self,
+        domain: Iterable[Any] = (),
+        relations: Iterable[Pair] = (),
+    ) -> None:
+        self.sets: DisjointSet = DisjointSet(domain)
+        self.pairs: Set[Pair] = set()
+        for node_x, node_y in relations:
+            self.add_pair(node_x, node_y)
+
+    @classmethod
+    def from_graph(cls, graph: DiGraph) -> 'Quotient':
+        return cls(graph.nodes, graph.edges)
+
+    def add_pair(self, node_x: Any, node_y: Any) -> None:
+        self.sets.add(node_x)
+        self.sets.add(node_y)
+        self.sets.union(node_x, node_y)
+        self.pairs.add((node_x, node_y))
+
+    def __len__(self) -> int:
+        return len(self.sets.size)
+
+    @property
+    def pairs_count(self) -> int:
+        return len(self.pairs)
+
+    def representative(self, node: Any) -> Any:
+        return self.sets.find(node)
+
+    @property
+    def representatives(self) -> Dict[Any, Any]:
+        return {node: self.sets.find(node) for node in self.sets.parent}
+
+    @property
+    def sizes(self) -> Dict[Any, int]:
+        return dict(self.sets.size)
+
+    @property
+    def classes(self) -> Dict[Any, Set[Any]]:
+        classes: Dict[Any, Set[Any]] = {root: set() for root in self.sets.size}
+        for node in self.sets.parent:
+            classes[self.sets.find(node)].add(node)
+        return classes
+
+    def class_of(self, node: Any) -> Set[Any]:
+        root = self.sets.find(node)
+        return set(member for member in self.sets.parent
+                   if self.sets.find(member) == root)
+
+    @property
+    def is_equivalent(self) -> bool:
+        return self.pairs_count == sum(size**2
+                                       for size in self.sets.size.values())
+
+    def iter_closure(self) -> Iterator[Pair]:
+        for members in self.classes.values():
+            for node_x in members:
+                for node_y in members:
+                    yield (node_x, node_y)
+
+    def to_bits(self) -> BitRelation:
+        nodes: List[Any] = []
+        masks: List[int] = []
+        for members in self.classes.values():
+            mask = 0
+            for node in members:
+                mask |= 1 << len(nodes)
+                nodes.append(node)
+            masks.extend([mask] * len(members))
+        return BitRelation(nodes, masks)
+
+
+def get_quotient(graph: DiGraph) -> Quotient:
+    return Quotient.from_graph(graph)
+
+
+def get_equivalence_classes(graph: DiGraph) -> List[Set[Any]]:
+    return list(get_quotient(graph).classes.values())
+
+
+def get_equivalence_closure(graph: DiGraph) -> BitRelation:
+    return get_quotient(graph).to_bits()
@@ -0,0 +1,161 @@
+# Standar import
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+# Third import
+from networkx import DiGraph
+import networkx as nx
+
+# Local import
+from discret_maths.relations.algebra import iter_components
+from discret_maths.relations.bitset import iter_bits
+from discret_maths.relations.cache import (
+    graph_cache,
+    uncached,
+)
+from discret_maths.relations.compact import CompactRelation
+from discret_maths.utils.profiling import count
+
+
+@uncached
+class ReachabilityIndex:
+    # descendants and ancestors of every node as int bitsets, bit positions
+    # follow a topological order so the lowest bit of a set of descendants is
+    # always one of its minimal elements
+    __slots__ = ('nodes', 'index', 'descendants_bits', 'ancestors_bits')
+
+    def __init__(self, graph: Union[DiGraph, CompactRelation]) -> None:
+        count('reachability_index')
+        if isinstance(graph, CompactRelation):
+            # tarjan over the interned ids, no networkx graph is built
+            components: List[Tuple[Any, ...]] = [
+                tuple(graph.nodes[member] for member in component)
+                for component in reversed(
+                    list(iter_components(len(graph), graph.successor_ids)))
+            ]
+            successors, predecessors = graph.adj, graph.inverse().adj
+        else:
+            condensed = nx.condensation(graph)
+            components = [
+                tuple(condensed.nodes[component]['members'])
+                for component in nx.topological_sort(condensed)
+            ]
+            successors, predecessors = graph.adj, graph.pred
+        self.nodes: Tuple[Any, ...] = tuple(node for members in components
+                                            for node in members)
+        self.index: Dict[Any, int] = {
+            node: position
+            for position, node in enumerate(self.nodes)
+        }
+        self.descendants_bits: List[int] = [0] * len(self.nodes)
+        self.ancestors_bits: List[int] = [0] * len(self.nodes)
+        self._build(successors, predecessors, components)
+
+    @classmethod
+    def from_bits(
+        cls,
+        nodes: Sequence[Any],
+        descendants_bits: List[int],
+        ancestors_bits: List[int],
+    ) -> 'ReachabilityIndex':
+        # an index saved before, the nodes must keep their topological order
+        index = cls.__new__(cls)
+        index.nodes = tuple(nodes)
+        index.index = {
+            node: position
+            for position, node in enumerate(index.nodes)
+        }
+        index.descendants_bits = descendants_bits
+        index.ancestors_bits = ancestors_bits
+        return index
+
+    def _build(
+        self,
+        successors: Mapping[Any, Iterable[Any]],
+        predecessors: Mapping[Any, Iterable[Any]],
+        components: List[Tuple[Any, ...]],
+    ) -> None:
+        for members in reversed(components):
+            self._close(successors, members, self.descendants_bits)
+        for members in components:
+            self._close(predecessors, members, self.ancestors_bits)
+
+    def _close(
+        self,
+        neighbors: Any,
+        members: Tuple[Any, ...],
+        closure: List[int],
+    ) -> None:
+        index = self.index
+        inside = 0
+        for node in members:
+            inside |= 1 << index[node]
+        reach = 0
+        for node in members:
+            for neighbor in neighbors[node]:
+                position = index[neighbor]
+                if not inside >> position & 1:
+                    reach |= closure[position] | 1 << position
+        if len(members) > 1:
+            reach |= inside
+        for node in members:
+            position = index[node]
+            closure[position] = reach & ~(1 << position)
+
+    def __contains__(self, node: Any) -> bool:
+        return node in self.index
+
+    def is_acyclic(self) -> bool:
+        # a node that is both ancestor and descendant of itself lies on a
+        # cycle, self loops are not counted
+        return not any(descendants & ancestors
+                       for descendants, ancestors in zip(
+                           self.descendants_bits, self.ancestors_bits))
+
+    def nodes_of(self, bits: int) -> Set[Any]:
+        return set(self.nodes[position] for position in iter_bits(bits))
+
+    def descendant_bits(self, node: Any) -> int:
+        return self.descendants_bits[self.index[node]]
+
+    def ancestor_bits(self, node: Any) -> int:
+        return self.ancestors_bits[self.index[node]]
+
+    def descendants(self, node: Any) -> Set[Any]:
+        return self.nodes_of(self.descendant_bits(node))
+
+    def ancestors(self, node: Any) -> Set[Any]:
+        return self.nodes_of(self.ancestor_bits(node))
+
+    def reaches(self, node_x: Any, node_y: Any) -> bool:
+        return bool(self.descendant_bits(node_x) >> self.index[node_y] & 1)
+
+    def leq(self, node_x: Any, node_y: Any) -> bool:
+        # x <= y in the order generated by the relation
+        return node_x == node_y or self.reaches(node_x, node_y)
+
+    def common_descendants(self, node_x: Any, node_y: Any) -> Set[Any]:
+        return self.nodes_of(
+            self.descendant_bits(node_x) & self.descendant_bits(node_y))
+
+    def common_ancestors(self, node_x: Any, node_y: Any) -> Set[Any]:
+        return self.nodes_of(
+            self.ancestor_bits(node_x) & self.ancestor_bits(node_y))
+
+
+@graph_cache
+def get_index(graph: DiGraph) -> ReachabilityIndex:
+    return ReachabilityIndex(graph)
+
+
+def leq(graph: DiGraph, node_x: Any, node_y: Any) -> bool:
+    return get_index(graph).leq(node_x, node_y)
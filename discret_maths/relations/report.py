@@ -0,0 +1,347 @@
+# Standar import
+from contextlib import contextmanager
+from os import PathLike
+from typing import (
+    Any,
+    Dict,
+    IO,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
+import itertools
+import json
+import struct
+
+# Third import
+import oyaml as yaml
+from networkx import DiGraph
+
+# Local import
+from discret_maths.relations.check import (
+    is_booblean_algebra,
+    is_bounded,
+    is_complemented,
+    is_distributed,
+)
+from discret_maths.relations.compact import CompactRelation
+from discret_maths.relations.extract import (
+    get_bounded,
+    get_complements,
+    iter_not_transitive,
+    iter_symmetric,
+    iter_transitive,
+)
+from discret_maths.relations.lattice import get_lattice
+from discret_maths.relations.parallel import get_all_bounds
+from discret_maths.relations.profile import RelationProfile
+from discret_maths.relations.transform import (
+    get_hasse_edges,
+    to_hasse,
+)
+
+# Constants
+YAML: str = 'yaml'
+JSON_LINES: str = 'jsonl'
+BINARY: str = 'binary'
+INDENT: str = '  '
+
+# records of the binary report: a section name followed by its items and an
+# end mark, or a section name with its single value
+SECTION: bytes = b'S'
+ITEM: bytes = b'I'
+END: bytes = b'E'
+VALUE: bytes = b'V'
+# types of the values, sizes and ints are little endian base 128 varints
+NONE: bytes = b'N'
+TRUE: bytes = b'T'
+FALSE: bytes = b'F'
+INTEGER: bytes = b'i'
+FLOAT: bytes = b'f'
+TEXT: bytes = b's'
+LIST: bytes = b'l'
+MAPPING: bytes = b'd'
+DOUBLE: struct.Struct = struct.Struct('<d')
+
+Output = Union[str, PathLike, IO[Any]]
+Section = Tuple[str, Any]
+
+
+def _pairs_to_str(pairs: Iterable[Tuple[Any, ...]]) -> Iterator[str]:
+    return (', '.join(f'({x}, {y})' for x, y in pair) for pair in pairs)
+
+
+def _bounds_to_str(bounds: Iterable[Tuple[Any, Any]]) -> Iterator[str]:
+    return (f'{nodes}, {bound}' for nodes, bound in bounds)
+
+
+def _to_hasse(graph: Union[DiGraph, CompactRelation]) -> DiGraph:
+    # a compact relation becomes a graph only here, with its covers alone
+    if not isinstance(graph, CompactRelation):
+        return to_hasse(graph)
+    hasse_graph = DiGraph()
+    for node in graph.nodes:
+        hasse_graph.add_node(node, label=node)
+    hasse_graph.add_edges_from(get_hasse_edges(graph), color='blue')
+    return hasse_graph
+
+
+def iter_report(
+    graph: Union[DiGraph, CompactRelation],
+    workers: Optional[int] = 1,
+) -> Iterator[Section]:
+    # every list of the report is a lazy generator, the writers pull one item
+    # at a time; the lattice sections are the bound, they need the join and
+    # meet tables of the Hasse diagram, 8 * n * n bytes, and the complements
+    # dict of the n nodes
+    profile = RelationProfile(graph, witnesses=False)
+    yield ('relations_type', {
+        'reflexive': profile.reflexive,
+        'anti_reflexive': profile.anti_reflexive,
+        'not_reflexive': profile.not_reflexive,
+        'symmetric': profile.symmetric,
+        'anti_symmetric': profile.anti_symmetric,
+        'not_symmetric': profile.not_symmetric,
+        'transitive': profile.transitive,
+        'not_transitive': profile.not_transitive,
+        'equivalent': profile.equivalent,
+        'strict_order': profile.strict_order,
+        'partial_order': profile.partial_order,
+        'total_order': profile.total_order,
+    })
+    yield ('relented_nodes', {
+        'relations':
+        (f'({x}, {y})' for x, y in graph.edges),
+        'inverse': (f'({y}, {x})' for x, y in graph.edges),
+        'reflexive': (f'({x}, {y})' for x, y in graph.edges
+                      if profile.reflexive and x == y),
+        'symmetry':
+        _pairs_to_str(iter_symmetric(graph) if profile.symmetric else ()),
+        'not_symmetric':
+        _pairs_to_str(
+            iter_symmetric(graph) if profile.not_symmetric else ()),
+        'transitive':
+        _pairs_to_str(iter_transitive(graph) if profile.transitive else ()),
+        'not_transitive':
+        _pairs_to_str(
+            iter_not_transitive(graph) if profile.not_transitive else ()),
+    })
+
+    hasse_graph = _to_hasse(graph)
+    tables = get_lattice(hasse_graph)
+    minimum, maximum = get_bounded(hasse_graph)
+    yield ('is_lattice', tables.is_lattice())
+    yield ('lattice_is_bounded', is_bounded(hasse_graph))
+    yield ('maximum', maximum)
+    yield ('minimum', minimum)
+    yield ('lattice_is_complemented', is_complemented(hasse_graph, tables))
+    yield ('complements', get_complements(hasse_graph, tables))
+    yield ('is_boolean_algebra', is_booblean_algebra(hasse_graph, tables))
+    yield ('is_distributed', is_distributed(hasse_graph, tables))
+    yield ('lower_bounds',
+           _bounds_to_str(get_all_bounds(hasse_graph, 'ci', workers)))
+    yield ('upper_bounds',
+           _bounds_to_str(get_all_bounds(hasse_graph, 'cs', workers)))
+    yield ('maximun_lower_bounds',
+           _bounds_to_str(get_all_bounds(hasse_graph, 'mci', workers)))
+    yield ('minimum_upper_bounds',
+           _bounds_to_str(get_all_bounds(hasse_graph, 'mcs', workers)))
+
+
+def _write_yaml(
+    streamer: IO[str],
+    sections: Iterable[Section],
+    level: int = 0,
+) -> None:
+    prefix = INDENT * level
+    for key, value in sections:
+        if isinstance(value, dict) and any(
+                isinstance(item, Iterator) for item in value.values()):
+            streamer.write(f'{prefix}{key}:\n')
+            _write_yaml(streamer, value.items(), level + 1)
+            continue
+        if not isinstance(value, Iterator):
+            for line in yaml.dump({key: value}).splitlines():
+                streamer.write(f'{prefix}{line}\n')
+            continue
+
+        first = next(value, None)
+        if first is None:
+            streamer.write(f'{prefix}{key}: []\n')
+            continue
+        streamer.write(f'{prefix}{key}:\n')
+        for item in itertools.chain((first, ), value):
+            for line in yaml.dump([item]).splitlines():
+                streamer.write(f'{prefix}{line}\n')
+
+
+def _iter_records(
+    sections: Iterable[Section],
+    path: str = '',
+) -> Iterator[Dict[str, Any]]:
+    for key, value in sections:
+        section = f'{path}.{key}' if path else str(key)
+        if isinstance(value, dict) and any(
+                isinstance(item, Iterator) for item in value.values()):
+            yield from _iter_records(value.items(), section)
+        elif isinstance(value, Iterator):
+            count = 0
+            for item in value:
+                count += 1
+                yield {'section': section, 'item': item}
+            yield {'section': section, 'count': count}
+        else:
+            yield {'section': section, 'value': value}
+
+
+def _write_json_lines(streamer: IO[str], sections: Iterable[Section]) -> None:
+    for record in _iter_records(sections):
+        streamer.write(json.dumps(record, default=str))
+        streamer.write('\n')
+
+
+def _pack_size(size: int) -> bytes:
+    data = bytearray()
+    while size > 0x7f:
+        data.append(size & 0x7f | 0x80)
+        size >>= 7
+    data.append(size)
+    return bytes(data)
+
+
+def _pack(value: Any) -> bytes:
+    # tuples and sets become lists, any other type is written as its text
+    if value is None:
+        return NONE
+    if value is True:
+        return TRUE
+    if value is False:
+        return FALSE
+    if isinstance(value, int):
+        # zigzag, so small negative ints stay short
+        size = value << 1 if value >= 0 else ~value << 1 | 1
+        return INTEGER + _pack_size(size)
+    if isinstance(value, float):
+        return FLOAT + DOUBLE.pack(value)
+    if isinstance(value, dict):
+        return MAPPING + _pack_size(len(value)) + b''.join(
+            _pack(key) + _pack(item) for key, item in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return LIST + _pack_size(len(value)) + b''.join(map(_pack, value))
+    data = str(value).encode()
+    return TEXT + _pack_size(len(data)) + data
+
+
+def _write_binary(streamer: IO[bytes], sections: Iterable[Section]) -> None:
+    # the section name is written once for all its items, reading a report
+    # never runs anything but the decoder of these few types
+    opened = None
+    for record in _iter_records(sections):
+        section = record['section']
+        if 'value' in record:
+            streamer.write(VALUE + _pack(section) + _pack(record['value']))
+            continue
+        if section != opened:
+            streamer.write(SECTION + _pack(section))
+            opened = section
+        if 'item' in record:
+            streamer.write(ITEM + _pack(record['item']))
+        else:
+            streamer.write(END)
+            opened = None
+
+
+WRITERS = {
+    YAML: _write_yaml,
+    JSON_LINES: _write_json_lines,
+    BINARY: _write_binary,
+}
+
+
+@contextmanager
+def _open(output: Output, fmt: str) -> Iterator[IO[Any]]:
+    if hasattr(output, 'write'):
+        yield output  # type: ignore
+        return
+    mode = 'wb' if fmt == BINARY else 'w'
+    with open(output, mode) as streamer:  # type: ignore
+        yield streamer
+
+
+def write_report(
+    sections: Iterable[Section],
+    output: Output,
+    fmt: str = YAML,
+) -> None:
+    if fmt not in WRITERS:
+        raise ValueError(f'unknown report format: {fmt}')
+    with _open(output, fmt) as streamer:
+        WRITERS[fmt](streamer, sections)
+
+
+def _read(streamer: IO[bytes], size: int) -> bytes:
+    data = streamer.read(size)
+    if len(data) < size:
+        raise ValueError('truncated report record')
+    return data
+
+
+def _unpack_size(streamer: IO[bytes]) -> int:
+    size = 0
+    shift = 0
+    while True:
+        byte = _read(streamer, 1)[0]
+        size |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return size
+        shift += 7
+
+
+def _unpack(streamer: IO[bytes]) -> Any:
+    tag = _read(streamer, 1)
+    if tag in (NONE, TRUE, FALSE):
+        return {NONE: None, TRUE: True, FALSE: False}[tag]
+    if tag == INTEGER:
+        size = _unpack_size(streamer)
+        return ~(size >> 1) if size & 1 else size >> 1
+    if tag == FLOAT:
+        return DOUBLE.unpack(_read(streamer, DOUBLE.size))[0]
+    if tag == TEXT:
+        return _read(streamer, _unpack_size(streamer)).decode()
+    if tag == LIST:
+        return [_unpack(streamer) for _ in range(_unpack_size(streamer))]
+    if tag == MAPPING:
+        mapping = {}
+        for _ in range(_unpack_size(streamer)):
+            key = _unpack(streamer)
+            mapping[key] = _unpack(streamer)
+        return mapping
+    raise ValueError(f'unknown report value: {tag!r}')
+
+
+def read_binary_report(streamer: IO[bytes]) -> Iterator[Dict[str, Any]]:
+    # the same records as the json lines report
+    section = None
+    count = 0
+    while True:
+        tag = streamer.read(1)
+        if not tag:
+            if section is not None:
+                raise ValueError('truncated report record')
+            return
+        if tag == VALUE:
+            name = _unpack(streamer)
+            yield {'section': name, 'value': _unpack(streamer)}
+        elif tag == SECTION:
+            section = _unpack(streamer)
+            count = 0
+        elif tag == ITEM and section is not None:
+            count += 1
+            yield {'section': section, 'item': _unpack(streamer)}
+        elif tag == END and section is not None:
+            yield {'section': section, 'count': count}
+            section = None
+        else:
+            raise ValueError(f'unknown report record: {tag!r}')
@@ -0,0 +1,338 @@
+# Standar import
+from array import array
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+
+# Third import
+from networkx import DiGraph
+
+# Local import
+from discret_maths.relations.binary import (
+    get_node_table,
+    read_node_table,
+)
+from discret_maths.relations.cache import (
+    graph_cache,
+    lookup,
+    prime,
+)
+from discret_maths.relations.lattice import (
+    ALGEBRA,
+    NUMBER,
+    LatticeTables,
+    get_tables,
+    get_tags,
+)
+from discret_maths.relations.reachability import (
+    ReachabilityIndex,
+    get_index,
+)
+from discret_maths.relations.report import (
+    BINARY,
+    Output,
+    WRITERS,
+    YAML,
+    iter_report,
+    write_report,
+)
+from discret_maths.relations.transform import get_hasse_edges
+
+# Constants
+ENVIRON: str = 'DISCRET_MATHS_STORE'
+MAX_BYTES: int = 1 << 30
+NODES: str = 'nodes.bin'
+DESCENDANTS: str = 'descendants.bin'
+ANCESTORS: str = 'ancestors.bin'
+JOINS: str = 'joins.bin'
+MEETS: str = 'meets.bin'
+HASSE: str = 'hasse.bin'
+META: str = 'meta.json'
+LENGTH: struct.Struct = struct.Struct('<Q')
+# kind of node table as in binary, two reserved fields and the nodes
+NODES_HEADER: struct.Struct = struct.Struct('<HHIQ')
+
+
+def _encode(node: Any) -> bytes:
+    # the type and the value of the node, prefixed by their length
+    # pylint:disable=unidiomatic-typecheck
+    if type(node) is int:
+        data = b'i' + str(node).encode()
+    elif isinstance(node, str):
+        data = b's' + node.encode()
+    else:
+        raise ValueError(f'only int or str nodes can be stored: {node!r}')
+    return LENGTH.pack(len(data)) + data
+
+
+@graph_cache
+def get_content_hash(graph: DiGraph) -> str:
+    # the same domain, edge set and algebra tags give the same hash whatever
+    # the order in which they were drawn and whatever the process
+    digest = hashlib.sha256()
+    tags = get_tags(graph)
+    digest.update(
+        json.dumps([tags.get(ALGEBRA), tags.get(NUMBER)],
+                   default=str).encode())
+    nodes = sorted(map(_encode, graph.nodes))
+    digest.update(LENGTH.pack(len(nodes)))
+    for node in nodes:
+        digest.update(node)
+    for edge in sorted(
+            _encode(node_x) + _encode(node_y)
+            for node_x, node_y in graph.edges):
+        digest.update(edge)
+    return digest.hexdigest()
+
+
+def _get_width(size: int) -> int:
+    return max((size + 7) // 8, 1)
+
+
+def _write_atomic(path: str, data: Union[bytes, bytearray]) -> None:
+    directory = os.path.dirname(path)
+    with tempfile.NamedTemporaryFile(dir=directory, delete=False) as streamer:
+        streamer.write(data)
+    os.replace(streamer.name, path)
+
+
+def _write_bits(path: str, rows: List[int], width: int) -> None:
+    # fixed width little endian rows, row i starts at byte i * width
+    data = bytearray()
+    for row in rows:
+        data += row.to_bytes(width, 'little')
+    _write_atomic(path, data)
+
+
+def _write_table(path: str, rows: List[array]) -> None:
+    data = bytearray()
+    for row in rows:
+        data += row.tobytes()
+    _write_atomic(path, data)
+
+
+def _read(path: str) -> memoryview:
+    with open(path, 'rb') as streamer:
+        return memoryview(streamer.read())
+
+
+def _write_nodes(path: str, nodes: Tuple[Any, ...]) -> None:
+    kind, table = get_node_table(nodes)
+    _write_atomic(path,
+                  NODES_HEADER.pack(kind, 0, 0, len(nodes)) + b''.join(table))
+
+
+def _read_nodes(path: str) -> Tuple[Any, ...]:
+    view = _read(path)
+    kind, _, _, size = NODES_HEADER.unpack_from(view)
+    nodes, _ = read_node_table(view, NODES_HEADER.size, kind, size)
+    return nodes
+
+
+def _read_bits(path: str, size: int) -> List[int]:
+    # the index works on python ints, so the rows are decoded once
+    width = _get_width(size)
+    view = _read(path)
+    return [
+        int.from_bytes(view[position * width:(position + 1) * width],
+                       'little') for position in range(size)
+    ]
+
+
+def _read_table(path: str, size: int) -> List[memoryview]:
+    # the rows are views of the mapped file, the map is closed when the
+    # tables are collected
+    with open(path, 'rb') as streamer:
+        if not os.fstat(streamer.fileno()).st_size:
+            return []
+        view = memoryview(
+            mmap.mmap(streamer.fileno(), 0, access=mmap.ACCESS_READ))
+    view = view.cast('i')
+    return [view[position * size:(position + 1) * size]
+            for position in range(size)]
+
+
+class AnalysisStore:
+    # analyses of a relation saved under the hash of its content, one folder
+    # per relation with the nodes in index order, the reachability bitsets,
+    # the join and meet tables and the rendered reports; the tables are
+    # memory mapped back, the bitsets are decoded into the ints the index
+    # works on
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        max_bytes: int = MAX_BYTES,
+    ) -> None:
+        self.root: str = root or os.environ.get(ENVIRON) or os.path.join(
+            os.path.expanduser('~'), '.cache', 'discret_maths')
+        self.max_bytes: int = max_bytes
+        # entries already created and touched by this store
+        self.used: Set[str] = set()
+        os.makedirs(self.root, exist_ok=True)
+
+    def _get_folder(self, graph: DiGraph) -> str:
+        name = get_content_hash(graph)
+        folder = os.path.join(self.root, name)
+        if name not in self.used:
+            os.makedirs(folder, exist_ok=True)
+            # the folder time tells the eviction which entries were used
+            # last, once per store is enough
+            os.utime(folder)
+            self.used.add(name)
+        return folder
+
+    def get_index(self, graph: DiGraph) -> ReachabilityIndex:
+        folder = self._get_folder(graph)
+        path = os.path.join(folder, NODES)
+        if not os.path.exists(path):
+            index = get_index(graph)
+            width = _get_width(len(index.nodes))
+            _write_bits(os.path.join(folder, DESCENDANTS),
+                        index.descendants_bits, width)
+            _write_bits(os.path.join(folder, ANCESTORS), index.ancestors_bits,
+                        width)
+            # the nodes go last, they mark the entry as complete
+            _write_nodes(path, index.nodes)
+            self._save_meta(folder, graph)
+            return index
+
+        index = lookup(get_index, graph)
+        if index is None:
+            nodes = _read_nodes(path)
+            index = ReachabilityIndex.from_bits(
+                nodes,
+                _read_bits(os.path.join(folder, DESCENDANTS), len(nodes)),
+                _read_bits(os.path.join(folder, ANCESTORS), len(nodes)),
+            )
+            prime(get_index, graph, index)
+        return index
+
+    def get_tables(self, graph: DiGraph) -> LatticeTables:
+        index = self.get_index(graph)
+        folder = self._get_folder(graph)
+        joins = os.path.join(folder, JOINS)
+        meets = os.path.join(folder, MEETS)
+        if not os.path.exists(joins) or not os.path.exists(meets):
+            tables = get_tables(graph)
+            _write_table(joins, tables.joins)
+            _write_table(meets, tables.meets)
+            self.evict()
+            return tables
+
+        tables = lookup(get_tables, graph)
+        if tables is None:
+            size = len(index.nodes)
+            tables = LatticeTables.from_rows(index, _read_table(joins, size),
+                                             _read_table(meets, size))
+            prime(get_tables, graph, tables)
+        return tables
+
+    def to_hasse(self, graph: DiGraph) -> DiGraph:
+        index = self.get_index(graph)
+        path = os.path.join(self._get_folder(graph), HASSE)
+        nodes = index.nodes
+        if os.path.exists(path):
+            positions = array('i')
+            positions.frombytes(_read(path))
+            edges = set(
+                (nodes[positions[position]], nodes[positions[position + 1]])
+                for position in range(0, len(positions), 2))
+        else:
+            edges = set(get_hasse_edges(graph))
+            positions = array('i')
+            for node_x, node_y in edges:
+                positions.append(index.index[node_x])
+                positions.append(index.index[node_y])
+            _write_atomic(path, positions.tobytes())
+
+        hasse_graph = graph.__class__()
+        hasse_graph.graph.update(graph.graph)
+        hasse_graph.add_nodes_from(graph.nodes(data=True))
+        hasse_graph.add_edges_from(
+            (node_x, node_y, data)
+            for node_x, node_y, data in graph.edges(data=True)
+            if (node_x, node_y) in edges)
+        return hasse_graph
+
+    def generate_report(
+        self,
+        graph: DiGraph,
+        output: Output = 'report.yaml',
+        fmt: str = YAML,
+        workers: Optional[int] = 1,
+    ) -> None:
+        # the report is rendered once per format and copied afterwards
+        if fmt not in WRITERS:
+            raise ValueError(f'unknown report format: {fmt}')
+        path = os.path.join(self._get_folder(graph), f'report.{fmt}')
+        if not os.path.exists(path):
+            temporary = f'{path}.{os.getpid()}.tmp'
+            write_report(iter_report(graph, workers), temporary, fmt)
+            os.replace(temporary, path)
+            self.evict()
+
+        if not hasattr(output, 'write'):
+            shutil.copyfile(path, output)  # type: ignore
+            return
+        mode = 'rb' if fmt == BINARY else 'r'
+        with open(path, mode) as streamer:
+            shutil.copyfileobj(streamer, output)  # type: ignore
+
+    def _save_meta(self, folder: str, graph: DiGraph) -> None:
+        _write_atomic(
+            os.path.join(folder, META),
+            json.dumps({
+                'nodes': graph.number_of_nodes(),
+                'edges': graph.number_of_edges(),
+            }).encode())
+
+    def _iter_entries(self) -> Iterator[Tuple[float, int, str]]:
+        for name in os.listdir(self.root):
+            folder = os.path.join(self.root, name)
+            if not os.path.isdir(folder):
+                continue
+            size = sum(entry.stat().st_size for entry in os.scandir(folder))
+            yield (os.stat(folder).st_mtime, size, folder)
+
+    def get_size(self) -> int:
+        return sum(size for _, size, _ in self._iter_entries())
+
+    def evict(self) -> List[str]:
+        # drops the least recently used relations until the store fits
+        entries = sorted(self._iter_entries())
+        total = sum(size for _, size, _ in entries)
+        evicted = []
+        for _, size, folder in entries[:-1]:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(folder, ignore_errors=True)
+            self.used.discard(os.path.basename(folder))
+            total -= size
+            evicted.append(folder)
+        return evicted
+
+    def clear(self) -> None:
+        for _, _, folder in list(self._iter_entries()):
+            shutil.rmtree(folder, ignore_errors=True)
+        self.used.clear()
+
+    def warm(self, graph: DiGraph) -> Dict[str, Any]:
+        # loads everything saved for graph into the in memory cache
+        return {
+            'index': self.get_index(graph),
+            'tables': self.get_tables(graph),
+        }
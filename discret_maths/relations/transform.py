@@ -1,25 +1,87 @@
 # Standar import
-from contextlib import suppress
+from itertools import chain
+from typing import (
+    Any,
+    Iterator,
+    Tuple,
+)
 
 # Third import
 from networkx import DiGraph
-from networkx.exception import NetworkXError
+import networkx as nx
 
 # Local import
-from discret_maths.relations.extract import (
-    get_reflexive,
-    get_transitive,
+from discret_maths.relations import check
+from discret_maths.relations.reachability import (
+    ReachabilityIndex,
+    get_index,
 )
+from discret_maths.utils.profiling import instrument
+
+
+def _get_reduction(
+    graph: DiGraph,
+    index: ReachabilityIndex,
+) -> Iterator[Tuple[Any, Any]]:
+    positions = index.index
+    descendants = index.descendants_bits
+    for node_x in graph.nodes:
+        # successors in topological order, a successor already reached
+        # through a previous one is a transitive edge
+        successors = sorted(
+            (positions[node_y] for node_y in graph.adj[node_x]
+             if node_y != node_x))
+        reached = 0
+        for position in successors:
+            if not reached >> position & 1:
+                yield (node_x, index.nodes[position])
+            reached |= descendants[position]
+
+
+def _get_short_reduction(graph: DiGraph) -> Iterator[Tuple[Any, Any]]:
+    # graphs with cycles have no unique reduction, only the edges closing a
+    # path of length two are dropped
+    adj = graph.adj
+    for node_x, node_z in graph.edges:
+        if node_x == node_z:
+            continue
+        if not any(node_z in adj[node_y] for node_y in adj[node_x]
+                   if node_y not in (node_x, node_z)):
+            yield (node_x, node_z)
+
+
+def get_hasse_edges(graph: DiGraph) -> Iterator[Tuple[Any, Any]]:
+    # as the strict get_transitive and get_reflexive did, the transitive
+    # edges are dropped only from a transitive relation and the loops only
+    # from a reflexive one
+    if check.is_transitive(graph):
+        index = get_index(graph)
+        if index.is_acyclic():
+            edges = _get_reduction(graph, index)
+        else:
+            edges = _get_short_reduction(graph)
+    else:
+        edges = (edge for edge in graph.edges if edge[0] != edge[1])
+    if check.is_reflexive(graph):
+        return edges
+    return chain(edges, ((node, node) for node in graph.nodes
+                         if graph.has_edge(node, node)))
+
 
+@instrument
+def to_hasse(graph: DiGraph, as_view: bool = False) -> DiGraph:
+    edges = set(get_hasse_edges(graph))
+    if as_view:
+        return nx.subgraph_view(
+            graph,
+            filter_edge=lambda node_x, node_y: (node_x, node_y) in edges,
+        )
 
-def to_hasse(graph: DiGraph) -> DiGraph:
-    _graph = graph.copy()
-    for pair_x, _, pair_z in get_transitive(_graph):
-        node_x, _ = pair_x
-        _, node_z = pair_z
-        with suppress(NetworkXError):
-            _graph.remove_edge(node_x, node_z)
-    for node_x, node_y in get_reflexive(_graph):
-        _graph.remove_edge(node_x, node_y)
+    _graph = graph.__class__()
+    _graph.graph.update(graph.graph)
+    _graph.add_nodes_from(graph.nodes(data=True))
+    _graph.add_edges_from((node_x, node_y, data)
+                          for node_x, node_y, data in graph.edges(data=True)
+                          if (node_x, node_y) in edges)
 
     return _graph
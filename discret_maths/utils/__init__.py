@@ -1,23 +1,143 @@
 # Standar imports
 from typing import (
     Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
     Optional,
     Set,
     Tuple,
 )
+import itertools
+import math
+
+# Third imports
+from more_itertools import chunked
+
+# Constants
+CHUNK_SIZE: int = 1024
+
+
+def get_smallest_prime_factors(limit: int) -> List[int]:
+    # spf[n] is the smallest prime dividing n, 0 and 1 map to themselves
+    spf = list(range(limit + 1))
+    for number in range(2, math.isqrt(limit) + 1):
+        if spf[number] != number:
+            continue
+        for multiple in range(number * number, limit + 1, number):
+            if spf[multiple] == multiple:
+                spf[multiple] = number
+    return spf
+
+
+def factorize(
+    number: int,
+    spf: Optional[List[int]] = None,
+) -> Dict[int, int]:
+    factors: Dict[int, int] = {}
+    if spf is not None and number < len(spf):
+        while number > 1:
+            prime = spf[number]
+            factors[prime] = factors.get(prime, 0) + 1
+            number //= prime
+        return factors
+
+    prime = 2
+    while prime * prime <= number:
+        while number % prime == 0:
+            factors[prime] = factors.get(prime, 0) + 1
+            number //= prime
+        prime += 1 if prime == 2 else 2
+    if number > 1:
+        factors[number] = factors.get(number, 0) + 1
+    return factors
+
+
+def factorize_by(number: int, primes: Iterable[int]) -> Dict[int, int]:
+    factors: Dict[int, int] = {}
+    for prime in primes:
+        while number % prime == 0:
+            factors[prime] = factors.get(prime, 0) + 1
+            number //= prime
+    return factors
+
+
+def get_dividers(factors: Dict[int, int]) -> List[int]:
+    result = [1]
+    for prime, exponent in factors.items():
+        result = [
+            divisor * prime**power for divisor in result
+            for power in range(exponent + 1)
+        ]
+    return sorted(result)
 
 
 def calculate_dividers(number: int) -> Set[int]:
-    result = set()
-    for divisor in range(1, number + 1):
-        if (number % divisor) == 0:
-            result.add(divisor)
-    return set(sorted(result))
+    # only positive numbers have dividers, as with the old range scan
+    if number < 1:
+        return set()
+    return set(get_dividers(factorize(number)))
+
+
+def calculate_all_dividers(limit: int) -> Dict[int, Set[int]]:
+    # the dividers of n are built from the dividers of n without its
+    # smallest prime, which are always computed before n
+    if limit < 1:
+        raise ValueError(f'only positive numbers have dividers: {limit}')
+    spf = get_smallest_prime_factors(limit)
+    result: Dict[int, Set[int]] = {1: {1}}
+    for number in range(2, limit + 1):
+        prime = spf[number]
+        rest = number
+        exponent = 0
+        while rest % prime == 0:
+            rest //= prime
+            exponent += 1
+        result[number] = set(
+            divisor * prime**power for divisor in result[rest]
+            for power in range(exponent + 1))
+    return result
+
+
+def iter_set_combination(
+    domain: Iterable[Any],
+    image: Optional[Iterable[Any]] = None,
+    unordered: bool = False,
+    diagonal: bool = True,
+) -> Iterator[Tuple[Any, Any]]:
+    # unordered pairs only make sense over a single set, (x, y) is yielded
+    # and (y, x) is not
+    if unordered:
+        if image is not None:
+            raise ValueError('unordered pairs need a single set')
+        if diagonal:
+            return itertools.combinations_with_replacement(domain, 2)
+        return itertools.combinations(domain, 2)
+
+    if image is None:
+        # the domain is read twice, a generator would be empty the second time
+        domain = tuple(domain)
+        image = domain
+    pairs = itertools.product(domain, image)
+    if diagonal:
+        return pairs
+    return ((node_x, node_y) for node_x, node_y in pairs if node_x != node_y)
+
+
+def chunk_set_combination(
+    domain: Iterable[Any],
+    image: Optional[Iterable[Any]] = None,
+    unordered: bool = False,
+    diagonal: bool = True,
+    size: int = CHUNK_SIZE,
+) -> Iterator[List[Tuple[Any, Any]]]:
+    return chunked(
+        iter_set_combination(domain, image, unordered, diagonal), size)
 
 
 def get_set_combination(
     domain: Set[Any],
     image: Optional[Set[Any]] = None,
 ) -> Set[Tuple[Any, Any]]:
-    image = image or domain
-    return set((node_x, node_y) for node_x in domain for node_y in image)
+    return set(iter_set_combination(domain, image or domain))
@@ -1,6 +1,79 @@
+# Standar import
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 import logging
 
 _FORMAT: str = '# [%(levelname)s] %(message)s'
-logging.basicConfig(format=_FORMAT)
+
+# importing the package configures nothing, applications attach handlers
+# through configure or their own logging setup
 LOGGER: logging.Logger = logging.getLogger('relationalship')
-LOGGER.setLevel(logging.DEBUG)
+LOGGER.addHandler(logging.NullHandler())
+
+# (logger, level, summary) -> number of records folded in the summary
+Aggregate = Dict[Tuple[logging.Logger, int, str], int]
+_AGGREGATES: List[Aggregate] = []
+
+
+def get_logger(module: str) -> logging.Logger:
+    # one child of LOGGER per module, relationalship.extract for
+    # discret_maths.relations.extract
+    return LOGGER.getChild(module.rsplit('.', 1)[-1])
+
+
+def set_level(level: Union[int, str], module: Optional[str] = None) -> None:
+    (get_logger(module) if module else LOGGER).setLevel(level)
+
+
+def configure(level: Union[int, str] = logging.WARNING) -> None:
+    # the stream handler the package used to install at import time
+    if not any(
+            isinstance(handler, logging.StreamHandler)
+            for handler in LOGGER.handlers):
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(_FORMAT))
+        LOGGER.addHandler(handler)
+    LOGGER.setLevel(level)
+
+
+def log(
+    logger: logging.Logger,
+    level: int,
+    summary: str,
+    message: str,
+    *args: Any,
+) -> None:
+    # one record per call, or one count towards "N <summary>" while
+    # aggregated_logs is active; nothing is formatted when the level is off
+    if not logger.isEnabledFor(level):
+        return
+    if _AGGREGATES:
+        key = (logger, level, summary)
+        _AGGREGATES[-1][key] = _AGGREGATES[-1].get(key, 0) + 1
+        return
+    logger.log(level, message, *args)
+
+
+@contextmanager
+def aggregated_logs() -> Iterator[Aggregate]:
+    aggregate: Aggregate = {}
+    _AGGREGATES.append(aggregate)
+    try:
+        yield aggregate
+    finally:
+        _AGGREGATES.pop()
+        for (logger, level, summary), total in aggregate.items():
+            if _AGGREGATES:
+                # nested blocks report once, from the outermost one
+                key = (logger, level, summary)
+                _AGGREGATES[-1][key] = _AGGREGATES[-1].get(key, 0) + total
+                continue
+            logger.log(level, '%s %s', total, summary)
@@ -0,0 +1,171 @@
+# Standar import
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    IO,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+
+# Constants
+ENVIRON: str = 'DISCRET_MATHS_PROFILE'
+DISABLED: Tuple[str, ...] = ('', '0', 'false', 'no', 'off')
+# past this many trace events only the stats and counters keep growing
+MAX_EVENTS: int = 1 << 20
+DROPPED: str = 'dropped_trace_events'
+
+TFun = TypeVar('TFun', bound=Callable[..., Any])
+
+
+class Stats:
+    __slots__ = ('calls', 'seconds', 'size', 'depth')
+
+    def __init__(self) -> None:
+        self.calls: int = 0
+        self.seconds: float = 0.0
+        self.size: int = 0
+        self.depth: int = 0
+
+
+class Profile:
+    # what was recorded while profiling was on: stats per function, plain
+    # counters and the complete events of a chrome trace, at most
+    # max_events of them
+    def __init__(self, max_events: int = MAX_EVENTS) -> None:
+        self.stats: Dict[str, Stats] = {}
+        self.counters: Dict[str, int] = {}
+        self.events: List[Dict[str, Any]] = []
+        self.max_events: int = max_events
+        self.depth: int = 0
+        self.origin: float = time.perf_counter()
+
+    def get_summary(self) -> str:
+        lines = [
+            f'{"function":<44} {"calls":>8} {"seconds":>10} {"size":>10} '
+            f'{"depth":>6}'
+        ]
+        for name, stats in sorted(self.stats.items(),
+                                  key=lambda item: -item[1].seconds):
+            lines.append(f'{name:<44} {stats.calls:>8} {stats.seconds:>10.4f}'
+                         f' {stats.size:>10} {stats.depth:>6}')
+        for name, value in sorted(self.counters.items()):
+            lines.append(f'{name:<44} {value:>8}')
+        return '\n'.join(lines)
+
+    def write_chrome_trace(self, output: Union[str, IO[str]]) -> None:
+        # the JSON object format read by chrome://tracing and perfetto
+        trace = {'traceEvents': self.events, 'displayTimeUnit': 'ms'}
+        if isinstance(output, str):
+            with open(output, 'w') as streamer:
+                json.dump(trace, streamer)
+            return
+        json.dump(trace, output)
+
+
+_STATE: Dict[str, Optional[Profile]] = {'profile': None}
+
+
+def _export_at_exit(target: str) -> None:
+    # DISCRET_MATHS_PROFILE=1 prints the summary when the process ends, a
+    # value ending in .json is the path of the chrome trace to write
+    profile = _STATE['profile']
+    if profile is None:
+        return
+    if target.endswith('.json'):
+        profile.write_chrome_trace(target)
+        return
+    print(profile.get_summary(), file=sys.stderr)
+
+
+def is_enabled(value: Optional[str]) -> bool:
+    # DISCRET_MATHS_PROFILE=0, false, no or off leave profiling off
+    return value is not None and value.strip().lower() not in DISABLED
+
+
+if is_enabled(os.environ.get(ENVIRON)):
+    _STATE['profile'] = Profile()
+    atexit.register(_export_at_exit, os.environ[ENVIRON].strip())
+
+
+def get_profile() -> Optional[Profile]:
+    return _STATE['profile']
+
+
+@contextmanager
+def profiling(max_events: int = MAX_EVENTS) -> Iterator[Profile]:
+    previous = _STATE['profile']
+    profile = Profile(max_events)
+    _STATE['profile'] = profile
+    try:
+        yield profile
+    finally:
+        _STATE['profile'] = previous
+
+
+def count(name: str, amount: int = 1) -> None:
+    profile = _STATE['profile']
+    if profile is None:
+        return
+    profile.counters[name] = profile.counters.get(name, 0) + amount
+
+
+def _size(result: Any) -> int:
+    try:
+        return len(result)
+    except TypeError:
+        return 0
+
+
+def instrument(function: TFun) -> TFun:
+    # records calls, wall time, result size and nesting depth of function
+    # while a profile is active; otherwise it only reads _STATE
+    name = f'{function.__module__.rsplit(".", 1)[-1]}.{function.__name__}'
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        profile = _STATE['profile']
+        if profile is None:
+            return function(*args, **kwargs)
+
+        stats = profile.stats.get(name)
+        if stats is None:
+            stats = profile.stats[name] = Stats()
+        profile.depth += 1
+        start = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        finally:
+            end = time.perf_counter()
+            stats.depth = max(stats.depth, profile.depth)
+            profile.depth -= 1
+        stats.calls += 1
+        stats.seconds += end - start
+        stats.size += _size(result)
+        if len(profile.events) >= profile.max_events:
+            profile.counters[DROPPED] = profile.counters.get(DROPPED, 0) + 1
+            return result
+        profile.events.append({
+            'name': name,
+            'ph': 'X',
+            'ts': (start - profile.origin) * 1e6,
+            'dur': (end - start) * 1e6,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+        })
+        return result
+
+    return cast(TFun, wrapper)
@@ -0,0 +1,43 @@
+# type: ignore
+import pytest
+from benchmarks.harness import (
+    FLOOR,
+    compare,
+    load,
+    run,
+    save,
+)
+
+
+def test_save_load(tmp_path) -> None:
+    path = str(tmp_path / 'baseline.json')
+    results = run(sizes=(8, ), generators=['chain'],
+                  functions=['check.is_reflexive'], repeat=1)
+    assert list(results) == ['check.is_reflexive[chain-8]']
+    save(results, path)
+    assert load(path) == results
+    assert not compare(load(path), results)
+
+
+@pytest.mark.parametrize(
+    "seconds,peak_bytes,regressions",
+    [
+        (1.2, 1000.0, {}),
+        (1.3, 1000.0, {'f[g-8].seconds': ('seconds', 1.0, 1.3)}),
+        (1.0, 2000.0, {'f[g-8].peak_bytes': ('peak_bytes', 1000.0, 2000.0)}),
+    ],
+)
+def test_compare(tmp_path, seconds, peak_bytes, regressions) -> None:
+    path = str(tmp_path / 'baseline.json')
+    save({'f[g-8]': {'seconds': 1.0, 'peak_bytes': 1000.0}}, path)
+    results = {
+        'f[g-8]': {'seconds': seconds, 'peak_bytes': peak_bytes},
+        'f[g-16]': {'seconds': 9.0, 'peak_bytes': 9000.0},
+    }
+    assert compare(results, load(path)) == regressions
+
+
+def test_compare_floor() -> None:
+    # times under the clock noise never count as a regression
+    baseline = {'f[g-8]': {'seconds': FLOOR / 10}}
+    assert not compare({'f[g-8]': {'seconds': FLOOR / 2}}, baseline)
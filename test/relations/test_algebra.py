@@ -0,0 +1,55 @@
+# pylint:disable=unused-argument
+# type: ignore
+from test.relations import build_graph
+import pytest
+from networkx.classes.digraph import DiGraph
+from discret_maths.relations import check
+from discret_maths.relations.algebra import (
+    compose,
+    intersection,
+    inverse,
+    reflexive_closure,
+    reflexive_transitive_closure,
+    symmetric_closure,
+    to_bits,
+    to_graph,
+    transitive_closure,
+    union,
+)
+from discret_maths.relations.bitset import BitRelation
+
+
+@build_graph(
+    domain={1, 2, 3, 4},
+    relations={(1, 2), (2, 3), (3, 4)},
+)
+def test_relation_algebra(graph: DiGraph) -> None:
+    other = BitRelation.from_pairs({4, 5}, {(4, 5), (2, 3)})
+    assert set(inverse(graph).edges) == {(2, 1), (3, 2), (4, 3)}
+    assert set(union(graph, other).edges) == {(1, 2), (2, 3), (3, 4),
+                                              (4, 5)}
+    assert set(intersection(graph, other).edges) == {(2, 3)}
+    assert set(compose(graph, graph).edges) == {(1, 3), (2, 4)}
+    assert set(compose(graph, other).edges) == {(1, 3), (3, 5)}
+    assert set(symmetric_closure(graph).edges) == {(1, 2), (2, 1), (2, 3),
+                                                   (3, 2), (3, 4), (4, 3)}
+    assert check.is_reflexive(reflexive_closure(graph))
+    assert to_graph(to_bits(graph)).edges == graph.edges
+
+
+@pytest.mark.parametrize(
+    "relations,closure",
+    [
+        ({(1, 2), (2, 3)}, {(1, 2), (2, 3), (1, 3)}),
+        ({(1, 2), (2, 1)}, {(1, 2), (2, 1), (1, 1), (2, 2)}),
+        ({(1, 1), (2, 3)}, {(1, 1), (2, 3)}),
+        ({(3, 1), (1, 2), (2, 1)}, {(3, 1), (3, 2), (1, 2), (2, 1), (1, 1),
+                                    (2, 2)}),
+    ],
+)
+def test_transitive_closure(relations, closure) -> None:
+    relation = BitRelation.from_pairs({1, 2, 3}, relations)
+    assert set(transitive_closure(relation).edges) == closure
+    assert check.is_transitive(transitive_closure(relation))
+    preorder = reflexive_transitive_closure(relation)
+    assert check.is_reflexive(preorder) and check.is_transitive(preorder)
@@ -0,0 +1,98 @@
+# pylint:disable=unused-argument
+# type: ignore
+from test.relations import build_graph
+import pytest
+from networkx.classes.digraph import DiGraph
+from discret_maths.relations import (
+    check,
+    extract,
+)
+from discret_maths.relations.binary import (
+    read_binary,
+    write_binary,
+)
+from discret_maths.relations.compact import CompactRelation
+from discret_maths.relations.lattice import (
+    get_algebra,
+    get_lattice,
+)
+from discret_maths.relations.reachability import get_index
+
+
+@build_graph(
+    domain={1, 2, 3, 6},
+    relations={(1, 1), (1, 2), (1, 3), (1, 6), (2, 2), (2, 6), (3, 3),
+               (3, 6), (6, 6)},
+)
+def test_round_trip(graph: DiGraph, tmp_path) -> None:
+    path = tmp_path / 'relation.bin'
+    write_binary(graph, path)
+    relation = read_binary(path)
+    assert isinstance(relation.targets, memoryview)
+    assert set(relation.nodes) == set(graph.nodes)
+    assert set(relation.edges) == set(graph.edges)
+    assert check.is_partial_order(relation) == check.is_partial_order(graph)
+    assert check.is_total_order(relation) == check.is_total_order(graph)
+    assert extract.get_reflexive(relation) == extract.get_reflexive(graph)
+    assert extract.get_transitive(relation) == extract.get_transitive(graph)
+    assert set(extract.get_inverse(relation)) == set(
+        extract.get_inverse(graph))
+
+
+def test_string_nodes(tmp_path) -> None:
+    path = tmp_path / 'relation.bin'
+    relation = CompactRelation.from_pairs(
+        ['a', 'ñ'], [('a', 'ñ'), ('ñ', 'a'), ('b', 'b')])
+    write_binary(relation, path)
+    loaded = read_binary(path)
+    assert loaded.nodes == ('a', 'ñ', 'b')
+    assert list(loaded.edges) == list(relation.edges)
+    assert loaded.adj['a'] == ('ñ', )
+    assert extract.get_symmetric(loaded, False) == {(('a', 'ñ'),
+                                                     ('ñ', 'a'))}
+
+
+def test_invalid(tmp_path) -> None:
+    path = tmp_path / 'relation.bin'
+    with pytest.raises(ValueError):
+        write_binary(CompactRelation.from_pairs([(1, 2)], []), path)
+    path.write_bytes(b'not a relation file at all, just text')
+    with pytest.raises(ValueError):
+        read_binary(path)
+
+
+@pytest.mark.parametrize(
+    "relations",
+    [
+        # D(12), answered by the divisibility algebra
+        {(1, 2), (1, 3), (2, 4), (2, 6), (3, 6), (4, 12), (6, 12)},
+        # N5, answered by the lattice tables
+        {('0', 'a'), ('a', 'b'), ('b', '1'), ('0', 'c'), ('c', '1')},
+    ],
+)
+def test_extract_on_file(tmp_path, relations) -> None:
+    graph = DiGraph()
+    graph.add_edges_from(relations)
+    write_binary(graph, tmp_path / 'relation.bin')
+    relation = read_binary(tmp_path / 'relation.bin')
+    for node_x in graph.nodes:
+        for node_y in graph.nodes:
+            for function in (extract.get_cs, extract.get_ci, extract.get_mci,
+                             extract.get_mcs):
+                assert function(relation, node_x, node_y) == function(
+                    graph, node_x, node_y)
+    assert extract.get_bounded(relation) == extract.get_bounded(graph)
+    assert extract.get_complements(relation) == extract.get_complements(
+        graph)
+    assert extract.get_distributive_counterexample(
+        relation) == extract.get_distributive_counterexample(graph)
+    assert get_lattice(relation).is_lattice()
+    assert type(get_algebra(relation)) is type(get_algebra(graph))
+    if all(isinstance(node, int) for node in graph.nodes):
+        for node_x in graph.nodes:
+            for node_y in graph.nodes:
+                for function in (extract.math_get_mci, extract.math_get_mcs):
+                    assert function(relation, node_x, node_y) == function(
+                        graph, node_x, node_y)
+    # the relation never changes, its index is built once
+    assert get_index(relation) is get_index(relation)
@@ -0,0 +1,77 @@
+# pylint:disable=unused-argument
+# type: ignore
+
+from test.relations import build_graph
+import pytest
+from networkx.classes.digraph import DiGraph
+from discret_maths.relations import check
+from discret_maths.relations.bitset import BitRelation, iter_bits
+
+CHECKS = (
+    check.is_reflexive,
+    check.is_anti_reflexive,
+    check.is_not_reflexive,
+    check.is_symmetric,
+    check.is_anti_symmetric,
+    check.is_not_symmetric,
+    check.is_transitive,
+    check.is_not_transitive,
+    check.is_equivalent,
+    check.is_strict_order,
+    check.is_partial_order,
+    check.is_total_order,
+    check.is_bounded,
+)
+
+
+@pytest.mark.parametrize(
+    "domain,relations",
+    [
+        (
+            {2, 4, 5, 6, 7},
+            {(2, 2), (4, 4), (5, 5), (6, 6), (7, 7)},
+        ),
+        (
+            {2, 4, 5, 6, 7},
+            {(2, 2), (2, 6), (6, 4), (5, 6), (5, 4), (6, 5), (4, 6)},
+        ),
+        (
+            {2, 4, 5, 6, 7},
+            {(2, 2), (4, 4), (5, 4), (5, 6), (6, 5), (4, 5), (4, 6)},
+        ),
+        (
+            {1, 2, 4},
+            {(1, 1), (2, 2), (4, 4), (1, 2), (2, 4), (1, 4)},
+        ),
+        (
+            {1, 2, 4},
+            {(1, 2), (2, 4), (1, 4)},
+        ),
+        (
+            {'a', 'b'},
+            {('a', 'b'), ('b', 'a'), ('a', 'a')},
+        ),
+    ],
+)
+@pytest.mark.parametrize("check_func", CHECKS)
+@build_graph()
+def test_bitset_matches_graph(
+    graph: DiGraph,
+    domain,
+    relations,
+    check_func,
+) -> None:
+    relation = BitRelation.from_graph(graph)
+    assert check_func(relation) is check_func(graph)
+
+
+def test_bitset_round_trip() -> None:
+    relation = BitRelation.from_pairs({1, 2, 3}, {(1, 2), (2, 3), (3, 3)})
+    assert relation.has_edge(1, 2)
+    assert not relation.has_edge(2, 1)
+    assert set(relation.to_graph().edges) == {(1, 2), (2, 3), (3, 3)}
+    assert relation.get_loops() == {3}
+
+
+def test_iter_bits() -> None:
+    assert list(iter_bits(0b101001)) == [0, 3, 5]
@@ -0,0 +1,141 @@
+# pylint:disable=unused-argument
+# type: ignore
+import pickle
+from test.relations import build_graph
+import pytest
+from networkx.classes.digraph import DiGraph
+from discret_maths.relations import (
+    check,
+    extract,
+)
+from discret_maths.relations.cache import (
+    clear_cache,
+    get_cache,
+    set_cache_size,
+    touch,
+    MAXSIZE,
+)
+from discret_maths.relations.reachability import get_index
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    clear_cache()
+    yield
+    set_cache_size(MAXSIZE)
+    clear_cache()
+
+
+@build_graph(
+    domain={1, 2, 3, 6},
+    relations={(1, 2), (1, 3), (2, 6), (3, 6)},
+)
+def test_graph_cache_hits(graph: DiGraph) -> None:
+    assert extract.get_complement(graph, 2) == 3
+    misses = get_cache(graph).misses
+    assert extract.get_complement(graph, 2) == 3
+    assert get_cache(graph).misses == misses
+    assert get_cache(graph).hits >= 1
+    # a query never changes the graph it is given
+    assert type(graph) is DiGraph  # pylint:disable=unidiomatic-typecheck
+
+
+@build_graph(
+    domain={1, 2, 3, 6},
+    relations={(1, 2), (1, 3), (2, 6), (3, 6)},
+)
+def test_graph_cache_invalidation(graph: DiGraph) -> None:
+    assert extract.get_mcs(graph, 2, 3) == 6
+    graph.add_edge(6, 12)
+    graph.add_edge(2, 12)
+    graph.add_edge(3, 12)
+    graph.remove_node(6)
+    assert extract.get_mcs(graph, 2, 3) == 12
+
+    # a change that keeps every degree
+    graph.add_edge(4, 5)
+    assert extract.get_cs(graph, 2, 3) == {12}
+    graph.remove_edges_from([(2, 12), (4, 5)])
+    graph.add_edges_from([(2, 5), (4, 12)])
+    assert extract.get_cs(graph, 2, 3) == set()
+
+
+def test_graph_cache_rewire() -> None:
+    graph = DiGraph([(1, 2), (3, 4)])
+    assert extract.get_cs(graph, 1, 2) == {2}
+    assert check.is_transitive(graph)
+    graph.remove_edges_from([(1, 2), (3, 4)])
+    graph.add_edges_from([(1, 4), (3, 2)])
+    assert extract.get_cs(graph, 1, 2) == set()
+    assert not get_index(graph).leq(1, 2)
+
+    graph.add_edges_from([(4, 3)])
+    assert not check.is_transitive(graph)
+    view = graph.subgraph([1, 4, 3])
+    assert not check.is_transitive(view)
+    graph.add_edges_from([(1, 3)])
+    assert check.is_transitive(view)
+
+
+@build_graph(
+    domain={1, 2, 3, 6},
+    relations={(1, 2), (1, 3), (2, 6), (3, 6)},
+)
+def test_graph_cache_touch(graph: DiGraph) -> None:
+    extract.get_complement(graph, 2)
+    cache = get_cache(graph)
+    assert get_cache(graph) is cache
+    touch(graph)
+    assert get_cache(graph) is not cache
+
+
+@build_graph(
+    domain={1, 2, 3, 6},
+    relations={(1, 2), (1, 3), (2, 6), (3, 6)},
+)
+def test_graph_cache_size(graph: DiGraph) -> None:
+    set_cache_size(2)
+    for node in graph.nodes:
+        extract.get_complement(graph, node)
+    assert len(get_cache(graph).entries) == 2
+
+    clear_cache(graph)
+    set_cache_size(0)
+    extract.get_complement(graph, 1)
+    assert not get_cache(graph).entries
+
+
+@build_graph(
+    domain={1, 2, 3, 6},
+    relations={(1, 2), (1, 3), (2, 6), (3, 6)},
+)
+def test_graph_cache_copy(graph: DiGraph) -> None:
+    extract.get_complements(graph).clear()
+    assert extract.get_complements(graph) == {1: 6, 2: 3, 3: 2, 6: 1}
+
+    extract.get_complements(graph)
+    assert pickle.loads(pickle.dumps(graph)).edges == graph.edges
+
+
+class Relation(DiGraph):
+    pass
+
+
+def test_graph_cache_subclass() -> None:
+    graph = Relation()
+    graph.add_edges_from([(1, 1), (1, 2), (2, 2)])
+    assert check.is_anti_symmetric(graph)
+    graph.add_edge(2, 1)
+    assert not check.is_anti_symmetric(graph)
+    assert type(graph) is Relation  # pylint:disable=unidiomatic-typecheck
+
+
+@build_graph(
+    domain={1, 2, 3, 6},
+    relations={(1, 2), (1, 3), (2, 6), (3, 6)},
+)
+def test_graph_cache_skips_index(graph: DiGraph) -> None:
+    index = get_index(graph)
+    entries = len(get_cache(graph).entries)
+    assert extract.get_cs(graph, 2, 3, index) == {6}
+    assert len(get_cache(graph).entries) == entries
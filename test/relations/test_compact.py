@@ -0,0 +1,55 @@
+# pylint:disable=unused-argument
+# type: ignore
+from test.relations import build_graph
+from test.relations.test_bitset import CHECKS
+import pytest
+from networkx.classes.digraph import DiGraph
+from discret_maths.relations import relations_to_str
+from discret_maths.relations.compact import CompactRelation
+
+
+@pytest.mark.parametrize(
+    "domain,relations",
+    [
+        (
+            {1, 2, 4},
+            {(1, 1), (2, 2), (4, 4), (1, 2), (2, 4), (1, 4)},
+        ),
+        (
+            {2, 4, 5, 6, 7},
+            {(2, 2), (2, 6), (6, 4), (5, 6), (5, 4), (6, 5), (4, 6)},
+        ),
+        (
+            {('a', 1), ('b', 2), ('c', 3)},
+            {(('a', 1), ('b', 2)), (('b', 2), ('a', 1)), (('c', 3),
+                                                         ('c', 3))},
+        ),
+        (
+            {'x', 'y', 'z'},
+            {('x', 'y'), ('y', 'z'), ('x', 'z')},
+        ),
+    ],
+)
+@pytest.mark.parametrize("check_func", CHECKS)
+@build_graph()
+def test_compact_matches_graph(
+    graph: DiGraph,
+    domain,
+    relations,
+    check_func,
+) -> None:
+    relation = CompactRelation.from_graph(graph)
+    assert check_func(relation) is check_func(graph)
+
+
+def test_compact_round_trip() -> None:
+    relation = CompactRelation.from_pairs(
+        ['c', 'a'], [('a', 'b'), ('b', 'c'), ('c', 'c'), ('a', 'b')])
+    assert relation.nodes == ('c', 'a', 'b')
+    assert relation.number_of_edges() == 3
+    assert relation.has_edge('a', 'b')
+    assert not relation.has_edge('b', 'a')
+    assert not relation.has_edge('a', 'd')
+    assert list(relation.successor_ids(1)) == [2]
+    assert set(relation.to_graph().edges) == set(relation.to_bits().edges)
+    assert relations_to_str(relation.edges) == '(c, c), (a, b), (b, c), '
@@ -208,3 +208,29 @@ def test_get_not_transitive(graph: DiGraph):
         ((6, 5), (5, 4), (6, 4)),
         ((6, 5), (5, 6), (6, 6)),
     }
+
+
+@pytest.mark.parametrize(
+    "domain,relations",
+    [
+        (
+            {1, 2, 4, 5, 10, 20},
+            {(1, 2), (1, 5), (2, 4), (5, 10), (2, 10), (4, 20), (10, 20)},
+        ),
+        (
+            {'a', 'b', 'c', 'd'},
+            {('a', 'c'), ('a', 'd'), ('b', 'c'), ('b', 'd')},
+        ),
+        (
+            {1, 2, 3},
+            {(1, 2), (2, 1), (2, 3)},
+        ),
+    ],
+)
+@build_graph()
+def test_get_batch(graph: DiGraph, domain, relations) -> None:
+    pairs = [(node_x, node_y) for node_x in domain for node_y in domain]
+    for name in ('cs', 'ci', 'mci', 'mcs'):
+        batch = getattr(extract, f'get_batch_{name}')(graph, iter(pairs))
+        assert batch == {(node_x, node_y): getattr(extract, f'get_{name}')(
+            graph, node_x, node_y) for node_x, node_y in pairs}
@@ -0,0 +1,89 @@
+# pylint:disable=unused-argument
+# type: ignore
+import random
+import pytest
+from networkx.classes.digraph import DiGraph
+from discret_maths.relations import (
+    draw_graph,
+    draw_relation,
+    generate_relations,
+)
+from discret_maths.relations.incremental import IncrementalRelation
+from discret_maths.relations.profile import RelationProfile
+from discret_maths.relations.reachability import ReachabilityIndex
+from discret_maths.relations.transform import get_hasse_edges
+
+PROPERTIES = (
+    'reflexive',
+    'anti_reflexive',
+    'not_reflexive',
+    'symmetric',
+    'anti_symmetric',
+    'not_symmetric',
+    'transitive',
+    'not_transitive',
+    'equivalent',
+    'strict_order',
+    'partial_order',
+    'total_order',
+)
+
+
+def _assert_same(relation: IncrementalRelation) -> None:
+    graph = relation.to_graph()
+    profile = RelationProfile(graph, witnesses=False)
+    for name in PROPERTIES:
+        assert getattr(relation, name) == getattr(profile, name), name
+    assert set(relation.get_hasse_edges()) == set(get_hasse_edges(graph))
+    index = ReachabilityIndex(graph)
+    for node in graph.nodes:
+        assert relation.descendants(node) == index.descendants(node)
+        assert relation.ancestors(node) == index.ancestors(node)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_relation(seed) -> None:
+    generator = random.Random(seed)
+    domain = list(range(6))
+    relation = IncrementalRelation(domain)
+    edges = set()
+    for _ in range(60):
+        edge = (generator.choice(domain), generator.choice(domain))
+        if edge in edges:
+            relation.remove_edge(*edge)
+            edges.remove(edge)
+        else:
+            relation.add_edge(*edge)
+            edges.add(edge)
+        assert set(relation.edges) == edges
+        _assert_same(relation)
+
+
+def test_incremental_relation_order() -> None:
+    domain = {1, 2, 4, 5, 10, 20}
+    relation = IncrementalRelation(
+        domain, generate_relations(domain, lambda x, y: y % x == 0))
+    assert relation.partial_order
+    assert set(relation.get_hasse_edges()) == {(1, 2), (1, 5), (2, 4),
+                                               (2, 10), (5, 10), (4, 20),
+                                               (10, 20)}
+
+    relation.remove_node(10)
+    assert relation.partial_order
+    assert len(relation) == 5
+    assert (5, 20) in relation.get_hasse_edges()
+
+    relation.add_edge(20, 1)
+    assert not relation.anti_symmetric
+    assert not relation.is_acyclic()
+    _assert_same(relation)
+
+
+def test_incremental_relation_unknown_edge() -> None:
+    relation = IncrementalRelation()
+    draw_graph(relation, {1, 2})
+    draw_relation(relation, {(1, 2)})
+    assert relation.anti_reflexive and relation.strict_order
+    with pytest.raises(ValueError):
+        relation.remove_edge(2, 1)
+    assert isinstance(relation.to_graph(), DiGraph)
@@ -0,0 +1,59 @@
+# pylint:disable=unused-argument
+# type: ignore
+import io
+import pytest
+from networkx.classes.digraph import DiGraph
+from discret_maths.relations import draw_relation
+from discret_maths.relations.ingest import (
+    iter_edge_chunks,
+    load_compact,
+    load_relation,
+)
+
+RELATIONS = {(1, 2), (1, 3), (2, 6), (3, 6)}
+
+
+@pytest.mark.parametrize(
+    "name,text,header",
+    [
+        ('relation.csv', 'x,y\n1,2\n1,3\n2,6\n3,6\n', True),
+        ('relation.csv', '1,2\n1,3\n\n2,6\n3,6\n\n', False),
+        ('relation.tsv', '1\t2\n1\t3\n2\t6\n3\t6\n', False),
+        ('relation.tsv', '1\t2\n\n1\t3\n2\t6\n3\t6\n\n', False),
+        ('relation.txt', '# divisibility\n1 2\n1 3\n\n2 6\n3 6\n', False),
+    ],
+)
+def test_load_relation(graph: DiGraph, tmp_path, name, text, header) -> None:
+    path = tmp_path / name
+    path.write_text(text)
+    load_relation(graph, path, header=header, node_type=int, chunk_size=3)
+    assert set(graph.edges) == RELATIONS
+    assert all(not data for _, _, data in graph.edges(data=True))
+    relation = load_compact(str(path), header=header, node_type=int)
+    assert set(relation.edges) == RELATIONS
+
+
+def test_iter_edge_chunks() -> None:
+    streamer = io.StringIO('a b 1\nb c 2\nc a 3\n')
+    chunks = list(iter_edge_chunks(streamer, columns=(1, 2), chunk_size=2))
+    assert chunks == [[('b', '1'), ('c', '2')], [('a', '3')]]
+    with pytest.raises(ValueError):
+        next(iter_edge_chunks(streamer, 'xml'))
+
+
+def test_load_parquet(tmp_path) -> None:
+    pyarrow = pytest.importorskip('pyarrow')
+    parquet = pytest.importorskip('pyarrow.parquet')
+    path = str(tmp_path / 'relation.parquet')
+    parquet.write_table(
+        pyarrow.table({
+            'x': [x for x, _ in sorted(RELATIONS)],
+            'y': [y for _, y in sorted(RELATIONS)],
+        }), path)
+    assert set(load_compact(path, node_type=int).edges) == RELATIONS
+
+
+def test_draw_relation_color(graph: DiGraph) -> None:
+    draw_relation(graph, iter(RELATIONS), inverse=True, color=None)
+    assert set(graph.edges) == {(y, x) for x, y in RELATIONS}
+    assert all(not data for _, _, data in graph.edges(data=True))
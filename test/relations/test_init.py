@@ -1,8 +1,16 @@
 # pylint:disable=unused-argument
 
 from test.relations import build_graph
+import pytest
 from networkx.classes.digraph import DiGraph
-from discret_maths.relations import draw_relation, relations_to_str
+from discret_maths.relations import (
+    draw_divisibility,
+    draw_relation,
+    generate_relations,
+    relations_to_str,
+)
+from discret_maths.relations.transform import to_hasse
+from discret_maths.utils import calculate_dividers
 
 
 @build_graph(
@@ -20,3 +28,25 @@ def test_draw_relations(graph: DiGraph) -> None:
     relations = {(2, 2), (4, 4), (5, 4), (5, 6)}
     draw_relation(graph, relations)
     assert relations == set((x, y) for x, y in graph.edges)
+
+
+@pytest.mark.parametrize("number", [1, 12, 30, 64])
+@pytest.mark.parametrize("hasse", [False, True])
+def test_draw_divisibility(graph: DiGraph, number, hasse) -> None:
+    dividers = calculate_dividers(number)
+    draw_divisibility(graph, number, hasse)
+    relations = set(generate_relations(dividers, lambda x, y: y % x == 0))
+    assert set(graph.nodes) == dividers
+    if hasse:
+        full = DiGraph()
+        draw_divisibility(full, number)
+        relations = set(to_hasse(full).edges)
+    assert set(graph.edges) == relations
+
+
+@pytest.mark.parametrize("number", [0, -4])
+def test_draw_divisibility_not_positive(graph: DiGraph, number) -> None:
+    with pytest.raises(ValueError):
+        draw_divisibility(graph, number)
+    assert not graph
+    assert not graph.graph
@@ -0,0 +1,149 @@
+# pylint:disable=unused-argument
+# type: ignore
+from test.relations import build_graph
+import pytest
+from networkx.classes.digraph import DiGraph
+from discret_maths.relations import (
+    check,
+    draw_divisibility,
+    extract,
+    is_lattice,
+)
+from discret_maths.relations.transform import to_hasse
+from discret_maths.relations.lattice import (
+    DivisibilityAlgebra,
+    LatticeTables,
+    get_algebra,
+    get_divisibility_number,
+)
+
+
+@pytest.mark.parametrize(
+    "node_x,node_y,join,meet",
+    [
+        (1, 2, 2, 1),
+        (4, 10, 20, 2),
+        (4, 5, 20, 1),
+        (2, 5, 10, 1),
+        (10, 10, 10, 10),
+    ],
+)
+@build_graph(
+    domain={1, 2, 4, 5, 10, 20},
+    relations={(1, 2), (1, 5), (2, 4), (5, 10), (2, 10), (4, 20), (10, 20)},
+)
+def test_lattice_tables(graph: DiGraph, node_x, node_y, join, meet) -> None:
+    tables = LatticeTables(graph)
+    assert tables.is_lattice()
+    assert tables.join(node_x, node_y) == join
+    assert tables.meet(node_x, node_y) == meet
+
+
+@build_graph(
+    domain={'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h'},
+    relations=(
+        ('a', 'c'),
+        ('b', 'c'),
+        ('c', 'e'),
+        ('c', 'd'),
+        ('d', 'f'),
+        ('d', 'g'),
+        ('e', 'f'),
+        ('e', 'g'),
+        ('f', 'h'),
+        ('g', 'h'),
+    ),
+)
+def test_lattice_tables_not_lattice(graph: DiGraph) -> None:
+    tables = LatticeTables(graph)
+    assert tables.meet('a', 'b') is None
+    assert tables.join('d', 'e') is None
+    assert tables.meet('d', 'e') == 'c'
+    assert not is_lattice(graph, tables)
+
+
+def test_lattice_tables_cycle() -> None:
+    graph = DiGraph([(1, 2), (2, 1), (2, 3)])
+    tables = LatticeTables(graph)
+    assert not is_lattice(graph)
+    for node_x in graph.nodes:
+        for node_y in graph.nodes:
+            assert tables.join(node_x, node_y) == extract.get_mcs(
+                graph, node_x, node_y)
+            assert tables.meet(node_x, node_y) == extract.get_mci(
+                graph, node_x, node_y)
+    assert not check.is_distributed(graph)
+    assert set(extract.get_complements(graph).values()) == {None}
+
+
+@pytest.mark.parametrize("number", [1, 6, 12, 30, 36, 60])
+@pytest.mark.parametrize("hasse", [False, True])
+def test_divisibility_algebra(graph: DiGraph, number, hasse) -> None:
+    draw_divisibility(graph, number, hasse)
+    untagged = DiGraph(graph.edges)
+    untagged.add_nodes_from(graph.nodes)
+    assert get_divisibility_number(untagged) == number
+
+    algebra = get_algebra(untagged)
+    tables = LatticeTables(untagged)
+    hasse = to_hasse(untagged)
+    assert isinstance(algebra, DivisibilityAlgebra)
+    for node_x in graph.nodes:
+        assert algebra.get_complement(node_x) == extract.get_complement(
+            hasse, node_x, LatticeTables(hasse))
+        for node_y in graph.nodes:
+            assert algebra.join(node_x, node_y) == tables.join(node_x, node_y)
+            assert algebra.meet(node_x, node_y) == tables.meet(node_x, node_y)
+
+    assert check.is_distributed(untagged) is check.is_distributed(
+        untagged, tables)
+    assert check.is_booblean_algebra(hasse) is check.is_booblean_algebra(
+        hasse, LatticeTables(hasse))
+
+
+@pytest.mark.parametrize(
+    "relations",
+    [
+        {(1, 2), (2, 4), (1, 3)},
+        {(1, 2), (1, 3), (2, 6)},
+        {(1, 2), (1, 3), (2, 6), (1, 6)},
+        {(1, 4)},
+        {('a', 'b')},
+    ],
+)
+def test_not_divisibility_algebra(graph: DiGraph, relations) -> None:
+    graph.add_edges_from(relations)
+    assert get_divisibility_number(graph) is None
+
+
+@pytest.mark.parametrize("structural", [False, True])
+@pytest.mark.parametrize(
+    "relations,distributive",
+    [
+        # N5
+        ({('0', 'a'), ('a', 'b'), ('b', '1'), ('0', 'c'), ('c', '1')},
+         False),
+        # M3
+        ({('0', 'a'), ('0', 'b'), ('0', 'c'), ('a', '1'), ('b', '1'),
+          ('c', '1')}, False),
+        # 2 x 3 grid
+        ({('00', '01'), ('01', '02'), ('10', '11'), ('11', '12'),
+          ('00', '10'), ('01', '11'), ('02', '12')}, True),
+    ],
+)
+def test_distributive_counterexample(
+    graph: DiGraph,
+    relations,
+    distributive,
+    structural,
+) -> None:
+    graph.add_edges_from(relations)
+    tables = LatticeTables(graph)
+    witness = extract.get_distributive_counterexample(graph, tables,
+                                                      structural)
+    assert check.is_distributed(graph, tables, structural) is distributive
+    assert (witness is None) is distributive
+    if witness is not None:
+        n_a, n_b, n_c = witness
+        assert tables.meet(n_a, tables.join(n_b, n_c)) != tables.join(
+            tables.meet(n_a, n_b), tables.meet(n_a, n_c))
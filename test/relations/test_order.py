@@ -0,0 +1,72 @@
+# pylint:disable=unused-argument
+# type: ignore
+from test.relations import build_graph
+import pytest
+from networkx.classes.digraph import DiGraph
+from discret_maths.relations import (
+    check,
+    draw_divisibility,
+)
+from discret_maths.relations.order import (
+    get_chains,
+    get_height,
+    get_linear_extension,
+    get_linear_order,
+    get_width,
+)
+
+
+@pytest.mark.parametrize(
+    "domain,relations,order",
+    [
+        (
+            {1, 2, 3},
+            {(1, 1), (2, 2), (3, 3), (1, 2), (2, 3), (1, 3)},
+            [1, 2, 3],
+        ),
+        ({1, 2, 3}, {(3, 2), (2, 1), (3, 1)}, [3, 2, 1]),
+        ({1, 2, 3}, {(1, 2), (2, 3), (3, 1)}, None),
+        ({1, 2, 3}, {(1, 2), (1, 3)}, None),
+        ({1, 2, 3, 4}, {(1, 2), (1, 3), (3, 4), (2, 4), (1, 4), (4, 2)},
+         None),
+    ],
+)
+@build_graph()
+def test_get_linear_order(graph: DiGraph, domain, relations, order) -> None:
+    assert get_linear_order(graph) == order
+    assert check.is_total_order(graph) == (order is not None
+                                           and check.is_reflexive(graph))
+
+
+@pytest.mark.parametrize(
+    "number,height,width",
+    [
+        (1, 1, 1),
+        (8, 4, 1),
+        (12, 4, 2),
+        (30, 4, 3),
+        (36, 5, 3),
+    ],
+)
+def test_order_dimensions(graph: DiGraph, number, height, width) -> None:
+    draw_divisibility(graph, number)
+    extension = get_linear_extension(graph)
+    position = {node: index for index, node in enumerate(extension)}
+    assert all(position[x] <= position[y] for x, y in graph.edges)
+    assert get_height(graph) == height
+    assert get_width(graph) == width
+    chains = get_chains(graph)
+    assert sorted(node for chain in chains for node in chain) == sorted(
+        graph.nodes)
+    assert all(
+        graph.has_edge(x, y) for chain in chains
+        for x, y in zip(chain, chain[1:]))
+
+
+@build_graph(
+    domain={1, 2},
+    relations={(1, 2), (2, 1)},
+)
+def test_get_linear_extension_cycle(graph: DiGraph) -> None:
+    with pytest.raises(ValueError):
+        get_linear_extension(graph)
@@ -0,0 +1,26 @@
+# pylint:disable=unused-argument
+# type: ignore
+from test.relations import build_graph
+import pytest
+from networkx.classes.digraph import DiGraph
+from discret_maths.relations.parallel import get_all_bounds
+
+
+def _as_set(bounds):
+    return set((frozenset(nodes), frozenset(bound)) for nodes, bound in bounds)
+
+
+@pytest.mark.parametrize("kind", ['ci', 'cs', 'mci', 'mcs'])
+@build_graph(
+    domain={1, 2, 4, 5, 10, 20},
+    relations={(1, 2), (1, 5), (2, 4), (5, 10), (2, 10), (4, 20), (10, 20)},
+)
+def test_get_all_bounds(graph: DiGraph, kind) -> None:
+    serial = list(get_all_bounds(graph, kind, workers=1))
+    assert len(serial) == 21
+    assert _as_set(get_all_bounds(graph, kind, 2, 4)) == _as_set(serial)
+
+
+def test_get_all_bounds_unknown(graph: DiGraph) -> None:
+    with pytest.raises(ValueError):
+        list(get_all_bounds(graph, 'sup'))
@@ -0,0 +1,52 @@
+# pylint:disable=unused-argument
+# type: ignore
+
+from test.relations import build_graph
+import pytest
+from networkx.classes.digraph import DiGraph
+from discret_maths.relations import check, extract
+from discret_maths.relations.profile import RelationProfile
+
+
+@pytest.mark.parametrize(
+    "domain,relations",
+    [
+        (
+            {2, 4, 5, 6, 7},
+            {(2, 2), (4, 4), (5, 5), (6, 6), (7, 7)},
+        ),
+        (
+            {2, 4, 5, 6, 7},
+            {(2, 2), (6, 4), (5, 6), (6, 5), (4, 6)},
+        ),
+        (
+            {2, 4, 5, 6, 7},
+            {(2, 2), (4, 4), (5, 4), (5, 6), (6, 5), (4, 5), (4, 6)},
+        ),
+        (
+            {1, 2, 4},
+            {(1, 1), (2, 2), (4, 4), (1, 2), (2, 4), (1, 4)},
+        ),
+        (
+            {1, 2, 4},
+            {(1, 2), (2, 4), (1, 4)},
+        ),
+    ],
+)
+@build_graph()
+def test_profile_matches_checks(
+    graph: DiGraph,
+    domain,
+    relations,
+) -> None:
+    profile = RelationProfile(graph)
+    for name in ('reflexive', 'anti_reflexive', 'not_reflexive', 'symmetric',
+                 'anti_symmetric', 'not_symmetric', 'transitive',
+                 'not_transitive', 'equivalent', 'strict_order',
+                 'partial_order', 'total_order'):
+        assert getattr(profile, name) is getattr(check, f'is_{name}')(graph)
+    for name in ('reflexive', 'symmetric', 'not_symmetric', 'transitive',
+                 'not_transitive'):
+        for strict in (True, False):
+            assert getattr(profile, f'get_{name}')(strict) == getattr(
+                extract, f'get_{name}')(graph, strict)
@@ -0,0 +1,74 @@
+# pylint:disable=unused-argument
+# type: ignore
+import random
+from test.relations import build_graph
+import pytest
+from networkx.classes.digraph import DiGraph
+from discret_maths.relations import check
+from discret_maths.relations.quotient import (
+    DisjointSet,
+    Quotient,
+    get_equivalence_classes,
+    get_equivalence_closure,
+    get_quotient,
+)
+
+
+@build_graph(
+    domain={1, 2, 3, 4, 5},
+    relations={(1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (1, 2), (2, 1),
+               (3, 4), (4, 3)},
+)
+def test_get_quotient(graph: DiGraph) -> None:
+    quotient = get_quotient(graph)
+    assert quotient.is_equivalent
+    assert len(quotient) == 3
+    assert sorted(quotient.sizes.values()) == [1, 2, 2]
+    assert quotient.class_of(3) == {3, 4}
+    assert quotient.representative(1) == quotient.representative(2)
+    assert sorted(map(sorted, get_equivalence_classes(graph))) == [[1, 2],
+                                                                   [3, 4],
+                                                                   [5]]
+
+
+@pytest.mark.parametrize(
+    "relations,classes",
+    [
+        ({(1, 2), (2, 3)}, [{1, 2, 3}]),
+        ({(1, 1), (2, 2), (3, 3), (1, 2)}, [{1, 2}, {3}]),
+        ({(1, 1), (2, 2), (1, 2), (2, 1), (2, 3), (3, 2)}, [{1, 2, 3}]),
+    ],
+)
+def test_equivalence_closure(graph: DiGraph, relations, classes) -> None:
+    graph.add_nodes_from({1, 2, 3})
+    graph.add_edges_from(relations)
+    assert not get_quotient(graph).is_equivalent
+    assert not check.is_equivalent(graph)
+    closure = get_equivalence_closure(graph)
+    assert set(closure.edges) == {(x, y)
+                                  for members in classes for x in members
+                                  for y in members}
+    assert check.is_equivalent(closure)
+    assert set(get_quotient(graph).iter_closure()) == set(closure.edges)
+
+
+def test_quotient_repeated_pairs() -> None:
+    quotient = Quotient(['a', 'b'], [('a', 'a'), ('a', 'a'), ('a', 'b'),
+                                     ('b', 'b')])
+    assert quotient.pairs_count == 3
+    assert not quotient.is_equivalent
+    quotient.add_pair('b', 'a')
+    quotient.add_pair('b', 'a')
+    assert quotient.is_equivalent
+
+
+def test_disjoint_set() -> None:
+    generator = random.Random(0)
+    sets = DisjointSet(range(100))
+    for _ in range(60):
+        sets.union(generator.randrange(100), generator.randrange(100))
+    quotient = Quotient(range(100))
+    for node, root in ((node, sets.find(node)) for node in range(100)):
+        quotient.add_pair(node, root)
+    assert sum(sets.size.values()) == 100
+    assert len(quotient) == len(sets.size)
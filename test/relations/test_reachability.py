@@ -0,0 +1,42 @@
+# pylint:disable=unused-argument
+# type: ignore
+from test.relations import build_graph
+import pytest
+from networkx.classes.digraph import DiGraph
+from discret_maths.relations.reachability import ReachabilityIndex, leq
+
+
+@pytest.mark.parametrize(
+    "node,descendants,ancestors",
+    [
+        (1, {2, 4, 5, 10, 20}, set()),
+        (2, {4, 10, 20}, {1}),
+        (10, {20}, {1, 2, 5}),
+        (20, set(), {1, 2, 4, 5, 10}),
+    ],
+)
+@build_graph(
+    domain={1, 2, 4, 5, 10, 20},
+    relations={(1, 2), (1, 5), (2, 4), (5, 10), (2, 10), (4, 20), (10, 20),
+               (20, 20)},
+)
+def test_reachability(graph: DiGraph, node, descendants, ancestors) -> None:
+    index = ReachabilityIndex(graph)
+    assert index.descendants(node) == descendants
+    assert index.ancestors(node) == ancestors
+    assert leq(graph, node, node)
+    assert all(leq(graph, node, other) for other in descendants)
+    assert not any(leq(graph, node, other) for other in ancestors)
+
+
+@build_graph(
+    domain={'a', 'b', 'c', 'd'},
+    relations={('a', 'b'), ('b', 'c'), ('c', 'a'), ('c', 'd')},
+)
+def test_reachability_cycle(graph: DiGraph) -> None:
+    index = ReachabilityIndex(graph)
+    assert index.descendants('a') == {'b', 'c', 'd'}
+    assert index.ancestors('d') == {'a', 'b', 'c'}
+    assert index.reaches('c', 'b')
+    assert not index.reaches('d', 'a')
+    assert index.is_acyclic() is False
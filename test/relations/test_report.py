@@ -0,0 +1,99 @@
+# pylint:disable=unused-argument
+# type: ignore
+from io import BytesIO, StringIO
+import json
+
+from test.relations import build_graph
+import oyaml as yaml
+import pytest
+from networkx.classes.digraph import DiGraph
+from discret_maths.relations import generate_relations, generate_report
+from discret_maths.relations.compact import CompactRelation
+from discret_maths.relations.report import read_binary_report
+
+DIVIDERS = {1, 2, 4, 5, 10, 20}
+RELATIONS = set(generate_relations(DIVIDERS, lambda x, y: y % x == 0))
+
+
+@build_graph(domain=DIVIDERS, relations=RELATIONS)
+def test_generate_report_yaml(graph: DiGraph) -> None:
+    streamer = StringIO()
+    generate_report(graph, streamer)
+    report = yaml.safe_load(streamer.getvalue())
+    assert report['relations_type']['partial_order'] is True
+    assert report['relented_nodes']['symmetry'] == []
+    assert len(report['relented_nodes']['relations']) == len(RELATIONS)
+    assert report['is_lattice'] is True
+    assert (report['minimum'], report['maximum']) == (1, 20)
+    assert report['complements'][4] == 5
+    assert len(report['upper_bounds']) == 21
+
+
+@build_graph(domain=DIVIDERS, relations=RELATIONS)
+def test_generate_report_json_lines(graph: DiGraph) -> None:
+    streamer = StringIO()
+    generate_report(graph, streamer, 'jsonl')
+    records = [json.loads(line) for line in streamer.getvalue().splitlines()]
+    assert {
+        'section': 'relented_nodes.relations',
+        'count': len(RELATIONS)
+    } in records
+    assert {'section': 'is_distributed', 'value': True} in records
+
+
+@build_graph(domain=DIVIDERS, relations=RELATIONS)
+def test_generate_report_binary(graph: DiGraph) -> None:
+    streamer = BytesIO()
+    generate_report(graph, streamer, 'binary')
+    streamer.seek(0)
+    records = list(read_binary_report(streamer))
+    assert {'section': 'is_lattice', 'value': True} in records
+    assert {
+        'section': 'relented_nodes.relations',
+        'count': len(RELATIONS)
+    } in records
+
+    # the same records as the json lines report, in fewer bytes
+    text = StringIO()
+    generate_report(graph, text, 'jsonl')
+    lines = [json.loads(line) for line in text.getvalue().splitlines()]
+    assert json.loads(json.dumps(records, default=str)) == lines
+    assert len(streamer.getvalue()) < len(text.getvalue().encode()) / 2
+
+    # a record cut short is an error, not a partial report
+    streamer = BytesIO(streamer.getvalue()[:-1])
+    with pytest.raises(ValueError):
+        list(read_binary_report(streamer))
+
+
+def _normalize(report):
+    # the compact rows are sorted, only the order of the lists may differ
+    if isinstance(report, dict):
+        return {key: _normalize(value) for key, value in report.items()}
+    if isinstance(report, list):
+        return sorted(map(str, report))
+    return report
+
+
+@pytest.mark.parametrize(
+    "relations",
+    [RELATIONS, RELATIONS | {(20, 1)}, {(1, 2), (2, 4), (4, 4)}],
+)
+def test_generate_report_compact(monkeypatch, relations) -> None:
+    graph = DiGraph()
+    graph.add_edges_from(relations)
+    expected = StringIO()
+    generate_report(graph, expected)
+
+    # the relation is never turned into a graph as a whole
+    relation = CompactRelation.from_graph(graph)
+    monkeypatch.setattr(CompactRelation, 'to_graph', None)
+    streamer = StringIO()
+    generate_report(relation, streamer)
+    assert _normalize(yaml.safe_load(streamer.getvalue())) == _normalize(
+        yaml.safe_load(expected.getvalue()))
+
+
+def test_generate_report_unknown_format(graph: DiGraph) -> None:
+    with pytest.raises(ValueError):
+        generate_report(graph, StringIO(), 'xml')
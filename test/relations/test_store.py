@@ -0,0 +1,120 @@
+# pylint:disable=unused-argument
+# type: ignore
+import io
+import os
+from test.relations import build_graph
+import pytest
+from networkx.classes.digraph import DiGraph
+from discret_maths.relations import extract
+from discret_maths.relations.cache import clear_cache
+from discret_maths.relations.lattice import (
+    LatticeTables,
+    get_tables,
+)
+from discret_maths.relations.reachability import get_index
+from discret_maths.relations.store import (
+    AnalysisStore,
+    get_content_hash,
+)
+from discret_maths.relations.transform import to_hasse
+
+DOMAIN = {1, 2, 3, 6}
+RELATIONS = {(1, 1), (1, 2), (1, 3), (1, 6), (2, 2), (2, 6), (3, 3), (3, 6),
+             (6, 6)}
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+def test_content_hash() -> None:
+    graph_x = DiGraph()
+    graph_x.add_nodes_from([1, 2, 3])
+    graph_x.add_edges_from([(1, 2), (2, 3)])
+    graph_y = DiGraph()
+    graph_y.add_edges_from([(2, 3), (1, 2)])
+    assert get_content_hash(graph_x) == get_content_hash(graph_y)
+    graph_y.add_edge(1, 3)
+    assert get_content_hash(graph_x) != get_content_hash(graph_y)
+
+
+def test_content_hash_types() -> None:
+    graph_x = DiGraph()
+    graph_x.add_edge(1, 2)
+    graph_y = DiGraph()
+    graph_y.add_edge('1', '2')
+    assert get_content_hash(graph_x) != get_content_hash(graph_y)
+
+    graph_y = DiGraph(algebra='divisibility', number=2)
+    graph_y.add_edge(1, 2)
+    assert get_content_hash(graph_x) != get_content_hash(graph_y)
+
+    graph_y = DiGraph()
+    graph_y.add_edge(1, (1, 2))
+    with pytest.raises(ValueError):
+        get_content_hash(graph_y)
+
+
+@build_graph(domain=DOMAIN, relations=RELATIONS)
+def test_round_trip(graph: DiGraph, tmp_path) -> None:
+    store = AnalysisStore(str(tmp_path))
+    index = store.get_index(graph)
+    tables = store.get_tables(graph)
+    hasse_graph = store.to_hasse(graph)
+
+    # a second store reads back what the first one wrote
+    clear_cache()
+    store = AnalysisStore(str(tmp_path))
+    loaded = store.get_index(graph)
+    folder = os.path.join(store.root, get_content_hash(graph))
+    assert not [name for name in os.listdir(folder) if 'pickle' in name]
+    assert loaded.nodes == index.nodes
+    assert loaded.descendants_bits == index.descendants_bits
+    assert loaded.ancestors_bits == index.ancestors_bits
+    loaded_tables = store.get_tables(graph)
+    assert [list(row) for row in loaded_tables.joins] == [
+        list(row) for row in tables.joins
+    ]
+    assert [list(row) for row in loaded_tables.meets] == [
+        list(row) for row in tables.meets
+    ]
+    assert set(store.to_hasse(graph).edges) == set(hasse_graph.edges)
+    assert set(hasse_graph.edges) == set(to_hasse(graph).edges)
+
+    # the in memory cache is primed with the loaded analyses
+    assert get_index(graph) is loaded
+    assert get_tables(graph) is loaded_tables
+    assert isinstance(loaded_tables, LatticeTables)
+    assert extract.get_mcs(graph, 2, 3) == 6
+
+
+@build_graph(domain=DOMAIN, relations=RELATIONS)
+def test_report(graph: DiGraph, tmp_path) -> None:
+    store = AnalysisStore(str(tmp_path))
+    output = str(tmp_path / 'report.yaml')
+    store.generate_report(graph, output)
+    with open(output) as streamer:
+        expected = streamer.read()
+    streamer = io.StringIO()
+    store.generate_report(graph, streamer)
+    assert streamer.getvalue() == expected
+    with pytest.raises(ValueError):
+        store.generate_report(graph, streamer, 'csv')
+
+
+def test_evict(tmp_path) -> None:
+    store = AnalysisStore(str(tmp_path / 'store'), max_bytes=0)
+    graphs = []
+    for size in range(2, 5):
+        graph = DiGraph()
+        graph.add_edges_from((x, y) for x in range(size)
+                             for y in range(x, size))
+        graphs.append(graph)
+        store.get_tables(graph)
+    # the entry just written always stays
+    assert os.listdir(store.root) == [get_content_hash(graphs[-1])]
+    store.clear()
+    assert store.get_size() == 0
@@ -0,0 +1,52 @@
+# pylint:disable=unused-argument
+# type: ignore
+from test.relations import build_graph
+from networkx.classes.digraph import DiGraph
+from discret_maths.relations import generate_relations
+from discret_maths.relations.transform import to_hasse
+
+DIVIDERS = {1, 2, 4, 5, 10, 20}
+
+
+@build_graph(
+    domain=DIVIDERS,
+    relations=set(generate_relations(DIVIDERS, lambda x, y: y % x == 0)),
+)
+def test_to_hasse(graph: DiGraph) -> None:
+    covers = {(1, 2), (1, 5), (2, 4), (5, 10), (2, 10), (4, 20), (10, 20)}
+    hasse = to_hasse(graph)
+    assert set(hasse.edges) == covers
+    assert list(hasse.nodes) == list(graph.nodes)
+    assert graph.number_of_edges() == 18
+
+
+@build_graph(
+    domain={1, 2, 3, 4},
+    relations={(1, 2), (2, 3), (3, 4), (1, 3), (2, 4), (1, 4)},
+)
+def test_to_hasse_long_path(graph: DiGraph) -> None:
+    view = to_hasse(graph, as_view=True)
+    assert set(view.edges) == {(1, 2), (2, 3), (3, 4)}
+    assert graph.has_edge(1, 4)
+
+
+@build_graph(
+    domain={'a', 'b', 'c'},
+    relations={('a', 'b'), ('b', 'a'), ('b', 'c'), ('a', 'c'), ('a', 'a'),
+               ('b', 'b')},
+)
+def test_to_hasse_cycle(graph: DiGraph) -> None:
+    # c has no loop, the relation is not reflexive and keeps its loops
+    assert set(to_hasse(graph).edges) == {('a', 'b'), ('b', 'a'), ('a', 'a'),
+                                          ('b', 'b')}
+
+
+@build_graph(
+    domain={1, 2, 3},
+    relations={(1, 1), (2, 2), (1, 2), (2, 3)},
+)
+def test_to_hasse_not_transitive(graph: DiGraph) -> None:
+    # nothing is transitive nor reflexive, every edge stays
+    assert set(to_hasse(graph).edges) == set(graph.edges)
+    graph.add_edges_from([(1, 3), (3, 3)])
+    assert set(to_hasse(graph).edges) == {(1, 2), (2, 3)}
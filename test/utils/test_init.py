@@ -0,0 +1,71 @@
+# type: ignore
+import pytest
+from discret_maths.utils import (
+    calculate_all_dividers,
+    calculate_dividers,
+    chunk_set_combination,
+    factorize,
+    get_set_combination,
+    get_smallest_prime_factors,
+    iter_set_combination,
+)
+
+
+@pytest.mark.parametrize(
+    "kwargs,result",
+    [
+        ({}, {(1, 1), (1, 2), (2, 1), (2, 2)}),
+        ({'diagonal': False}, {(1, 2), (2, 1)}),
+        ({'unordered': True}, {(1, 1), (1, 2), (2, 2)}),
+        ({'unordered': True, 'diagonal': False}, {(1, 2)}),
+        ({'image': [3]}, {(1, 3), (2, 3)}),
+    ],
+)
+def test_iter_set_combination(kwargs, result) -> None:
+    pairs = list(iter_set_combination([1, 2], **kwargs))
+    assert len(pairs) == len(result)
+    assert set(pairs) == result
+
+
+def test_iter_set_combination_generator() -> None:
+    pairs = set(iter_set_combination(node for node in [1, 2]))
+    assert pairs == {(1, 1), (1, 2), (2, 1), (2, 2)}
+
+
+def test_iter_set_combination_unordered_image() -> None:
+    with pytest.raises(ValueError):
+        iter_set_combination([1, 2], [3], unordered=True)
+
+
+def test_chunk_set_combination() -> None:
+    chunks = list(chunk_set_combination(range(3), size=4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 1]
+
+
+def test_get_set_combination() -> None:
+    assert get_set_combination({1, 2}, {3}) == {(1, 3), (2, 3)}
+
+
+@pytest.mark.parametrize("number", [-6, 0, 1, 2, 12, 97, 360, 1001])
+def test_calculate_dividers(number) -> None:
+    assert calculate_dividers(number) == {
+        divider
+        for divider in range(1, number + 1) if number % divider == 0
+    }
+
+
+def test_calculate_all_dividers() -> None:
+    dividers = calculate_all_dividers(60)
+    assert len(dividers) == 60
+    assert all(dividers[number] == calculate_dividers(number)
+               for number in dividers)
+    assert calculate_all_dividers(1) == {1: {1}}
+    for limit in (0, -1):
+        with pytest.raises(ValueError):
+            calculate_all_dividers(limit)
+
+
+def test_factorize() -> None:
+    spf = get_smallest_prime_factors(100)
+    assert factorize(360) == factorize(360, spf) == {2: 3, 3: 2, 5: 1}
+    assert factorize(2 * 101, spf) == {2: 1, 101: 1}
@@ -0,0 +1,51 @@
+# type: ignore
+import logging
+from networkx.classes.digraph import DiGraph
+from discret_maths.relations import extract
+from discret_maths.relations.cache import clear_cache
+from discret_maths.utils.logger import (
+    LOGGER,
+    aggregated_logs,
+    get_logger,
+    log,
+    set_level,
+)
+
+
+def test_logger_without_side_effects() -> None:
+    assert LOGGER.level == logging.NOTSET
+    assert all(
+        isinstance(handler, logging.NullHandler)
+        for handler in LOGGER.handlers)
+    assert get_logger('discret_maths.relations.extract').name == (
+        'relationalship.extract')
+
+
+def test_aggregated_logs(caplog) -> None:
+    logger = get_logger('test')
+    caplog.set_level(logging.INFO, logger=LOGGER.name)
+    with aggregated_logs():
+        for node in range(3):
+            log(logger, logging.WARNING, 'nodes were odd', 'node %s', node)
+        with aggregated_logs():
+            log(logger, logging.WARNING, 'nodes were odd', 'node %s', 3)
+    log(logger, logging.WARNING, 'nodes were odd', 'node %s', 4)
+    assert [record.getMessage() for record in caplog.records] == [
+        '4 nodes were odd',
+        'node 4',
+    ]
+
+
+def test_module_level(caplog, graph: DiGraph) -> None:
+    clear_cache()
+    caplog.set_level(logging.INFO, logger=LOGGER.name)
+    graph.add_edges_from({(1, 2), (1, 3)})
+    set_level(logging.ERROR, 'extract')
+    try:
+        assert extract.get_mcs(graph, 2, 3) is None
+        assert not caplog.records
+    finally:
+        set_level(logging.NOTSET, 'extract')
+    clear_cache()
+    assert extract.get_mcs(graph, 2, 3) is None
+    assert len(caplog.records) == 1
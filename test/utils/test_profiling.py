@@ -0,0 +1,71 @@
+# type: ignore
+import io
+import json
+import pytest
+from networkx.classes.digraph import DiGraph
+from discret_maths.relations import generate_report
+from discret_maths.relations.cache import clear_cache
+from discret_maths.utils.profiling import (
+    count,
+    get_profile,
+    instrument,
+    is_enabled,
+    profiling,
+)
+
+
+@instrument
+def _double(values):
+    return values * 2
+
+
+def test_profiling_disabled() -> None:
+    assert get_profile() is None
+    count('ignored')
+    assert _double([1]) == [1, 1]
+    assert get_profile() is None
+
+
+def test_profiling() -> None:
+    with profiling() as profile:
+        assert _double([1, 2]) == [1, 2, 1, 2]
+        _double([])
+        count('steps', 3)
+    assert get_profile() is None
+    stats = profile.stats['test_profiling._double']
+    assert (stats.calls, stats.size, stats.depth) == (2, 4, 1)
+    assert profile.counters == {'steps': 3}
+
+    streamer = io.StringIO()
+    profile.write_chrome_trace(streamer)
+    events = json.loads(streamer.getvalue())['traceEvents']
+    assert [event['ph'] for event in events] == ['X', 'X']
+    assert 'test_profiling._double' in profile.get_summary()
+
+
+@pytest.mark.parametrize(
+    "value,enabled",
+    [(None, False), ('', False), ('0', False), ('False', False),
+     ('off', False), ('1', True), ('trace.json', True)],
+)
+def test_is_enabled(value, enabled) -> None:
+    assert is_enabled(value) == enabled
+
+
+def test_profiling_max_events() -> None:
+    with profiling(max_events=2) as profile:
+        for _ in range(5):
+            _double([1])
+    assert len(profile.events) == 2
+    assert profile.counters['dropped_trace_events'] == 3
+    assert profile.stats['test_profiling._double'].calls == 5
+
+
+def test_profiling_report(graph: DiGraph) -> None:
+    clear_cache()
+    graph.add_edges_from({(1, 2), (2, 3), (1, 3)})
+    with profiling() as profile:
+        generate_report(graph, io.StringIO())
+    assert profile.counters['reachability_index'] >= 1
+    assert profile.stats['transform.to_hasse'].calls == 1
+    assert profile.stats['check.is_bounded'].calls >= 1